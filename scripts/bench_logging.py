@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк пропускной способности логирования под нагрузкой.
+
+Сравнивает прежнюю схему (у каждого именованного логгера свои StreamHandler
+и FileHandler на общий файл) с конвейером QueueHandler/QueueListener.
+Нагрузка создается несколькими корутинами в одном цикле событий - как
+обработчики бота. Для каждой схемы выводится время, проведенное в вызовах
+логгера (задержка для цикла событий), и полное время до записи всех
+сообщений на диск.
+"""
+import argparse
+import asyncio
+import logging
+import logging.handlers
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Добавляем корневую директорию проекта в PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.utils import logger as logger_module
+
+FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def legacy_loggers(count: int, log_file: Path, stream) -> list:
+    """Логгеры, настроенные прежним способом."""
+    formatter = logging.Formatter(FORMAT)
+    loggers = []
+    for i in range(count):
+        logger = logging.getLogger(f"bench.legacy.{i}")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        console_handler = logging.StreamHandler(stream)
+        console_handler.setFormatter(formatter)
+        file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+        file_handler.setFormatter(formatter)
+        logger.addHandler(console_handler)
+        logger.addHandler(file_handler)
+        loggers.append(logger)
+    return loggers
+
+
+def queue_loggers(count: int, log_file: Path, stream, json_output: bool) -> list:
+    """Логгеры, пишущие через конвейер с очередью."""
+    logger_module.shutdown_logging()
+    settings = dict(logger_module.DEFAULT_SETTINGS, file=str(log_file), json=json_output)
+    listener = logger_module.configure_logging(settings)
+    listener.handlers[0].setStream(stream)
+    loggers = []
+    for i in range(count):
+        logger = logging.getLogger(f"bench.queue.{i}")
+        logger.setLevel(logging.INFO)
+        loggers.append(logger)
+    return loggers
+
+
+async def produce(logger: logging.Logger, messages: int) -> float:
+    """Корутина, пишущая сообщения в лог; возвращает время в вызовах логгера."""
+    spent = 0.0
+    for i in range(messages):
+        start = time.perf_counter()
+        logger.info("Обработано сообщение %d пользователя %d", i, 42)
+        spent += time.perf_counter() - start
+        if i % 100 == 0:
+            await asyncio.sleep(0)
+    return spent
+
+
+async def run(loggers: list, messages: int) -> float:
+    """Запуск нагрузки; возвращает суммарное время в вызовах логгера."""
+    spent = await asyncio.gather(*(produce(logger, messages) for logger in loggers))
+    return sum(spent)
+
+
+def report(name: str, total: int, spent: float, elapsed: float) -> None:
+    """Вывод результата замера."""
+    print(
+        f"{name:<14} {total / elapsed:12,.0f} сообщ./с   "
+        f"{spent / total * 1e6:8.2f} мкс/вызов в цикле событий   "
+        f"всего {elapsed:6.2f} с"
+    )
+
+
+def main():
+    """Основная функция скрипта."""
+    parser = argparse.ArgumentParser(description='Бенчмарк логирования')
+    parser.add_argument('--loggers', type=int, default=20, help='Количество именованных логгеров')
+    parser.add_argument('--messages', type=int, default=5000, help='Сообщений на логгер')
+    args = parser.parse_args()
+
+    total = args.loggers * args.messages
+    print(f"Логгеров: {args.loggers}, сообщений: {total}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir, open(os.devnull, 'w') as devnull:
+        log_file = Path(tmp_dir) / "legacy.log"
+        loggers = legacy_loggers(args.loggers, log_file, devnull)
+        start = time.perf_counter()
+        spent = asyncio.run(run(loggers, args.messages))
+        elapsed = time.perf_counter() - start
+        for logger in loggers:
+            for handler in logger.handlers:
+                handler.close()
+        report("FileHandler", total, spent, elapsed)
+
+        for json_output in (False, True):
+            log_file = Path(tmp_dir) / f"queue-{json_output}.log"
+            loggers = queue_loggers(args.loggers, log_file, devnull, json_output)
+            start = time.perf_counter()
+            spent = asyncio.run(run(loggers, args.messages))
+            # Ждем, пока поток-писатель запишет очередь на диск
+            logger_module.shutdown_logging()
+            elapsed = time.perf_counter() - start
+            report("Queue+JSON" if json_output else "Queue", total, spent, elapsed)
+
+
+if __name__ == '__main__':
+    main()
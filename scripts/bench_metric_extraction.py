@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк извлечения метрик из ноутбуков.
+
+Сравнивает прежнюю реализацию (split по трем жестко заданным именам
+в каждой ячейке) с однопроходным извлекателем по реестру метрик
+(регулярное выражение и вариант с AST) на сгенерированном большом
+ноутбуке. Прежняя реализация смотрит только код ячеек, новая - также
+текстовые выводы.
+"""
+import argparse
+import contextlib
+import sys
+import timeit
+from pathlib import Path
+
+# Добавляем корневую директорию проекта в PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import nbformat
+
+from src.core.learning.metric_extractor import MetricExtractor
+
+
+def legacy_extract(cells):
+    """Извлечение метрик прежним способом."""
+    metrics = {}
+    for cell in cells:
+        if cell.get('cell_type') == 'code':
+            source = ''.join(cell.get('source', []))
+            if 'accuracy' in source:
+                with contextlib.suppress(Exception):
+                    metrics['accuracy'] = float(source.split('accuracy')[1].split('=')[1].split()[0])
+            if 'f1' in source:
+                with contextlib.suppress(Exception):
+                    metrics['f1'] = float(source.split('f1')[1].split('=')[1].split()[0])
+            if 'loss' in source:
+                with contextlib.suppress(Exception):
+                    metrics['loss'] = float(source.split('loss')[1].split('=')[1].split()[0])
+    return metrics
+
+
+def generate_cells(count: int, lines: int, outputs: bool = True) -> list:
+    """Ячейки кода с метриками в коде и (опционально) выводах."""
+    body = '\n'.join(f"x_{j} = transform(df['feature_{j}'])" for j in range(lines))
+    cells = []
+    for i in range(count):
+        cells.append(nbformat.v4.new_markdown_cell(f"## Эксперимент {i}"))
+        cells.append(nbformat.v4.new_code_cell(
+            f"{body}\naccuracy = 0.{i % 100:02d}\nloss = {i / count:.4f}",
+            outputs=[nbformat.v4.new_output(
+                'stream', name='stdout',
+                text=''.join(f"Epoch {e} - loss: 0.{e:03d} - val_auc: 0.8{e}\n" for e in range(10))
+            )] if outputs else []
+        ))
+    return cells
+
+
+def report(name, number, seconds):
+    """Вывод результата замера."""
+    print(f"{name:<28} {seconds / number * 1e3:10.2f} мс/ноутбук")
+
+
+def main():
+    """Основная функция скрипта."""
+    parser = argparse.ArgumentParser(description='Бенчмарк извлечения метрик')
+    parser.add_argument('--cells', type=int, default=2000, help='Количество ячеек кода')
+    parser.add_argument('--lines', type=int, default=30, help='Строк кода в ячейке')
+    parser.add_argument('--number', type=int, default=5, help='Количество повторов')
+    args = parser.parse_args()
+
+    regex = MetricExtractor()
+    with_ast = MetricExtractor(use_ast=True)
+    print(f"Ячеек кода: {args.cells}, строк в ячейке: {args.lines}")
+
+    for title, outputs in (('только код', False), ('код и выводы', True)):
+        cells = generate_cells(args.cells, args.lines, outputs=outputs)
+        print(f"\n{title}")
+        print(f"  прежний способ: {legacy_extract(cells)}")
+        print(f"  новый способ:   {regex.extract_dict(cells)}")
+        report('legacy split', args.number,
+               timeit.timeit(lambda: legacy_extract(cells), number=args.number))
+        report('compiled regex', args.number,
+               timeit.timeit(lambda: regex.extract(cells), number=args.number))
+        report('compiled regex + AST', args.number,
+               timeit.timeit(lambda: with_ast.extract(cells), number=args.number))
+
+
+if __name__ == '__main__':
+    main()
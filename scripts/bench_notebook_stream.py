@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк чтения ноутбуков с тяжелыми выводами.
+
+Генерирует ноутбук с картинками в выводах ячеек (по умолчанию 120 МБ)
+и сравнивает nbformat.read с потоковым чтением на двух сценариях:
+сводка из markdown-ячеек и извлечение кода для метрик. Для каждого
+сценария выводится время и пиковый объем памяти Python (tracemalloc).
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Добавляем корневую директорию проекта в PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import nbformat
+
+from src.core.learning.notebook_stream import NotebookStream
+
+
+def generate_notebook(path: Path, size_mb: int, image_kb: int) -> None:
+    """Ноутбук с картинками суммарным объемом size_mb."""
+    image = nbformat.v4.new_output(
+        'display_data',
+        data={'image/png': 'iVBORw0KGgo' * (image_kb * 1024 // 11), 'text/plain': '<Figure>'}
+    )
+    notebook = nbformat.v4.new_notebook()
+    for i in range(max(1, size_mb * 1024 // image_kb)):
+        notebook.cells.append(nbformat.v4.new_markdown_cell(f"## Шаг {i}\nОписание эксперимента {i}"))
+        notebook.cells.append(nbformat.v4.new_code_cell(
+            f"accuracy = 0.{i % 100:02d}\nplt.plot(x, y)",
+            outputs=[image]
+        ))
+    nbformat.write(notebook, str(path))
+
+
+def summary(cells) -> str:
+    """Сводка из markdown-ячеек (как NotebookParser._generate_summary)."""
+    return '\n'.join(''.join(c.get('source', [])) for c in cells if c.get('cell_type') == 'markdown')
+
+
+def code(cells) -> list:
+    """Код ячеек (как NotebookParser._extract_code)."""
+    return [''.join(c.get('source', [])) for c in cells if c.get('cell_type') == 'code']
+
+
+def measure(name: str, func) -> None:
+    """Замер времени и пиковой памяти."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<28} {elapsed:8.2f} с {peak / 2 ** 20:10.1f} МБ")
+
+
+def main():
+    """Основная функция скрипта."""
+    parser = argparse.ArgumentParser(description='Бенчмарк потокового чтения ноутбуков')
+    parser.add_argument('--size-mb', type=int, default=120, help='Объем картинок в ноутбуке (МБ)')
+    parser.add_argument('--image-kb', type=int, default=512, help='Размер одной картинки (КБ)')
+    parser.add_argument('--notebook', type=Path, help='Существующий ноутбук вместо сгенерированного')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = args.notebook
+        if path is None:
+            path = Path(tmp_dir) / 'bench.ipynb'
+            generate_notebook(path, args.size_mb, args.image_kb)
+        print(f"Ноутбук: {path.stat().st_size / 2 ** 20:.1f} МБ")
+
+        measure('summary: nbformat.read',
+                lambda: summary(nbformat.read(str(path), as_version=4).cells))
+        measure('summary: stream',
+                lambda: summary(NotebookStream(path).cells(cell_types={'markdown'})))
+        measure('code: nbformat.read',
+                lambda: code(nbformat.read(str(path), as_version=4).cells))
+        measure('code: stream',
+                lambda: code(NotebookStream(path).cells(cell_types={'code'})))
+        measure('plots: stream (lazy)',
+                lambda: [o['data']['image/png'].length
+                         for c in NotebookStream(path).cells(cell_types={'code'}, outputs=True)
+                         for o in c['outputs'] if 'image/png' in o.get('data', {})])
+
+
+if __name__ == '__main__':
+    main()
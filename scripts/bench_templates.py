@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Микро-бенчмарк рендеринга шаблонов.
+
+Сравнивает прежний подход (str.format на сырых строках и конкатенация
+по темам) с движком шаблонов на двух сценариях: список тем для голосования
+и вечерний пост.
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+# Добавляем корневую директорию проекта в PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.utils.templates import TemplateEngine
+
+LEGACY_VOTE = "Темы для голосования:\n{topics}"
+LEGACY_VOTE_TOPIC = "{title}\nГолосов: {votes}\nВаш голос: {user_vote}"
+LEGACY_EVENING = """
+🌙 Добрый вечер, Data Scientists!
+
+📊 Итоги дня:
+{summary}
+
+🏆 Достижения:
+{achievements}
+
+Спасибо за продуктивный день! До завтра! 👋
+
+#DataScience #Kaggle #Progress
+"""
+
+
+def legacy_vote(topics):
+    """Рендеринг списка тем прежним способом."""
+    topics_text = []
+    for topic in topics:
+        topics_text.append(LEGACY_VOTE_TOPIC.format(
+            title=topic.get('title', 'Без названия'),
+            votes=topic.get('votes', 0),
+            user_vote=topic.get('user_vote', 'Нет')
+        ))
+    return LEGACY_VOTE.format(topics='\n\n'.join(topics_text))
+
+
+def legacy_evening(summary, achievements):
+    """Рендеринг вечернего поста прежним способом."""
+    return LEGACY_EVENING.format(summary=summary, achievements=achievements)
+
+
+def report(name, number, seconds):
+    """Вывод результата замера."""
+    print(f"{name:<32} {seconds / number * 1e6:10.2f} мкс/рендер")
+
+
+def main():
+    """Основная функция скрипта."""
+    parser = argparse.ArgumentParser(description='Бенчмарк рендеринга шаблонов')
+    parser.add_argument('--number', type=int, default=20000, help='Количество рендеров')
+    parser.add_argument('--topics', type=int, default=20, help='Количество тем в списке')
+    parser.add_argument('--notebooks', type=int, default=10, help='Количество ноутбуков в посте')
+    args = parser.parse_args()
+
+    engine = TemplateEngine(cache_dir=None, auto_reload=False)
+
+    topics = [
+        {'title': f'Тема {i}', 'votes': i * 3, 'user_vote': 'up' if i % 2 else 'Нет'}
+        for i in range(args.topics)
+    ]
+    notebooks = [
+        {'name': f'notebook_{i}', 'summary': f'# Эксперимент {i}\naccuracy < 0.9 & loss > 0.1'}
+        for i in range(args.notebooks)
+    ]
+    summary = '\n\n'.join(f"📊 {nb['name']}:\n{nb['summary']}" for nb in notebooks)
+    achievements = "1. Изучена новая тема\n2. Выполнено практическое задание"
+
+    print(f"Тем: {args.topics}, ноутбуков: {args.notebooks}, рендеров: {args.number}")
+    report('vote: str.format', args.number,
+           timeit.timeit(lambda: legacy_vote(topics), number=args.number))
+    report('vote: template engine', args.number,
+           timeit.timeit(lambda: engine.render('messages/vote.txt', topics=topics),
+                         number=args.number))
+    report('evening: str.format', args.number,
+           timeit.timeit(lambda: legacy_evening(summary, achievements), number=args.number))
+    report('evening: template engine', args.number,
+           timeit.timeit(lambda: engine.render('posts/evening.html', summary=summary,
+                                               achievements=achievements),
+                         number=args.number))
+    report('evening: template engine (loop)', args.number,
+           timeit.timeit(lambda: engine.render('posts/evening.html', notebooks=notebooks,
+                                               achievements=achievements),
+                         number=args.number))
+
+
+if __name__ == '__main__':
+    main()
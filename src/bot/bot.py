@@ -1,6 +1,7 @@
 """
 Модуль для работы с Telegram ботом.
 """
+from typing import Optional
 from telegram import Update
 from telegram.ext import Application, CommandHandler, CallbackContext, MessageHandler, filters
 from src.config.config import get_config
@@ -8,12 +9,21 @@ from src.utils.database.db_manager import DatabaseManager
 from src.utils.logger import setup_logger
 from src.bot.handlers.command_handlers import CommandHandlers, setup_command_handlers
 from src.bot.handlers.message_handlers import setup_message_handlers
+from src.bot.handlers.admin_handlers import setup_admin_handlers
 from src.core.learning.notebook_parser import NotebookParser
+from src.core.learning.notebook_index import NotebookIndex
+from src.core.learning.notebook_tracker import NotebookTracker
 from src.core.competition.competition_manager import CompetitionManager
 from src.ui.messages.message_manager import MessageManager
 from src.ui.keyboards.keyboard_manager import KeyboardManager
 from src.core.posts.post_manager import PostManager
+from src.core.posts.post_queue import PostQueue
+from src.core.posts.post_scheduler import PostScheduler
+from src.core.posts.evening_draft import EveningDraft
 from src.utils.mlflow_manager import MLflowManager
+from src.utils.message_splitter import split_message
+from src.utils.loop_monitor import get_loop_monitor
+from src.utils.profiling import get_profiler
 import asyncio
 
 # Инициализация логгера
@@ -25,33 +35,74 @@ post_manager = PostManager()
 notebook_parser = NotebookParser()
 mlflow_manager = MLflowManager()
 
+# Индекс ноутбуков избавляет от обхода каталога при каждом запросе
+notebook_index = NotebookIndex(config.NOTEBOOKS_DIR)
+notebook_parser.use_index(notebook_index)
+
+# Метрики ноутбуков пишутся в MLflow пачками, отдельно от разбора
+notebook_tracker = NotebookTracker()
+
+# Черновик вечернего поста готовится в течение дня
+evening_draft = EveningDraft(
+    notebook_parser,
+    post_manager,
+    config.NOTEBOOKS_DIR,
+    achievements="1. Изучена новая тема\n2. Выполнено практическое задание\n3. Подготовлен отчет",
+    notebook_index=notebook_index,
+    tracker=notebook_tracker
+)
+
 async def handle_error(update: Update, context: CallbackContext) -> None:
     """Обработчик ошибок."""
     logger.error(f"Произошла ошибка: {context.error}")
     if update and update.message:
         await update.message.reply_text("Произошла ошибка. Попробуйте позже.")
 
+async def send_long_message(bot, chat_id, text: str, parse_mode: Optional[str] = None) -> None:
+    """Отправка сообщения, разбитого на части по лимиту Telegram."""
+    for part in split_message(text, html=parse_mode == 'HTML'):
+        await bot.send_message(chat_id=chat_id, text=part, parse_mode=parse_mode)
+
+async def build_morning_post() -> str:
+    """Формирование утреннего поста."""
+    # Получаем план на день
+    plan = "1. Изучение новых тем\n2. Практические задания\n3. Обзор результатов"
+    
+    # Получаем цели
+    goals = "1. Изучить новую тему\n2. Выполнить практическое задание\n3. Подготовить отчет"
+    
+    # Генерируем пост
+    return await post_manager.generate_morning_post(plan, goals)
+
+async def build_evening_post() -> str:
+    """Формирование вечернего поста из заранее подготовленного черновика."""
+    return await evening_draft.get_post()
+
+# Формирование текста ежедневных постов по типу поста в очереди
+DAILY_POST_BUILDERS = {
+    'morning': build_morning_post,
+    'evening': build_evening_post,
+}
+
+async def publish_post(bot, post: dict) -> None:
+    """Публикация поста из очереди отложенных постов."""
+    text = post['text']
+    if text is None:
+        # Текст ежедневных постов формируется в момент публикации
+        text = await DAILY_POST_BUILDERS[post['post_type']]()
+    await send_long_message(bot, post['chat_id'], text, parse_mode=post['parse_mode'])
+
 async def send_morning_post(context: CallbackContext) -> None:
     """Отправка утреннего поста."""
     try:
         # Начинаем новый запуск в MLflow
         mlflow_manager.start_run(run_name="morning_post")
 
-        # Получаем план на день
-        plan = "1. Изучение новых тем\n2. Практические задания\n3. Обзор результатов"
-        
-        # Получаем цели
-        goals = "1. Изучить новую тему\n2. Выполнить практическое задание\n3. Подготовить отчет"
-        
         # Генерируем пост
-        post = await post_manager.generate_morning_post(plan, goals)
+        post = await build_morning_post()
 
-        # Отправляем пост
-        await context.bot.send_message(
-            chat_id=config.TELEGRAM_CHANNEL_ID,
-            text=post,
-            parse_mode='HTML'
-        )
+        # Отправляем пост (частями, если он превышает лимит Telegram)
+        await send_long_message(context.bot, config.TELEGRAM_CHANNEL_ID, post, parse_mode='HTML')
 
         # Логируем метрики
         mlflow_manager.log_metrics({
@@ -73,21 +124,11 @@ async def send_evening_post(context: CallbackContext) -> None:
         # Начинаем новый запуск в MLflow
         mlflow_manager.start_run(run_name="evening_post")
 
-        # Получаем сводку за день
-        summary = await notebook_parser.get_today_summary()
-        
-        # Получаем достижения
-        achievements = "1. Изучена новая тема\n2. Выполнено практическое задание\n3. Подготовлен отчет"
-        
         # Генерируем пост
-        post = await post_manager.generate_evening_post(summary, achievements)
+        post = await build_evening_post()
 
-        # Отправляем пост
-        await context.bot.send_message(
-            chat_id=config.TELEGRAM_CHANNEL_ID,
-            text=post,
-            parse_mode='HTML'
-        )
+        # Отправляем пост (частями, если он превышает лимит Telegram)
+        await send_long_message(context.bot, config.TELEGRAM_CHANNEL_ID, post, parse_mode='HTML')
 
         # Логируем метрики
         mlflow_manager.log_metrics({
@@ -120,6 +161,9 @@ async def send_feedback_reminder(context: CallbackContext) -> None:
 async def main(managers: dict):
     """Основная функция запуска бота"""
     application = None
+    command_metrics = None
+    loop_monitor = None
+    post_queue = None
     try:
         # Создаем приложение
         token = managers["config"].TELEGRAM_BOT_TOKEN
@@ -128,10 +172,21 @@ async def main(managers: dict):
         # Сохраняем менеджеры в данных бота
         application.bot_data.update(managers)
         
+        # Метрики команд сохраняются в базу данных фоновой задачей
+        command_metrics = managers.get("command_metrics")
+        
         # Создаем менеджеры сообщений и клавиатур
         message_manager = MessageManager()
         keyboard_manager = KeyboardManager()
         
+        # Настраиваем административные команды
+        profiler = get_profiler()
+        profiler.configure(
+            sample_rate=managers["config"].PROFILE_SAMPLE_RATE,
+            commands=managers["config"].PROFILE_COMMANDS
+        )
+        setup_admin_handlers(application, managers["config"].TELEGRAM_ADMIN_IDS, profiler)
+        
         # Настраиваем обработчики команд
         setup_command_handlers(
             application,
@@ -140,14 +195,16 @@ async def main(managers: dict):
             managers["competition_manager"],
             managers["vote_manager"],
             message_manager,
-            keyboard_manager
+            keyboard_manager,
+            command_metrics=command_metrics
         )
         
         # Настраиваем обработчики сообщений
         setup_message_handlers(
             application,
             managers["db_manager"],
-            managers["notebook_parser"]
+            managers["notebook_parser"],
+            command_metrics=command_metrics
         )
         
         # Добавляем обработчик ошибок
@@ -156,6 +213,34 @@ async def main(managers: dict):
         # Запускаем бота
         await application.initialize()
         await application.start()
+        if command_metrics:
+            command_metrics.start()
+        
+        # Отслеживаем задержки и блокировки цикла событий
+        loop_monitor = get_loop_monitor(
+            threshold=managers["config"].LOOP_LAG_THRESHOLD,
+            debug=managers["config"].ASYNCIO_DEBUG
+        )
+        loop_monitor.start()
+        
+        # Запускаем публикацию отложенных постов
+        async def send_queued_post(post: dict) -> None:
+            await publish_post(application.bot, post)
+            if post['post_type'] in DAILY_POST_BUILDERS:
+                await post_scheduler.schedule_daily_posts()
+        
+        post_queue = PostQueue(
+            managers["db_manager"],
+            sender=send_queued_post,
+            default_chat_id=managers["config"].TELEGRAM_CHANNEL_ID
+        )
+        post_manager.post_queue = post_queue
+        post_scheduler = PostScheduler(post_queue)
+        await post_scheduler.initialize()
+        post_queue.start()
+        await asyncio.to_thread(notebook_index.start)
+        notebook_tracker.start()
+        evening_draft.start()
         logger.info("Бот успешно запущен")
         
         # Запускаем polling в отдельной задаче
@@ -171,9 +256,19 @@ async def main(managers: dict):
     finally:
         if application:
             try:
+                if post_queue:
+                    await post_queue.stop()
+                await evening_draft.stop()
+                await notebook_tracker.stop()
+                await asyncio.to_thread(notebook_index.stop)
                 await application.updater.stop()
                 await application.stop()
                 await application.shutdown()
+                if command_metrics:
+                    await command_metrics.stop()
+                if loop_monitor:
+                    await loop_monitor.stop()
+                get_profiler().disable()
                 logger.info("Бот успешно остановлен")
             except Exception as e:
                 logger.error(f"Ошибка при остановке бота: {e}")
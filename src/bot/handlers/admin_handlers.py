@@ -0,0 +1,104 @@
+"""
+Модуль с административными командами бота.
+"""
+from functools import wraps
+from typing import Callable, Iterable, Optional
+
+from telegram import Update
+from telegram.ext import Application, CommandHandler, ContextTypes
+
+from src.utils.logger import setup_logger
+from src.utils.profiling import SamplingProfiler, get_profiler
+
+logger = setup_logger(__name__)
+
+
+def admin_only(func: Callable) -> Callable:
+    """Декоратор, ограничивающий команду администраторами бота."""
+    @wraps(func)
+    async def wrapper(self: "AdminHandlers", update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        user = update.effective_user
+        if not user or user.id not in self.admin_ids:
+            logger.warning(f"Попытка вызова административной команды пользователем {getattr(user, 'id', None)}")
+            await update.message.reply_text("Команда доступна только администраторам.")
+            return
+        await func(self, update, context)
+    return wrapper
+
+
+class AdminHandlers:
+    """Обработчики административных команд."""
+
+    def __init__(self, admin_ids: Iterable[int], profiler: Optional[SamplingProfiler] = None):
+        """
+        Инициализация обработчиков.
+
+        Args:
+            admin_ids: ID администраторов (TELEGRAM_ADMIN_IDS)
+            profiler: Профилировщик обработчиков
+        """
+        self.admin_ids = set(admin_ids)
+        self.profiler = profiler or get_profiler()
+
+    @admin_only
+    async def profile(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """Обработчик команды /profile.
+
+        Использование:
+            /profile - состояние профилировщика
+            /profile on <доля> - профилировать долю всех вызовов (0..1)
+            /profile command <команда> [...] - профилировать все вызовы команд
+            /profile flush - записать накопленный профиль в файл
+            /profile off - выключить и записать профиль
+        """
+        try:
+            args = context.args or []
+            action = args[0].lower() if args else "status"
+
+            if action == "on":
+                rate = float(args[1]) if len(args) > 1 else 0.01
+                self.profiler.configure(sample_rate=rate)
+            elif action == "command":
+                self.profiler.configure(commands=self.profiler.commands | set(args[1:]))
+            elif action == "flush":
+                path = self.profiler.flush()
+                await update.message.reply_text(f"Профиль сохранен: {path}" if path else "Нет новых сэмплов.")
+                return
+            elif action == "off":
+                path = self.profiler.disable()
+                await update.message.reply_text(
+                    f"Профилирование выключено. Профиль: {path}" if path else "Профилирование выключено."
+                )
+                return
+            elif action != "status":
+                await update.message.reply_text("Использование: /profile [status|on <доля>|command <команда>|flush|off]")
+                return
+
+            status = self.profiler.status()
+            await update.message.reply_text(
+                f"Профилирование: {'включено' if status['enabled'] else 'выключено'}\n"
+                f"Доля вызовов: {status['sample_rate']}\n"
+                f"Команды: {', '.join(status['commands']) or 'нет'}\n"
+                f"Сэмплов всего: {status['samples_total']}, не сохранено: {status['samples_pending']}\n"
+                f"Каталог: {status['output_dir']}"
+            )
+        except ValueError as e:
+            await update.message.reply_text(f"Некорректный параметр: {e}")
+        except Exception as e:
+            logger.error(f"Ошибка в обработчике profile: {e}")
+            await update.message.reply_text(
+                "Произошла ошибка при обработке команды. Пожалуйста, попробуйте позже."
+            )
+
+
+def setup_admin_handlers(
+    application: Application,
+    admin_ids: Iterable[int],
+    profiler: Optional[SamplingProfiler] = None
+) -> AdminHandlers:
+    """Настройка административных команд."""
+    handlers = AdminHandlers(admin_ids=admin_ids, profiler=profiler)
+
+    application.add_handler(CommandHandler("profile", handlers.profile))
+
+    return handlers
@@ -2,16 +2,19 @@
 Модуль с обработчиками команд бота.
 """
 from telegram import Update
-from telegram.ext import ContextTypes, Application, CommandHandler
+from telegram.ext import ContextTypes, Application, CommandHandler, CallbackQueryHandler
 from typing import Dict, Any, Optional
 from src.utils.logger import setup_logger
 
 from src.ui.messages.message_manager import MessageManager
+from src.ui.messages.message_pager import MessagePager, PAGE_CALLBACK_PREFIX
 from src.ui.keyboards.keyboard_manager import KeyboardManager
 from src.core.moderation.vote_manager import VoteManager
 from src.utils.database.db_manager import DatabaseManager
 from src.core.competition.competition_manager import CompetitionManager
 from src.core.learning.notebook_parser import NotebookParser
+from src.core.commands.command_metrics import CommandMetrics
+from src.bot.handlers.instrumentation import instrument_application
 
 logger = setup_logger(__name__)
 
@@ -23,7 +26,8 @@ class CommandHandlers:
                  keyboard_manager: KeyboardManager,
                  vote_manager: VoteManager,
                  competition_manager: CompetitionManager,
-                 notebook_parser: NotebookParser):
+                 notebook_parser: NotebookParser,
+                 message_pager: Optional[MessagePager] = None):
         """Инициализация обработчиков команд."""
         self.db_manager = db_manager
         self.message_manager = message_manager
@@ -31,6 +35,7 @@ class CommandHandlers:
         self.vote_manager = vote_manager
         self.competition_manager = competition_manager
         self.notebook_parser = notebook_parser
+        self.message_pager = message_pager or MessagePager()
 
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Обработчик команды /start."""
@@ -121,9 +126,10 @@ class CommandHandlers:
             # Формируем сообщение с планом
             plan_message = self.message_manager.get_plan_message(plan)
             
-            # Отправляем сообщение
-            await update.message.reply_text(
-                text=plan_message,
+            # Отправляем сообщение (длинный план - постранично)
+            await self.message_pager.reply(
+                update.message,
+                plan_message,
                 reply_markup=self.keyboard_manager.get_plan_keyboard()
             )
         except Exception as e:
@@ -151,9 +157,10 @@ class CommandHandlers:
             # Формируем сообщение со статистикой
             stats_message = self.message_manager.get_stats_message(stats)
             
-            # Отправляем сообщение
-            await update.message.reply_text(
-                text=stats_message,
+            # Отправляем сообщение (длинная статистика - постранично)
+            await self.message_pager.reply(
+                update.message,
+                stats_message,
                 reply_markup=self.keyboard_manager.get_stats_keyboard()
             )
         except Exception as e:
@@ -213,9 +220,15 @@ def setup_command_handlers(
     competition_manager: CompetitionManager,
     vote_manager: VoteManager,
     message_manager: MessageManager,
-    keyboard_manager: KeyboardManager
+    keyboard_manager: KeyboardManager,
+    command_metrics: Optional[CommandMetrics] = None
 ) -> None:
-    """Настройка обработчиков команд."""
+    """Настройка обработчиков команд.
+
+    Все зарегистрированные обработчики оборачиваются измерением времени;
+    если передан command_metrics, результаты также сохраняются в базу
+    данных фоновой задачей.
+    """
     handlers = CommandHandlers(
         db_manager=db_manager,
         message_manager=message_manager,
@@ -231,4 +244,13 @@ def setup_command_handlers(
     application.add_handler(CommandHandler("vote", handlers.vote))
     application.add_handler(CommandHandler("plan", handlers.plan))
     application.add_handler(CommandHandler("stats", handlers.stats))
-    application.add_handler(CommandHandler("competition", handlers.competition)) 
\ No newline at end of file
+    application.add_handler(CommandHandler("competition", handlers.competition))
+
+    # Регистрируем обработчик кнопок постраничного вывода
+    application.add_handler(CallbackQueryHandler(
+        handlers.message_pager.handle_callback,
+        pattern=f"^{PAGE_CALLBACK_PREFIX}:"
+    ))
+
+    # Измеряем время выполнения всех обработчиков
+    instrument_application(application, command_metrics)
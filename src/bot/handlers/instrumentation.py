@@ -0,0 +1,176 @@
+"""
+Модуль для автоматического измерения времени работы обработчиков.
+
+Каждый зарегистрированный обработчик оборачивается так, что для него
+записываются длительность выполнения, результат (success/error/cancelled)
+и время ожидания в очереди - от создания сообщения в Telegram до начала
+обработки. Метрики пишутся только в Prometheus; сохранение в базу данных
+выполняется отложенно через буфер получателя (см. CommandMetrics.record).
+Выбранные вызовы дополнительно профилируются (см. src.utils.profiling).
+"""
+import asyncio
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from telegram.ext import (
+    Application,
+    ApplicationHandlerStop,
+    BaseHandler,
+    CallbackQueryHandler,
+    CommandHandler,
+    MessageHandler,
+)
+
+from src.utils.logger import setup_logger
+from src.utils.metrics import Metrics
+from src.utils.profiling import get_profiler
+
+logger = setup_logger(__name__)
+
+# Результаты выполнения обработчика
+OUTCOME_SUCCESS = "success"
+OUTCOME_ERROR = "error"
+OUTCOME_CANCELLED = "cancelled"
+
+# Атрибут, которым помечаются обернутые обработчики
+_INSTRUMENTED_ATTR = "__instrumented__"
+
+# Кеш дочерних гистограмм: labels() заметно дороже observe()
+_latency_children: Dict[Tuple[str, str], Any] = {}
+_queue_wait_children: Dict[str, Any] = {}
+
+
+def handler_name(handler: BaseHandler) -> str:
+    """
+    Получение имени обработчика для метки метрик.
+
+    Args:
+        handler: Обработчик
+
+    Returns:
+        str: Имя команды (например, "/start") или тип обработчика
+    """
+    if isinstance(handler, CommandHandler):
+        return "/" + min(handler.commands)
+    if isinstance(handler, CallbackQueryHandler):
+        return "callback"
+    if isinstance(handler, MessageHandler):
+        return "message"
+    return getattr(handler.callback, "__name__", type(handler).__name__)
+
+
+def _observe_latency(name: str, outcome: str, duration: float) -> None:
+    """Запись длительности обработчика в гистограмму."""
+    child = _latency_children.get((name, outcome))
+    if child is None:
+        child = Metrics.handler_latency.labels(handler=name, outcome=outcome)
+        _latency_children[(name, outcome)] = child
+    child.observe(duration)
+
+
+def _observe_queue_wait(name: str, update: Any) -> None:
+    """Запись времени ожидания обновления в очереди.
+
+    Telegram передает дату сообщения с точностью до секунды, поэтому
+    метрика полезна для обнаружения задержек порядка секунд. Для нажатий
+    на кнопки дата относится к исходному сообщению и не учитывается.
+    """
+    if getattr(update, "callback_query", None) is not None:
+        return
+    message = getattr(update, "effective_message", None)
+    date = getattr(message, "edit_date", None) or getattr(message, "date", None)
+    if date is None or not hasattr(date, "timestamp"):
+        return
+    wait = max(0.0, time.time() - date.timestamp())
+    child = _queue_wait_children.get(name)
+    if child is None:
+        child = Metrics.handler_queue_wait.labels(handler=name)
+        _queue_wait_children[name] = child
+    child.observe(wait)
+
+
+def instrument_handler(handler: BaseHandler, recorder: Optional[Any] = None) -> BaseHandler:
+    """
+    Оборачивание обработчика измерением времени выполнения.
+
+    Повторный вызов для уже обернутого обработчика ничего не делает.
+
+    Args:
+        handler: Обработчик
+        recorder: Получатель результатов с неблокирующим методом
+            record(command, user_id, duration, success, error_message)
+
+    Returns:
+        BaseHandler: Тот же обработчик с обернутым callback
+    """
+    callback: Callable = handler.callback
+    if getattr(callback, _INSTRUMENTED_ATTR, False):
+        return handler
+    name = handler_name(handler)
+    profiler = get_profiler()
+
+    @wraps(callback)
+    async def wrapper(update: Any, context: Any) -> Any:
+        _observe_queue_wait(name, update)
+        profiled = profiler.enabled and profiler.should_sample(name)
+        if profiled:
+            profiler.begin(name)
+        outcome = OUTCOME_SUCCESS
+        error_message = None
+        start = time.perf_counter()
+        try:
+            return await callback(update, context)
+        except ApplicationHandlerStop:
+            # Штатная остановка обработки остальных групп
+            raise
+        except asyncio.CancelledError:
+            outcome = OUTCOME_CANCELLED
+            raise
+        except Exception as e:
+            outcome = OUTCOME_ERROR
+            error_message = str(e)
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            if profiled:
+                profiler.end()
+            _observe_latency(name, outcome, duration)
+            if recorder is not None:
+                user = getattr(update, "effective_user", None)
+                try:
+                    recorder.record(
+                        name,
+                        getattr(user, "id", 0),
+                        duration,
+                        outcome == OUTCOME_SUCCESS,
+                        error_message
+                    )
+                except Exception as e:
+                    logger.error(f"Ошибка при записи метрик обработчика {name}: {e}")
+
+    setattr(wrapper, _INSTRUMENTED_ATTR, True)
+    handler.callback = wrapper
+    return handler
+
+
+def instrument_application(application: Application, recorder: Optional[Any] = None) -> int:
+    """
+    Оборачивание всех зарегистрированных обработчиков приложения.
+
+    Args:
+        application: Приложение Telegram
+        recorder: Получатель результатов (см. instrument_handler)
+
+    Returns:
+        int: Количество обработчиков, обернутых при этом вызове
+    """
+    count = 0
+    for handlers in application.handlers.values():
+        for handler in handlers:
+            if not getattr(handler.callback, _INSTRUMENTED_ATTR, False):
+                instrument_handler(handler, recorder)
+                count += 1
+    if count:
+        logger.info(f"Добавлено измерение времени для обработчиков: {count}")
+    return count
@@ -1,7 +1,10 @@
 from telegram.ext import Application, MessageHandler, filters, CallbackContext
 from telegram import Update
+from typing import Optional
 from src.utils.database.db_manager import DatabaseManager
 from src.core.learning.notebook_parser import NotebookParser
+from src.core.commands.command_metrics import CommandMetrics
+from src.bot.handlers.instrumentation import instrument_application
 import logging
 
 logger = logging.getLogger(__name__)
@@ -32,8 +35,12 @@ async def handle_message(update: Update, context: CallbackContext) -> None:
 def setup_message_handlers(
     application: Application,
     db_manager: DatabaseManager,
-    notebook_parser: NotebookParser
+    notebook_parser: NotebookParser,
+    command_metrics: Optional[CommandMetrics] = None
 ) -> None:
     """Настройка обработчиков сообщений"""
     # Регистрируем обработчик текстовых сообщений
-    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message)) 
\ No newline at end of file
+    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
+
+    # Измеряем время выполнения всех обработчиков
+    instrument_application(application, command_metrics)
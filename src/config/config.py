@@ -52,6 +52,14 @@ class Config(BaseModel):
     MIN_LEARNING_TIME: int = Field(default=30)
     MAX_LEARNING_TIME: int = Field(default=240)
     
+    # Event loop monitoring settings
+    LOOP_LAG_THRESHOLD: float = Field(default=0.5)  # секунды
+    ASYNCIO_DEBUG: bool = Field(default=False)
+    
+    # Profiling settings
+    PROFILE_SAMPLE_RATE: float = Field(default=0.0)  # доля профилируемых вызовов
+    PROFILE_COMMANDS: List[str] = Field(default_factory=list)
+    
     # Environment
     ENV: str = Field(default="development")
 
@@ -118,6 +126,10 @@ def get_config() -> Config:
             VOTE_COOLDOWN=int(os.getenv("VOTE_COOLDOWN", "24")),
             MIN_LEARNING_TIME=int(os.getenv("MIN_LEARNING_TIME", "30")),
             MAX_LEARNING_TIME=int(os.getenv("MAX_LEARNING_TIME", "240")),
+            LOOP_LAG_THRESHOLD=float(os.getenv("LOOP_LAG_THRESHOLD", "0.5")),
+            ASYNCIO_DEBUG=os.getenv("ASYNCIO_DEBUG", "false").lower() in ("1", "true", "yes"),
+            PROFILE_SAMPLE_RATE=float(os.getenv("PROFILE_SAMPLE_RATE", "0")),
+            PROFILE_COMMANDS=[c for c in os.getenv("PROFILE_COMMANDS", "").split(",") if c],
             ENV=os.getenv("ENV", "development")
         )
     return _config 
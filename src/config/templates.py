@@ -1,32 +1,13 @@
+
+
 """
 Шаблоны сообщений для бота.
+
+Тексты постов хранятся в файлах src/utils/templates/files/posts
+и компилируются движком шаблонов при запуске.
 """
 
 POST_TEMPLATES = {
-    'morning': """
-🌅 Доброе утро, Data Scientists!
-
-📝 План на сегодня:
-{plan}
-
-🎯 Цели:
-{goals}
-
-Удачного дня и продуктивного обучения! 💪
-
-#DataScience #Kaggle #Learning
-""",
-    'evening': """
-🌙 Добрый вечер, Data Scientists!
-
-📊 Итоги дня:
-{summary}
-
-🏆 Достижения:
-{achievements}
-
-Спасибо за продуктивный день! До завтра! 👋
-
-#DataScience #Kaggle #Progress
-"""
-} 
\ No newline at end of file
+    'morning': 'posts/morning.html',
+    'evening': 'posts/evening.html'
+}
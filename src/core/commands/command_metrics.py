@@ -1,8 +1,10 @@
 """
 Модуль для отслеживания эффективности команд бота.
 """
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional, Tuple
+import asyncio
 import logging
+from collections import deque
 from datetime import datetime
 from src.utils.database.db_manager import DatabaseManager
 from src.utils.mlflow_manager import MLflowManager
@@ -10,19 +12,26 @@ from src.utils.metrics import Metrics
 
 logger = logging.getLogger(__name__)
 
+# Максимальное количество записей, ожидающих сохранения в базу данных
+MAX_PENDING_RECORDS = 10000
+
 class CommandMetrics:
     """Класс для отслеживания эффективности команд."""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, flush_interval: float = 5.0):
         """
         Инициализация отслеживания команд.
         
         Args:
             db_manager: Менеджер базы данных
+            flush_interval: Интервал сохранения буфера в базу данных (секунды)
         """
         self.db_manager = db_manager
         self.mlflow_manager = MLflowManager()
         self.metrics = Metrics()
+        self.flush_interval = flush_interval
+        self._pending: Deque[Tuple[str, int, float, bool, Optional[str]]] = deque(maxlen=MAX_PENDING_RECORDS)
+        self._flush_task: Optional[asyncio.Task] = None
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -50,6 +59,71 @@ class CommandMetrics:
                 logger.error(f"Ошибка при инициализации CommandMetrics: {e}")
                 raise
 
+    def record(self, command: str, user_id: int, duration: float, success: bool, error_message: Optional[str] = None) -> None:
+        """
+        Неблокирующая запись результата команды в буфер.
+
+        Записи сохраняются в базу данных пачками фоновой задачей (см. start).
+        При переполнении буфера отбрасываются самые старые записи.
+
+        Args:
+            command: Название команды
+            user_id: ID пользователя
+            duration: Длительность выполнения
+            success: Успешность выполнения
+            error_message: Сообщение об ошибке
+        """
+        self._pending.append((command, user_id, duration, success, error_message))
+
+    async def flush(self) -> int:
+        """
+        Сохранение накопленных записей в базу данных одной транзакцией.
+
+        Returns:
+            int: Количество сохраненных записей
+        """
+        if not self._pending:
+            return 0
+        records = list(self._pending)
+        self._pending.clear()
+        try:
+            async with self.db_manager.get_connection() as conn:
+                await conn.executemany(
+                    """
+                    INSERT INTO command_metrics (
+                        command, user_id, duration, success, error_message
+                    ) VALUES (?, ?, ?, ?, ?)
+                    """,
+                    records
+                )
+                await conn.commit()
+            return len(records)
+        except Exception as e:
+            logger.error(f"Ошибка при сохранении метрик команд: {e}")
+            return 0
+
+    async def _flush_loop(self) -> None:
+        """Периодическое сохранение буфера."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self) -> None:
+        """Запуск фонового сохранения буфера."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Остановка фонового сохранения с записью оставшихся данных."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
     async def track_command(self, command: str, user_id: int, duration: float, success: bool, error_message: Optional[str] = None) -> Dict:
         """
         Отслеживание выполнения команды.
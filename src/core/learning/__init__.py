@@ -2,7 +2,17 @@
 Модуль для работы с обучением.
 """
 
+from .cell_diff import CellCache, IncrementalResult, NotebookDelta, get_cell_cache
+from .html_export import HtmlExportCache, get_html_export_cache
 from .learning_manager import LearningManager
 from .learning_metrics import LearningMetrics
+from .metric_extractor import MetricExtractor, MetricHit, get_metric_extractor
+from .notebook_index import NotebookIndex
+from .notebook_tracker import NotebookTracker
+from .notebook_stream import LazyOutput, NotebookStream
+from .plot_store import PlotRef, PlotStore, get_plot_store
 
-__all__ = ['LearningManager', 'LearningMetrics'] 
\ No newline at end of file
+__all__ = ['CellCache', 'IncrementalResult', 'NotebookDelta', 'get_cell_cache',
+           'HtmlExportCache', 'get_html_export_cache', 'LearningManager', 'LearningMetrics', 'MetricExtractor', 'MetricHit', 'get_metric_extractor',
+           'NotebookIndex', 'NotebookStream', 'LazyOutput', 'NotebookTracker',
+           'PlotRef', 'PlotStore', 'get_plot_store'] 
\ No newline at end of file
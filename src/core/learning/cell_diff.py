@@ -0,0 +1,296 @@
+"""
+Модуль для инкрементального разбора ноутбуков по ячейкам.
+
+Для каждой ячейки считается хеш содержимого (тип, исходный код, текстовые
+выводы). Карта ячеек предыдущего разбора хранится в памяти и на диске,
+поэтому при повторном сохранении ноутбука метрики, код и сводка
+извлекаются только из изменившихся ячеек, а для остальных берутся
+из кеша - стоимость разбора пропорциональна правке, а не размеру ноутбука.
+Первая за день карта ячеек сохраняется как базовая, что позволяет
+получить изменения за сегодня.
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from src.core.learning.metric_extractor import MetricExtractor, MetricHit, get_metric_extractor
+from src.core.learning.notebook_stream import NotebookStream
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Каталог карт ячеек по умолчанию
+DEFAULT_CACHE_DIR = Path("data") / "cache" / "cells"
+
+# Версия формата карты: увеличивается при изменении извлечения
+CELL_MAP_VERSION = 1
+
+
+def _text(value: Any) -> str:
+    return ''.join(value) if isinstance(value, list) else (value or '')
+
+
+def cell_hash(cell: Dict[str, Any]) -> str:
+    """
+    Хеш содержимого ячейки, влияющего на результат разбора.
+
+    Картинки в хеш не входят: из них не извлекаются ни метрики, ни код,
+    ни сводка.
+
+    Args:
+        cell: Ячейка ноутбука
+
+    Returns:
+        str: SHA-1 содержимого
+    """
+    sha = hashlib.sha1()
+    sha.update(str(cell.get('cell_type')).encode())
+    sha.update(b'\0')
+    sha.update(_text(cell.get('source')).encode('utf-8'))
+    for output in cell.get('outputs') or []:
+        if not isinstance(output, dict):
+            continue
+        text = output.get('text')
+        if text is None:
+            text = (output.get('data') or {}).get('text/plain')
+        if isinstance(text, (str, list)):
+            sha.update(b'\0')
+            sha.update(_text(text).encode('utf-8'))
+    return sha.hexdigest()
+
+
+@dataclass
+class CellResult:
+    """Результат разбора одной ячейки."""
+    hash: str
+    cell_type: str
+    source: str
+    hits: List[MetricHit] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'hash': self.hash,
+            'cell_type': self.cell_type,
+            'source': self.source,
+            'hits': [[hit.name, hit.value, hit.source, hit.line] for hit in self.hits],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CellResult":
+        return cls(
+            data['hash'],
+            data['cell_type'],
+            data['source'],
+            [MetricHit(name, value, 0, source, line) for name, value, source, line in data['hits']]
+        )
+
+
+@dataclass
+class NotebookDelta:
+    """Изменения ячеек относительно предыдущей версии ноутбука."""
+    added: List[CellResult] = field(default_factory=list)
+    removed: List[CellResult] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+@dataclass
+class IncrementalResult:
+    """Результат инкрементального разбора ноутбука."""
+    cells: List[CellResult]
+    delta: NotebookDelta
+    today: NotebookDelta
+
+    @property
+    def hits(self) -> List[MetricHit]:
+        """Значения метрик с номерами ячеек текущей версии."""
+        return [hit._replace(cell=index) for index, cell in enumerate(self.cells) for hit in cell.hits]
+
+    @property
+    def metrics(self) -> Dict[str, float]:
+        """Итоговые значения метрик (последнее значение побеждает)."""
+        return {hit.name: hit.value for cell in self.cells for hit in cell.hits}
+
+    @property
+    def code(self) -> List[str]:
+        """Код непустых ячеек кода."""
+        return [cell.source for cell in self.cells if cell.cell_type == 'code' and cell.source.strip()]
+
+    @property
+    def summary(self) -> str:
+        """Сводка из markdown-ячеек."""
+        return '\n'.join(cell.source for cell in self.cells if cell.cell_type == 'markdown')
+
+
+class CellCache:
+    """Карты ячеек ноутбуков для инкрементального разбора."""
+
+    def __init__(
+        self,
+        extractor: Optional[MetricExtractor] = None,
+        cache_dir: Optional[Union[str, Path]] = DEFAULT_CACHE_DIR
+    ):
+        """
+        Инициализация кеша.
+
+        Args:
+            extractor: Извлекатель метрик (по умолчанию общий)
+            cache_dir: Каталог карт ячеек (None - только в памяти)
+        """
+        self.extractor = extractor or get_metric_extractor()
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._states: Dict[Path, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _state_path(self, path: Path) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha1(str(path.resolve()).encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _load(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Карта ячеек предыдущего разбора."""
+        if path in self._states:
+            return self._states[path]
+        state_path = self._state_path(path)
+        if state_path is None or not state_path.exists():
+            return None
+        try:
+            with open(state_path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != CELL_MAP_VERSION:
+                return None
+            state = {
+                'day': date.fromisoformat(data['day']),
+                'baseline': [CellResult.from_dict(cell) for cell in data['baseline']],
+                'cells': [CellResult.from_dict(cell) for cell in data['cells']],
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Карта ячеек {path.name} повреждена: {e}")
+            return None
+        self._states[path] = state
+        return state
+
+    def _save(self, path: Path, state: Dict[str, Any]) -> None:
+        """Сохранение карты ячеек."""
+        self._states[path] = state
+        state_path = self._state_path(path)
+        if state_path is None:
+            return
+        data = {
+            'version': CELL_MAP_VERSION,
+            'path': str(path),
+            'day': state['day'].isoformat(),
+            'baseline': [cell.to_dict() for cell in state['baseline']],
+            'cells': [cell.to_dict() for cell in state['cells']],
+        }
+        try:
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = state_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, state_path)
+        except OSError as e:
+            logger.error(f"Ошибка при сохранении карты ячеек {path.name}: {e}")
+
+    def _parse_cell(self, cell: Dict[str, Any], digest: str) -> CellResult:
+        """Разбор одной ячейки."""
+        hits = self.extractor.extract([cell]) if cell.get('cell_type') == 'code' else []
+        return CellResult(digest, cell.get('cell_type', ''), _text(cell.get('source')), hits)
+
+    @staticmethod
+    def _delta(previous: List[CellResult], current: List[CellResult]) -> NotebookDelta:
+        """Добавленные и удаленные ячейки между версиями."""
+        pool: Dict[str, int] = defaultdict(int)
+        for cell in previous:
+            pool[cell.hash] += 1
+        delta = NotebookDelta()
+        for cell in current:
+            if pool[cell.hash] > 0:
+                pool[cell.hash] -= 1
+                delta.unchanged += 1
+            else:
+                delta.added.append(cell)
+        for cell in previous:
+            if pool[cell.hash] > 0:
+                pool[cell.hash] -= 1
+                delta.removed.append(cell)
+        return delta
+
+    def parse(self, path: Union[str, Path], today: Optional[date] = None) -> IncrementalResult:
+        """
+        Разбор ноутбука с повторным использованием результатов неизменных ячеек.
+
+        Args:
+            path: Путь к ноутбуку
+            today: Текущая дата (по умолчанию - сегодня)
+
+        Returns:
+            IncrementalResult: Ячейки, изменения с прошлого разбора и за сегодня
+        """
+        path = Path(path)
+        today = today or date.today()
+        with self._lock:
+            state = self._load(path)
+        previous = state['cells'] if state else []
+        reusable: Dict[str, List[CellResult]] = defaultdict(list)
+        for cell in previous:
+            reusable[cell.hash].append(cell)
+
+        cells: List[CellResult] = []
+        parsed = 0
+        for cell in NotebookStream(path).cells(outputs=True, mime_types=('text/plain',)):
+            digest = cell_hash(cell)
+            if reusable[digest]:
+                cells.append(reusable[digest].pop(0))
+            else:
+                cells.append(self._parse_cell(cell, digest))
+                parsed += 1
+
+        if state is None:
+            baseline: List[CellResult] = []
+        elif state['day'] != today:
+            # Первый разбор за день: базой служит последняя вчерашняя версия
+            baseline = previous
+        else:
+            baseline = state['baseline']
+
+        result = IncrementalResult(cells, self._delta(previous, cells), self._delta(baseline, cells))
+        with self._lock:
+            self._save(path, {'day': today, 'baseline': baseline, 'cells': cells})
+        logger.debug(f"Ноутбук {path.name}: разобрано ячеек {parsed} из {len(cells)}")
+        return result
+
+    def forget(self, path: Union[str, Path]) -> None:
+        """
+        Удаление карты ячеек ноутбука.
+
+        Args:
+            path: Путь к ноутбуку
+        """
+        path = Path(path)
+        with self._lock:
+            self._states.pop(path, None)
+            state_path = self._state_path(path)
+            if state_path is not None and state_path.exists():
+                state_path.unlink()
+
+
+_cell_cache: Optional[CellCache] = None
+
+
+def get_cell_cache() -> CellCache:
+    """Получение экземпляра кеша карт ячеек."""
+    global _cell_cache
+    if _cell_cache is None:
+        _cell_cache = CellCache()
+    return _cell_cache
@@ -0,0 +1,284 @@
+"""
+Модуль для экспорта ноутбуков в HTML с кешированием.
+
+Экспорт через nbconvert (Jinja, Pygments, mistune) занимает секунды
+на больших ноутбуках, поэтому готовый HTML хранится на диске под ключом
+из SHA-256 содержимого ноутбука и параметров экспорта (шаблон, режим
+картинок, версия nbconvert). Изменение ноутбука или параметров дает
+новый ключ, старые файлы вытесняются по количеству. Пакетный экспорт
+выполняется в пуле процессов. Картинки можно оставить встроенными,
+удалить или вынести в хранилище графиков, чтобы HTML оставался небольшим.
+"""
+import asyncio
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+import nbconvert
+import nbformat
+from nbconvert import HTMLExporter
+
+from src.core.learning.plot_store import DEFAULT_STORE_DIR, IMAGE_TYPES, PlotStore
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Каталог кеша по умолчанию
+DEFAULT_CACHE_DIR = Path("data") / "cache" / "html"
+
+# Режимы обработки картинок
+IMAGES_INLINE = 'inline'
+IMAGES_STRIP = 'strip'
+IMAGES_EXTERNAL = 'external'
+IMAGE_MODES = (IMAGES_INLINE, IMAGES_STRIP, IMAGES_EXTERNAL)
+
+# Версия формата кеша: увеличивается при изменении логики экспорта
+CACHE_VERSION = 1
+
+
+def _prepare(notebook: Any, options: Dict[str, Any]) -> Any:
+    """Удаление или вынос картинок из выводов ячеек."""
+    if options['images'] == IMAGES_INLINE:
+        return notebook
+    store = PlotStore(options['plot_store_dir']) if options['images'] == IMAGES_EXTERNAL else None
+    for cell in notebook.cells:
+        for output in cell.get('outputs', []):
+            data = output.get('data')
+            if not data:
+                continue
+            for mime in [mime for mime in data if mime in IMAGE_TYPES]:
+                value = data.pop(mime)
+                if store is None:
+                    continue
+                plot = store.put_output(value, mime)
+                if options['image_base_url']:
+                    url = f"{options['image_base_url'].rstrip('/')}/{plot.path.relative_to(store.root).as_posix()}"
+                else:
+                    url = plot.path.resolve().as_uri()
+                data['text/html'] = f'<img src="{url}" alt="{plot.digest[:12]}">'
+    return notebook
+
+
+def _render(notebook: Any, options: Dict[str, Any]) -> str:
+    """Экспорт ноутбука в HTML."""
+    if isinstance(notebook, (bytes, str)):
+        notebook = nbformat.reads(notebook, as_version=4)
+    exporter = HTMLExporter(template_name=options['template_name'])
+    return exporter.from_notebook_node(_prepare(notebook, options))[0]
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Атомарная запись файла кеша."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _render_to_file(source_path: str, cache_path: str, options: Dict[str, Any]) -> str:
+    """Экспорт ноутбука в файл кеша (выполняется в пуле процессов)."""
+    html = _render(Path(source_path).read_bytes(), options)
+    _write_atomic(Path(cache_path), html)
+    return cache_path
+
+
+class HtmlExportCache:
+    """Кеш HTML-экспорта ноутбуков с пакетным экспортом в пуле процессов."""
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+        template_name: str = 'lab',
+        images: str = IMAGES_INLINE,
+        image_base_url: Optional[str] = None,
+        plot_store_dir: Union[str, Path] = DEFAULT_STORE_DIR,
+        max_workers: Optional[int] = None,
+        max_entries: int = 200
+    ):
+        """
+        Инициализация кеша.
+
+        Args:
+            cache_dir: Каталог кеша
+            template_name: Шаблон nbconvert
+            images: Режим картинок по умолчанию: inline, strip или external
+            image_base_url: Базовый URL хранилища графиков для режима external
+                (по умолчанию - file:// путь)
+            plot_store_dir: Каталог хранилища графиков для режима external
+            max_workers: Размер пула процессов для пакетного экспорта
+            max_entries: Максимальное количество файлов в кеше
+        """
+        if images not in IMAGE_MODES:
+            raise ValueError(f"Неизвестный режим картинок: {images}")
+        self.cache_dir = Path(cache_dir)
+        self.template_name = template_name
+        self.images = images
+        self.image_base_url = image_base_url
+        self.plot_store_dir = str(plot_store_dir)
+        self.max_workers = max_workers
+        self.max_entries = max_entries
+        self._digests: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _options(self, images: Optional[str]) -> Dict[str, Any]:
+        """Параметры экспорта, влияющие на результат."""
+        images = images or self.images
+        if images not in IMAGE_MODES:
+            raise ValueError(f"Неизвестный режим картинок: {images}")
+        return {
+            'version': CACHE_VERSION,
+            'nbconvert': nbconvert.__version__,
+            'template_name': self.template_name,
+            'images': images,
+            'image_base_url': self.image_base_url if images == IMAGES_EXTERNAL else None,
+            'plot_store_dir': self.plot_store_dir if images == IMAGES_EXTERNAL else None,
+        }
+
+    def _digest(self, path: Path) -> str:
+        """SHA-256 содержимого ноутбука (пересчитывается при изменении файла)."""
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._digests.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        self._digests[path] = (signature, digest)
+        return digest
+
+    def cache_path(self, digest: str, options: Dict[str, Any]) -> Path:
+        """
+        Путь к файлу кеша.
+
+        Args:
+            digest: SHA-256 содержимого ноутбука
+            options: Параметры экспорта
+
+        Returns:
+            Path: Путь к HTML в кеше
+        """
+        config = hashlib.sha256(json.dumps(options, sort_keys=True).encode()).hexdigest()[:16]
+        return self.cache_dir / f"{digest}-{config}.html"
+
+    def _lookup(self, path: Path, options: Dict[str, Any]) -> Path:
+        return self.cache_path(self._digest(path), options)
+
+    def export(self, notebook: Union[str, Path, Dict], images: Optional[str] = None) -> str:
+        """
+        Экспорт ноутбука в HTML с использованием кеша.
+
+        Args:
+            notebook: Путь к ноутбуку или его содержимое
+            images: Режим картинок (по умолчанию - режим кеша)
+
+        Returns:
+            str: HTML представление ноутбука
+        """
+        options = self._options(images)
+        if isinstance(notebook, (str, Path)):
+            path = Path(notebook)
+            cache_path = self._lookup(path, options)
+            source: Any = None
+        else:
+            source = nbformat.from_dict(notebook)
+            content = json.dumps(notebook, sort_keys=True, ensure_ascii=False).encode('utf-8')
+            cache_path = self.cache_path(hashlib.sha256(content).hexdigest(), options)
+
+        if cache_path.exists():
+            os.utime(cache_path)
+            return cache_path.read_text(encoding='utf-8')
+
+        html = _render(path.read_bytes() if source is None else source, options)
+        _write_atomic(cache_path, html)
+        self.prune()
+        return html
+
+    async def export_many(
+        self,
+        paths: Iterable[Union[str, Path]],
+        images: Optional[str] = None
+    ) -> Dict[Path, Path]:
+        """
+        Пакетный экспорт ноутбуков в пуле процессов.
+
+        Args:
+            paths: Пути к ноутбукам
+            images: Режим картинок (по умолчанию - режим кеша)
+
+        Returns:
+            Dict[Path, Path]: Ноутбук -> файл HTML в кеше (ноутбуки
+            с ошибкой экспорта отсутствуют)
+        """
+        options = self._options(images)
+        loop = asyncio.get_running_loop()
+        results: Dict[Path, Path] = {}
+        pending = {}
+        for path in map(Path, paths):
+            try:
+                cache_path = await asyncio.to_thread(self._lookup, path, options)
+            except OSError as e:
+                logger.error(f"Ошибка при чтении ноутбука {path.name}: {e}")
+                continue
+            if cache_path.exists():
+                results[path] = cache_path
+            else:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                pending[path] = loop.run_in_executor(
+                    self._pool, _render_to_file, str(path), str(cache_path), options
+                )
+
+        for path, future in pending.items():
+            try:
+                results[path] = Path(await future)
+            except Exception as e:
+                logger.error(f"Ошибка при экспорте ноутбука {path.name} в HTML: {e}")
+        if pending:
+            await asyncio.to_thread(self.prune)
+        return results
+
+    def prune(self) -> int:
+        """
+        Вытеснение давно не использованных файлов кеша.
+
+        Returns:
+            int: Количество удаленных файлов
+        """
+        try:
+            entries = sorted(
+                (entry.stat().st_mtime, entry) for entry in self.cache_dir.glob('*.html')
+            )
+        except OSError:
+            return 0
+        removed = 0
+        for _, entry in entries[:max(0, len(entries) - self.max_entries)]:
+            try:
+                entry.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def shutdown(self) -> None:
+        """Остановка пула процессов."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+_cache: Optional[HtmlExportCache] = None
+
+
+def get_html_export_cache() -> HtmlExportCache:
+    """Получение экземпляра кеша HTML-экспорта."""
+    global _cache
+    if _cache is None:
+        _cache = HtmlExportCache()
+    return _cache
@@ -0,0 +1,238 @@
+"""
+Модуль для извлечения метрик из ноутбуков.
+
+Все метрики реестра ищутся одним заранее скомпилированным регулярным
+выражением за один проход по тексту ячейки - как по исходному коду,
+так и по текстовым выводам (print, результат выполнения). Для кода
+доступен уточняющий проход по AST: учитываются только присваивания
+числовых констант и вызовы вида log_metric("auc", 0.91). Для каждого
+найденного значения сохраняется, из какой ячейки и откуда оно взято.
+"""
+import ast
+import re
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence
+
+# Реестр метрик по умолчанию: имя метрики -> варианты написания
+DEFAULT_METRICS: Dict[str, Sequence[str]] = {
+    'accuracy': ('accuracy', 'acc'),
+    'f1': ('f1', 'f1_score'),
+    'loss': ('loss',),
+    'precision': ('precision',),
+    'recall': ('recall',),
+    'auc': ('auc', 'roc_auc', 'roc_auc_score'),
+    'logloss': ('logloss', 'log_loss'),
+    'rmse': ('rmse',),
+    'mse': ('mse',),
+    'mae': ('mae',),
+    'r2': ('r2', 'r2_score'),
+}
+
+# Префиксы выборок, допустимые перед именем метрики (val_loss и т.п.)
+_SPLIT_PREFIX = r'(?:(?:train|training|val|valid|validation|test|eval|cv)_)?'
+_SPLIT_PREFIXES = re.compile(r'(?:train|training|val|valid|validation|test|eval|cv)_')
+_IDENTIFIER_TAIL = re.compile(r'[\w.]+\Z')
+_NUMBER = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+
+# Откуда взято значение
+SOURCE_CODE = 'source'
+SOURCE_OUTPUT = 'output'
+SOURCE_AST = 'ast'
+
+# Функции логирования метрик, разбираемые в AST
+_LOG_FUNCTIONS = frozenset({'log_metric', 'log_metrics', 'log'})
+
+
+def _is_word(char: str) -> bool:
+    return char.isalnum() or char in '_.'
+
+
+class MetricHit(NamedTuple):
+    """Найденное значение метрики."""
+    name: str
+    value: float
+    cell: int
+    source: str
+    line: int
+
+
+class MetricExtractor:
+    """Однопроходное извлечение метрик по реестру."""
+
+    def __init__(self, metrics: Optional[Mapping[str, Iterable[str]]] = None, use_ast: bool = False):
+        """
+        Инициализация извлекателя.
+
+        Args:
+            metrics: Реестр метрик (имя -> варианты написания);
+                по умолчанию DEFAULT_METRICS
+            use_ast: Разбирать код ячеек через AST (ячейки с синтаксисом
+                IPython разбираются регулярным выражением)
+        """
+        self.use_ast = use_ast
+        self._aliases: Dict[str, str] = {}
+        for name, aliases in (metrics or DEFAULT_METRICS).items():
+            self.register(name, *aliases, compile_pattern=False)
+        self._compile()
+
+    @property
+    def metrics(self) -> List[str]:
+        """Имена метрик реестра."""
+        return sorted(set(self._aliases.values()))
+
+    def register(self, name: str, *aliases: str, compile_pattern: bool = True) -> None:
+        """
+        Добавление метрики в реестр.
+
+        Args:
+            name: Имя метрики
+            *aliases: Варианты написания (по умолчанию - само имя)
+            compile_pattern: Перекомпилировать выражение сразу
+        """
+        for alias in aliases or (name,):
+            self._aliases[alias.lower()] = name
+        if compile_pattern:
+            self._compile()
+
+    def _compile(self) -> None:
+        """Сборка общего выражения для всех вариантов написания."""
+        # Длинные варианты первыми, чтобы roc_auc не совпадал как auc.
+        # Выражение начинается с альтернативы литералов без lookbehind и
+        # флага IGNORECASE - так re быстро пропускает неподходящие позиции;
+        # регистр снимается заранее, граница слова проверяется в _scan_text
+        alternatives = '|'.join(re.escape(alias) for alias in sorted(self._aliases, key=len, reverse=True))
+        self._pattern = re.compile(
+            rf"(?P<name>{alternatives})['\"]?[ \t]*(?:[=:]|is\b)[ \t]*(?P<value>{_NUMBER})"
+        )
+
+    @staticmethod
+    def _starts_word(text: str, start: int) -> bool:
+        """Имя метрики начинается с начала идентификатора (допускается префикс выборки)."""
+        if start == 0:
+            return True
+        before = text[start - 1]
+        if before == '_':
+            # val_loss, test_accuracy и т.п.
+            head = _IDENTIFIER_TAIL.search(text, max(0, start - 16), start)
+            return head is not None and _SPLIT_PREFIXES.fullmatch(head.group()) is not None \
+                and (head.start() == 0 or not _is_word(text[head.start() - 1]))
+        return not _is_word(before)
+
+    def _scan_text(self, text: str, cell: int, source: str) -> Iterable[MetricHit]:
+        """Поиск метрик в тексте регулярным выражением."""
+        text = text.lower()
+        line, last = 1, 0
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            if not self._starts_word(text, start):
+                continue
+            line += text.count('\n', last, start)
+            last = start
+            yield MetricHit(
+                self._aliases[match.group('name')],
+                float(match.group('value')),
+                cell,
+                source,
+                line
+            )
+
+    def _number(self, node: ast.AST) -> Optional[float]:
+        """Числовая константа (в том числе со знаком)."""
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            value = self._number(node.operand)
+            if value is None:
+                return None
+            return -value if isinstance(node.op, ast.USub) else value
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+                and not isinstance(node.value, bool):
+            return float(node.value)
+        return None
+
+    def _metric_name(self, identifier: str) -> Optional[str]:
+        """Имя метрики по имени переменной или ключу."""
+        match = re.fullmatch(_SPLIT_PREFIX + r'(\w+)', identifier.lower())
+        return self._aliases.get(match.group(1)) if match else None
+
+    def _scan_ast(self, tree: ast.AST, cell: int) -> Iterable[MetricHit]:
+        """Поиск присваиваний и вызовов логирования метрик."""
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.Assign, ast.AnnAssign)) and node.value is not None:
+                value = self._number(node.value)
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                for target in targets:
+                    if value is not None and isinstance(target, ast.Name):
+                        if (name := self._metric_name(target.id)) is not None:
+                            yield MetricHit(name, value, cell, SOURCE_AST, node.lineno)
+            elif isinstance(node, ast.Call):
+                func = node.func.attr if isinstance(node.func, ast.Attribute) else getattr(node.func, 'id', None)
+                if func not in _LOG_FUNCTIONS or len(node.args) < 2:
+                    continue
+                key, value = node.args[0], self._number(node.args[1])
+                if value is not None and isinstance(key, ast.Constant) and isinstance(key.value, str):
+                    if (name := self._metric_name(key.value)) is not None:
+                        yield MetricHit(name, value, cell, SOURCE_AST, node.lineno)
+
+    def _scan_source(self, text: str, cell: int) -> List[MetricHit]:
+        """Поиск метрик в коде ячейки."""
+        if self.use_ast:
+            try:
+                tree = ast.parse(text)
+            except SyntaxError:
+                pass
+            else:
+                return sorted(self._scan_ast(tree, cell), key=lambda hit: hit.line)
+        return list(self._scan_text(text, cell, SOURCE_CODE))
+
+    @staticmethod
+    def _text(value: Any) -> str:
+        return ''.join(value) if isinstance(value, list) else (value or '')
+
+    def extract(self, cells: Iterable[Dict[str, Any]]) -> List[MetricHit]:
+        """
+        Все найденные значения метрик в порядке документа.
+
+        Args:
+            cells: Ячейки ноутбука (nbformat или потокового чтения)
+
+        Returns:
+            List[MetricHit]: Значения с указанием ячейки и источника
+        """
+        hits: List[MetricHit] = []
+        for index, cell in enumerate(cells):
+            if cell.get('cell_type') != 'code':
+                continue
+            source = self._text(cell.get('source'))
+            if source:
+                hits.extend(self._scan_source(source, index))
+            for output in cell.get('outputs') or []:
+                if not isinstance(output, dict):
+                    continue
+                text = output.get('text')
+                if text is None:
+                    text = (output.get('data') or {}).get('text/plain')
+                if isinstance(text, (str, list)):
+                    hits.extend(self._scan_text(self._text(text), index, SOURCE_OUTPUT))
+        return hits
+
+    def extract_dict(self, cells: Iterable[Dict[str, Any]]) -> Dict[str, float]:
+        """
+        Итоговые значения метрик: побеждает последнее найденное значение
+        (вывод ячейки - позже ее кода).
+
+        Args:
+            cells: Ячейки ноутбука
+
+        Returns:
+            Dict[str, float]: Словарь с метриками
+        """
+        return {hit.name: hit.value for hit in self.extract(cells)}
+
+
+_extractor: Optional[MetricExtractor] = None
+
+
+def get_metric_extractor() -> MetricExtractor:
+    """Получение экземпляра извлекателя метрик с реестром по умолчанию."""
+    global _extractor
+    if _extractor is None:
+        _extractor = MetricExtractor()
+    return _extractor
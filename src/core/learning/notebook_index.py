@@ -0,0 +1,303 @@
+"""
+Модуль для индексации ноутбуков в каталоге.
+
+Индекс хранит время изменения и размер каждого ноутбука в памяти,
+сгруппированными по дням, поэтому поиск последнего ноутбука и ноутбуков
+за день не требует обхода каталога. Изменения отслеживаются через watchdog
+(inotify и аналоги), если библиотека установлена; независимо от этого
+периодическая сверка с диском исправляет пропущенные события. Снимок
+индекса сохраняется на диск, чтобы после перезапуска запросы обслуживались
+сразу, а сверка выполнялась в фоне.
+"""
+import json
+import os
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from src.utils.logger import setup_logger
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # watchdog - необязательная зависимость
+    FileSystemEventHandler = object
+    Observer = None
+
+logger = setup_logger(__name__)
+
+# Снимок индекса по умолчанию
+DEFAULT_SNAPSHOT_PATH = Path("data") / "cache" / "notebook_index.json"
+
+# Сигнатура ноутбука: время изменения (нс) и размер (байт)
+Signature = Tuple[int, int]
+
+
+class _NotebookEventHandler(FileSystemEventHandler):
+    """Передача событий файловой системы в индекс."""
+
+    def __init__(self, index: "NotebookIndex"):
+        super().__init__()
+        self.index = index
+
+    def on_created(self, event) -> None:
+        if not event.is_directory:
+            self.index.update(event.src_path)
+
+    def on_modified(self, event) -> None:
+        if not event.is_directory:
+            self.index.update(event.src_path)
+
+    def on_deleted(self, event) -> None:
+        if not event.is_directory:
+            self.index.remove(event.src_path)
+
+    def on_moved(self, event) -> None:
+        if not event.is_directory:
+            self.index.remove(event.src_path)
+            self.index.update(event.dest_path)
+
+
+class NotebookIndex:
+    """Индекс ноутбуков по времени изменения с группировкой по дням."""
+
+    def __init__(
+        self,
+        notebooks_dir: Union[str, Path],
+        snapshot_path: Optional[Union[str, Path]] = DEFAULT_SNAPSHOT_PATH,
+        reconcile_interval: float = 600.0,
+        poll_interval: float = 30.0,
+        use_watchdog: bool = True
+    ):
+        """
+        Инициализация индекса.
+
+        Args:
+            notebooks_dir: Каталог с ноутбуками
+            snapshot_path: Файл снимка индекса (None - без снимка)
+            reconcile_interval: Интервал сверки индекса с диском (секунды)
+            poll_interval: Интервал сверки, если watchdog недоступен (секунды)
+            use_watchdog: Отслеживать изменения через watchdog, если он установлен
+        """
+        self.notebooks_dir = Path(notebooks_dir)
+        self._resolved_dir = self.notebooks_dir.resolve()
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.reconcile_interval = reconcile_interval
+        self.use_watchdog = use_watchdog and Observer is not None
+        if not self.use_watchdog:
+            self.reconcile_interval = min(reconcile_interval, poll_interval)
+        self._entries: Dict[str, Signature] = {}
+        self._days: Dict[date, Dict[str, Signature]] = {}
+        self._latest: Optional[Tuple[int, str]] = None
+        self._lock = threading.RLock()
+        self._observer = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _day(signature: Signature) -> date:
+        """День изменения ноутбука (по локальному времени)."""
+        return datetime.fromtimestamp(signature[0] / 1e9).date()
+
+    def _put(self, name: str, signature: Signature) -> None:
+        """Добавление или обновление записи (под блокировкой)."""
+        old = self._entries.get(name)
+        if old == signature:
+            return
+        if old is not None:
+            self._discard(name, old)
+        self._entries[name] = signature
+        self._days.setdefault(self._day(signature), {})[name] = signature
+        if self._latest is None or (signature[0], name) > self._latest:
+            self._latest = (signature[0], name)
+        elif self._latest[1] == name:
+            # Время изменения последнего ноутбука уменьшилось
+            self._recompute_latest()
+
+    def _discard(self, name: str, signature: Signature) -> None:
+        """Удаление записи из корзины дня (под блокировкой)."""
+        day = self._day(signature)
+        bucket = self._days.get(day)
+        if bucket is not None:
+            bucket.pop(name, None)
+            if not bucket:
+                del self._days[day]
+
+    def _recompute_latest(self) -> None:
+        """Поиск последнего ноутбука в самом свежем дне (под блокировкой)."""
+        if not self._days:
+            self._latest = None
+            return
+        bucket = self._days[max(self._days)]
+        name, signature = max(bucket.items(), key=lambda item: (item[1][0], item[0]))
+        self._latest = (signature[0], name)
+
+    def update(self, path: Union[str, Path]) -> None:
+        """
+        Обновление записи ноутбука по данным с диска.
+
+        Args:
+            path: Путь к ноутбуку
+        """
+        path = Path(path)
+        if path.suffix != '.ipynb' or path.parent.resolve() != self._resolved_dir:
+            return
+        try:
+            stat = path.stat()
+        except OSError:
+            self.remove(path)
+            return
+        with self._lock:
+            self._put(path.name, (stat.st_mtime_ns, stat.st_size))
+
+    def remove(self, path: Union[str, Path]) -> None:
+        """
+        Удаление ноутбука из индекса.
+
+        Args:
+            path: Путь к ноутбуку
+        """
+        name = Path(path).name
+        with self._lock:
+            signature = self._entries.pop(name, None)
+            if signature is None:
+                return
+            self._discard(name, signature)
+            if self._latest is not None and self._latest[1] == name:
+                self._recompute_latest()
+
+    def reconcile(self) -> int:
+        """
+        Сверка индекса с содержимым каталога.
+
+        Returns:
+            int: Количество исправленных записей
+        """
+        found: Dict[str, Signature] = {}
+        try:
+            with os.scandir(self.notebooks_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.ipynb') and entry.is_file():
+                        stat = entry.stat()
+                        found[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            pass
+        fixed = 0
+        with self._lock:
+            for name in [name for name in self._entries if name not in found]:
+                self.remove(self.notebooks_dir / name)
+                fixed += 1
+            for name, signature in found.items():
+                if self._entries.get(name) != signature:
+                    self._put(name, signature)
+                    fixed += 1
+        if fixed:
+            logger.info(f"Индекс ноутбуков сверен с диском, исправлено записей: {fixed}")
+        return fixed
+
+    def latest(self) -> Optional[Path]:
+        """Последний измененный ноутбук."""
+        latest = self._latest
+        return self.notebooks_dir / latest[1] if latest else None
+
+    def for_day(self, day: date) -> Dict[Path, Signature]:
+        """
+        Ноутбуки, измененные в указанный день.
+
+        Args:
+            day: День
+
+        Returns:
+            Dict[Path, Signature]: Пути к ноутбукам и их сигнатуры
+        """
+        with self._lock:
+            bucket = dict(self._days.get(day, {}))
+        return {self.notebooks_dir / name: signature for name, signature in bucket.items()}
+
+    def today(self) -> List[Path]:
+        """Ноутбуки, измененные сегодня."""
+        return list(self.for_day(date.today()))
+
+    def load_snapshot(self) -> bool:
+        """
+        Загрузка снимка индекса.
+
+        Returns:
+            bool: True, если снимок загружен
+        """
+        if not self.snapshot_path or not self.snapshot_path.exists():
+            return False
+        try:
+            with open(self.snapshot_path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('notebooks_dir') != str(self.notebooks_dir):
+                return False
+            with self._lock:
+                for name, signature in data.get('entries', {}).items():
+                    self._put(name, tuple(signature))
+            return True
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Снимок индекса ноутбуков поврежден: {e}")
+            return False
+
+    def save_snapshot(self) -> None:
+        """Атомарное сохранение снимка индекса."""
+        if not self.snapshot_path:
+            return
+        with self._lock:
+            data = {'notebooks_dir': str(self.notebooks_dir), 'entries': dict(self._entries)}
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.snapshot_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            logger.error(f"Ошибка при сохранении снимка индекса ноутбуков: {e}")
+
+    def _run(self) -> None:
+        """Поток периодической сверки."""
+        while True:
+            try:
+                self.reconcile()
+                self.save_snapshot()
+            except Exception as e:
+                logger.error(f"Ошибка при сверке индекса ноутбуков: {e}")
+            if self._stopped.wait(self.reconcile_interval):
+                break
+
+    def start(self) -> None:
+        """Загрузка снимка и запуск отслеживания изменений."""
+        if self._thread is not None:
+            return
+        if self.load_snapshot():
+            # Запросы обслуживаются по снимку, сверка выполняется в фоне
+            logger.info(f"Индекс ноутбуков: {len(self)} записей из снимка")
+        else:
+            self.reconcile()
+        self._stopped.clear()
+        if self.use_watchdog and self.notebooks_dir.is_dir():
+            self._observer = Observer()
+            self._observer.schedule(_NotebookEventHandler(self), str(self.notebooks_dir), recursive=False)
+            self._observer.daemon = True
+            self._observer.start()
+        elif not self.use_watchdog:
+            logger.info("watchdog недоступен, индекс ноутбуков обновляется периодической сверкой")
+        self._thread = threading.Thread(target=self._run, name="notebook-index", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Остановка отслеживания и сохранение снимка."""
+        self._stopped.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.save_snapshot()
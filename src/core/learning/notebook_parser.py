@@ -2,36 +2,54 @@
 Модуль для парсинга Jupyter ноутбуков.
 """
 
-import contextlib
 import json
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 from src.utils.logger import setup_logger
 import nbformat
-from nbconvert import HTMLExporter, PythonExporter
-from src.utils.mlflow_manager import MLflowManager
+from nbconvert import PythonExporter
 from datetime import datetime
 from src.utils.database.db_manager import DatabaseManager
 from src.core.learning.learning_metrics import LearningMetrics
+from src.core.learning.notebook_index import NotebookIndex
+from src.core.learning.cell_diff import CellCache, IncrementalResult, get_cell_cache
+from src.core.learning.html_export import HtmlExportCache, get_html_export_cache
+from src.core.learning.metric_extractor import MetricExtractor, MetricHit, get_metric_extractor
+from src.core.learning.notebook_stream import NotebookStream
+from src.core.learning.plot_store import IMAGE_TYPES, PlotRef, PlotStore, get_plot_store
 
 logger = setup_logger(__name__)
 
 class NotebookParser:
     """Парсер Jupyter ноутбуков."""
 
-    def __init__(self, db_manager: Optional[DatabaseManager] = None):
+    def __init__(
+        self,
+        db_manager: Optional[DatabaseManager] = None,
+        plot_store: Optional[PlotStore] = None,
+        metric_extractor: Optional[MetricExtractor] = None,
+        html_export: Optional[HtmlExportCache] = None,
+        cell_cache: Optional[CellCache] = None
+    ):
         """Инициализация парсера.
         
         Args:
             db_manager: Менеджер базы данных
+            plot_store: Хранилище графиков (по умолчанию общее)
+            metric_extractor: Извлекатель метрик (по умолчанию - реестр DEFAULT_METRICS)
+            html_export: Кеш HTML-экспорта (по умолчанию общий)
+            cell_cache: Кеш карт ячеек для инкрементального разбора (по умолчанию общий)
         """
         self.db_manager = db_manager
         self.learning_metrics = LearningMetrics(db_manager) if db_manager else None
         self._initialized = False
         self.notebooks_dir = None
-        self.exporter = HTMLExporter()
+        self.notebook_index: Optional[NotebookIndex] = None
+        self.plot_store = plot_store or get_plot_store()
+        self.metric_extractor = metric_extractor or get_metric_extractor()
+        self.html_export = html_export or get_html_export_cache()
+        self.cell_cache = cell_cache or get_cell_cache()
         self.python_exporter = PythonExporter()
-        self.mlflow_manager = MLflowManager()
         self._cache: Dict[str, Dict[str, Any]] = {}
         
     async def initialize(self) -> None:
@@ -48,6 +66,9 @@ class NotebookParser:
     def parse_notebook(self, notebook: Union[str, Path, Dict]) -> Dict:
         """Парсинг ноутбука.
         
+        Разбор не имеет побочных эффектов: запись в MLflow выполняет
+        NotebookTracker по результату разбора.
+        
         Args:
             notebook: Путь к ноутбуку или его содержимое
             
@@ -57,49 +78,30 @@ class NotebookParser:
         try:
             if isinstance(notebook, (str, Path)):
                 notebook = nbformat.read(notebook, as_version=4)
-            
-            # Начинаем новый запуск в MLflow
-            self.mlflow_manager.start_run(run_name=f"notebook_parse_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
-            
-            # Извлекаем метрики
-            metrics = self._extract_metrics(notebook.cells)
-            if metrics:
-                self.mlflow_manager.log_metrics(metrics)
-            
-            # Извлекаем код
-            code = self._extract_code(notebook.cells)
-            
-            # Извлекаем графики
-            plots = self._extract_plots(notebook.cells)
-            
-            # Генерируем сводку
-            summary = self._generate_summary(notebook.cells)
-            
-            # Логируем параметры
-            self.mlflow_manager.log_parameters({
-                'notebook_name': notebook.metadata.get('name', 'unnamed'),
-                'cell_count': len(notebook.cells),
-                'code_cell_count': len([c for c in notebook.cells if c.cell_type == 'code']),
-                'markdown_cell_count': len([c for c in notebook.cells if c.cell_type == 'markdown'])
-            })
-            
-            # Завершаем запуск
-            self.mlflow_manager.end_run()
+            elif not isinstance(notebook, nbformat.NotebookNode):
+                notebook = nbformat.from_dict(notebook)
+            cells = notebook.get('cells', [])
+            metadata = notebook.get('metadata', {})
             
             return {
-                'cells': notebook.cells,
-                'metadata': notebook.metadata,
-                'metrics': metrics,
-                'code': code,
-                'plots': plots,
-                'summary': summary
+                'cells': cells,
+                'metadata': metadata,
+                'metrics': self._extract_metrics(cells),
+                'code': self._extract_code(cells),
+                'plots': self._extract_plots(cells),
+                'summary': self._generate_summary(cells),
+                'stats': {
+                    'cell_count': len(cells),
+                    'code_cell_count': len([c for c in cells if c.get('cell_type') == 'code']),
+                    'markdown_cell_count': len([c for c in cells if c.get('cell_type') == 'markdown'])
+                }
             }
         except Exception as e:
             logger.error(f"Ошибка при парсинге ноутбука: {e}")
             return {}
 
     def _extract_metrics(self, cells: List[Dict]) -> Dict[str, float]:
-        """Извлечение метрик из ячеек ноутбука.
+        """Извлечение метрик из кода и текстовых выводов ячеек.
         
         Args:
             cells: Список ячеек ноутбука
@@ -107,21 +109,7 @@ class NotebookParser:
         Returns:
             Dict[str, float]: Словарь с метриками
         """
-        metrics = {}
-        for cell in cells:
-            if cell.get('cell_type') == 'code':
-                source = ''.join(cell.get('source', []))
-                # Ищем метрики в коде
-                if 'accuracy' in source:
-                    with contextlib.suppress(Exception):
-                        metrics['accuracy'] = float(source.split('accuracy')[1].split('=')[1].split()[0])
-                if 'f1' in source:
-                    with contextlib.suppress(Exception):
-                        metrics['f1'] = float(source.split('f1')[1].split('=')[1].split()[0])
-                if 'loss' in source:
-                    with contextlib.suppress(Exception):
-                        metrics['loss'] = float(source.split('loss')[1].split('=')[1].split()[0])
-        return metrics
+        return self.metric_extractor.extract_dict(cells)
 
     def _extract_code(self, cells: List[Dict]) -> List[str]:
         """Извлечение кода из ячеек ноутбука.
@@ -140,26 +128,29 @@ class NotebookParser:
                     code.append(source)
         return code
 
-    def _extract_plots(self, cells: List[Dict]) -> List[Dict]:
-        """Извлечение графиков из ячеек ноутбука.
+    def _extract_plots(self, cells: List[Dict]) -> List[PlotRef]:
+        """Извлечение графиков из ячеек ноутбука в хранилище графиков.
         
         Args:
             cells: Список ячеек ноутбука
             
         Returns:
-            List[Dict]: Список графиков
+            List[PlotRef]: Ссылки на графики
         """
         plots = []
         for cell in cells:
-            if cell.get('cell_type') == 'code':
-                outputs = cell.get('outputs', [])
-                plots.extend(
-                    output['data']
-                    for output in outputs
-                    if isinstance(output, dict)
-                    and 'data' in output
-                    and 'image/png' in output['data']
-                )
+            if cell.get('cell_type') != 'code':
+                continue
+            for output in cell.get('outputs', []):
+                if not isinstance(output, dict) or 'data' not in output:
+                    continue
+                for mime in IMAGE_TYPES:
+                    if mime in output['data']:
+                        try:
+                            plots.append(self.plot_store.put_output(output['data'][mime], mime))
+                        except (OSError, ValueError) as e:
+                            logger.error(f"Ошибка при сохранении графика: {e}")
+                        break
         return plots
 
     def _generate_summary(self, cells: List[Dict]) -> str:
@@ -178,12 +169,79 @@ class NotebookParser:
                 summary.append(source)
         return '\n'.join(summary)
 
+    def read_summary(self, path: Union[str, Path]) -> str:
+        """Сводка по ноутбуку без загрузки выводов ячеек.
+
+        Args:
+            path: Путь к ноутбуку
+
+        Returns:
+            str: Сводка из markdown-ячеек
+        """
+        return self._generate_summary(list(NotebookStream(path).cells(cell_types={'markdown'})))
+
+    def parse_incremental(self, path: Union[str, Path]) -> IncrementalResult:
+        """Разбор ноутбука с повторным использованием результатов неизменных ячеек.
+
+        Args:
+            path: Путь к ноутбуку
+
+        Returns:
+            IncrementalResult: Метрики, код и сводка, а также изменения
+            с прошлого разбора и за сегодня
+        """
+        return self.cell_cache.parse(path)
+
+    def read_metrics(self, path: Union[str, Path]) -> Dict[str, float]:
+        """Метрики из кода и текстовых выводов ноутбука без загрузки картинок.
+
+        Args:
+            path: Путь к ноутбуку
+
+        Returns:
+            Dict[str, float]: Словарь с метриками
+        """
+        return self.parse_incremental(path).metrics
+
+    def read_metric_hits(self, path: Union[str, Path]) -> List[MetricHit]:
+        """Все найденные значения метрик с указанием ячейки и источника.
+
+        Args:
+            path: Путь к ноутбуку
+
+        Returns:
+            List[MetricHit]: Значения метрик
+        """
+        return self.parse_incremental(path).hits
+
+    def read_plots(self, path: Union[str, Path]) -> List[PlotRef]:
+        """Графики ноутбука; картинки читаются с диска по одной.
+
+        Args:
+            path: Путь к ноутбуку
+
+        Returns:
+            List[PlotRef]: Ссылки на графики
+        """
+        return self._extract_plots(NotebookStream(path).cells(cell_types={'code'}, outputs=True, mime_types=()))
+
+    def use_index(self, notebook_index: NotebookIndex) -> None:
+        """Использование индекса ноутбуков вместо обхода каталога.
+
+        Args:
+            notebook_index: Индекс ноутбуков
+        """
+        self.notebook_index = notebook_index
+        self.notebooks_dir = notebook_index.notebooks_dir
+
     def get_latest_notebook(self) -> Optional[Path]:
         """Получение последнего ноутбука.
         
         Returns:
             Optional[Path]: Путь к последнему ноутбуку
         """
+        if self.notebook_index is not None:
+            return self.notebook_index.latest()
         if not self.notebooks_dir:
             return None
         notebooks = list(self.notebooks_dir.glob('*.ipynb'))
@@ -198,21 +256,39 @@ class NotebookParser:
         Returns:
             Dict: Словарь с метриками
         """
+        if isinstance(notebook, (str, Path)):
+            try:
+                return self.read_metrics(notebook)
+            except (OSError, ValueError) as e:
+                logger.error(f"Ошибка при чтении метрик ноутбука: {e}")
+                return {}
         result = self.parse_notebook(notebook)
         return result.get('metrics', {})
 
-    def convert_to_html(self, notebook: Union[str, Path, Dict]) -> str:
-        """Конвертация ноутбука в HTML.
+    def convert_to_html(self, notebook: Union[str, Path, Dict], images: Optional[str] = None) -> str:
+        """Конвертация ноутбука в HTML (с кешированием результата).
         
         Args:
             notebook: Путь к ноутбуку или его содержимое
+            images: Режим картинок: inline, strip или external
+                (по умолчанию - режим кеша экспорта)
             
         Returns:
             str: HTML представление ноутбука
         """
-        if isinstance(notebook, (str, Path)):
-            notebook = nbformat.read(notebook, as_version=4)
-        return self.exporter.from_notebook_node(notebook)[0]
+        return self.html_export.export(notebook, images=images)
+
+    async def convert_many_to_html(self, notebooks: List[Path], images: Optional[str] = None) -> Dict[Path, Path]:
+        """Пакетная конвертация ноутбуков в HTML в пуле процессов.
+        
+        Args:
+            notebooks: Пути к ноутбукам
+            images: Режим картинок: inline, strip или external
+            
+        Returns:
+            Dict[Path, Path]: Ноутбук -> файл HTML в кеше
+        """
+        return await self.html_export.export_many(notebooks, images=images)
 
     async def get_today_summary(self) -> str:
         """Получение сводки за сегодня.
@@ -226,9 +302,12 @@ class NotebookParser:
 
         summaries = []
         for notebook in notebooks:
-            if data := self.parse_notebook(notebook):
-                summary = self._generate_summary(data['cells'])
-                summaries.append(f"📊 {notebook.stem}:\n{summary}")
+            try:
+                summary = self.read_summary(notebook)
+            except (OSError, ValueError) as e:
+                logger.error(f"Ошибка при чтении ноутбука {notebook.name}: {e}")
+                continue
+            summaries.append(f"📊 {notebook.stem}:\n{summary}")
 
         return "\n\n".join(summaries) if summaries else "Нет данных за сегодня"
 
@@ -238,6 +317,8 @@ class NotebookParser:
         Returns:
             List[Path]: Список путей к ноутбукам
         """
+        if self.notebook_index is not None:
+            return self.notebook_index.today()
         if not self.notebooks_dir:
             return []
 
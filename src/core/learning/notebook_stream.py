@@ -0,0 +1,323 @@
+"""
+Модуль для потокового чтения Jupyter ноутбуков.
+
+nbformat.read загружает весь .ipynb в память, включая base64-картинки
+в выводах ячеек, даже если нужен только markdown для сводки или код
+для метрик. Потоковый читатель проходит файл блоками, разбирает ячейки
+по одной и материализует только запрошенные поля. Пропускаемые значения
+не декодируются (конец строки ищется поиском байт в блоке), а данные выводов неуказанных типов (картинки, HTML)
+возвращаются как ленивые диапазоны байт в файле.
+
+Поддерживается формат nbformat 4. Значения полей возвращаются в том виде,
+в каком они записаны в файле: source и text могут быть строкой или
+списком строк.
+"""
+import base64
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Collection, Dict, Iterator, List, Optional, Tuple, Union
+
+# Размер блока чтения по умолчанию
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Поля ячейки, которые материализуются (outputs - по запросу)
+CELL_FIELDS = frozenset({'cell_type', 'execution_count', 'id', 'metadata', 'source'})
+
+# Символы, меняющие вложенность при пропуске контейнера
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_WHITESPACE = b' \t\r\n'
+_VALUE_END = b',]} \t\r\n'
+
+
+class NotebookStreamError(ValueError):
+    """Ошибка потокового разбора ноутбука."""
+
+
+@dataclass(frozen=True)
+class LazyOutput:
+    """Значение вывода ячейки, читаемое из файла по запросу."""
+    path: Path
+    offset: int
+    length: int
+
+    def raw(self) -> bytes:
+        """JSON-представление значения в файле."""
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            return f.read(self.length)
+
+    def load(self) -> str:
+        """Значение (список строк склеивается)."""
+        value = json.loads(self.raw())
+        return ''.join(value) if isinstance(value, list) else value
+
+    def decode_base64(self) -> bytes:
+        """Декодированные бинарные данные (например, image/png)."""
+        return base64.b64decode(self.load())
+
+
+class _Reader:
+    """Побайтовый разбор JSON с буфером ограниченного размера."""
+
+    def __init__(self, f: BinaryIO, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = bytearray()
+        self.pos = 0
+        self.base = 0
+        self.mark: Optional[int] = None
+        self.eof = False
+
+    @property
+    def offset(self) -> int:
+        """Позиция в файле."""
+        return self.base + self.pos
+
+    def _fill(self) -> bool:
+        """Чтение следующего блока с отбрасыванием разобранных данных."""
+        if self.eof:
+            return False
+        keep = self.pos if self.mark is None else self.mark
+        if keep:
+            del self.buf[:keep]
+            self.base += keep
+            self.pos -= keep
+            if self.mark is not None:
+                self.mark = 0
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf += chunk
+        return True
+
+    def _more(self) -> None:
+        if not self._fill():
+            raise NotebookStreamError(f"Неожиданный конец файла на позиции {self.offset}")
+
+    def peek(self) -> int:
+        """Следующий значимый байт (без продвижения)."""
+        while True:
+            while self.pos < len(self.buf):
+                c = self.buf[self.pos]
+                if c not in _WHITESPACE:
+                    return c
+                self.pos += 1
+            self._more()
+
+    def expect(self, char: bytes) -> None:
+        """Проверка и пропуск ожидаемого символа."""
+        if self.peek() != char[0]:
+            raise NotebookStreamError(f"Ожидался символ {char.decode()} на позиции {self.offset}")
+        self.pos += 1
+
+    def _skip_string(self) -> None:
+        self.pos += 1
+        while True:
+            quote = self.buf.find(b'"', self.pos)
+            if quote < 0:
+                # Экранирующий символ в конце блока должен остаться в буфере
+                escape = self.buf.find(b'\\', self.pos)
+                while 0 <= escape < len(self.buf) - 1:
+                    escape = self.buf.find(b'\\', escape + 2)
+                self.pos = escape if escape >= 0 else len(self.buf)
+                self._more()
+                continue
+            escape = self.buf.find(b'\\', self.pos, quote)
+            if escape < 0:
+                self.pos = quote + 1
+                return
+            if escape + 1 >= len(self.buf):
+                self.pos = escape
+                self._more()
+                continue
+            self.pos = escape + 2
+
+    def skip_value(self) -> None:
+        """Пропуск значения без декодирования."""
+        c = self.peek()
+        if c == 0x22:
+            self._skip_string()
+            return
+        if c in b'[{':
+            depth = 0
+            while True:
+                match = _STRUCTURAL.search(self.buf, self.pos)
+                if match is None:
+                    self.pos = len(self.buf)
+                    self._more()
+                    continue
+                self.pos = match.start()
+                c = self.buf[self.pos]
+                if c == 0x22:
+                    self._skip_string()
+                    continue
+                self.pos += 1
+                if c in b'[{':
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        return
+        # Число или литерал
+        while True:
+            while self.pos < len(self.buf):
+                if self.buf[self.pos] in _VALUE_END:
+                    return
+                self.pos += 1
+            if not self._fill():
+                return
+
+    def span(self) -> Tuple[int, int]:
+        """Пропуск значения с возвратом его диапазона байт в файле."""
+        self.peek()
+        start = self.offset
+        self.skip_value()
+        return start, self.offset
+
+    def value(self) -> Any:
+        """Разбор значения целиком."""
+        self.peek()
+        self.mark = self.pos
+        try:
+            self.skip_value()
+            data = bytes(self.buf[self.mark:self.pos])
+        finally:
+            self.mark = None
+        return json.loads(data)
+
+    def _separator(self, close: int) -> bool:
+        """Разделитель элементов; True - контейнер закончился."""
+        c = self.peek()
+        self.pos += 1
+        if c == close:
+            return True
+        if c != 0x2C:
+            raise NotebookStreamError(f"Ожидалась запятая на позиции {self.offset - 1}")
+        return False
+
+    def iter_object(self) -> Iterator[str]:
+        """Ключи объекта; значение ключа читает или пропускает вызывающий."""
+        self.expect(b'{')
+        if self.peek() == 0x7D:
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(b':')
+            yield key
+            if self._separator(0x7D):
+                return
+
+    def iter_array(self) -> Iterator[None]:
+        """Элементы массива; элемент читает или пропускает вызывающий."""
+        self.expect(b'[')
+        if self.peek() == 0x5D:
+            self.pos += 1
+            return
+        while True:
+            yield None
+            if self._separator(0x5D):
+                return
+
+
+class NotebookStream:
+    """Потоковое чтение ячеек ноутбука без загрузки файла целиком."""
+
+    def __init__(self, path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Инициализация читателя.
+
+        Args:
+            path: Путь к ноутбуку
+            chunk_size: Размер блока чтения (байт)
+        """
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+
+    def _read_outputs(self, reader: _Reader, mime_types: Collection[str]) -> List[Dict[str, Any]]:
+        """Выводы ячейки: данные неуказанных типов остаются в файле."""
+        outputs = []
+        for _ in reader.iter_array():
+            output: Dict[str, Any] = {}
+            for key in reader.iter_object():
+                if key != 'data':
+                    output[key] = reader.value()
+                    continue
+                data: Dict[str, Any] = {}
+                for mime in reader.iter_object():
+                    if mime in mime_types:
+                        data[mime] = reader.value()
+                    else:
+                        start, end = reader.span()
+                        data[mime] = LazyOutput(self.path, start, end - start)
+                output['data'] = data
+            outputs.append(output)
+        return outputs
+
+    def _read_cell(
+        self,
+        reader: _Reader,
+        cell_types: Optional[Collection[str]],
+        outputs: bool,
+        mime_types: Collection[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Разбор одной ячейки; None, если тип ячейки не запрошен."""
+        cell: Dict[str, Any] = {}
+        for key in reader.iter_object():
+            if key == 'cell_type':
+                cell[key] = reader.value()
+            elif cell_types is not None and 'cell_type' in cell and cell['cell_type'] not in cell_types:
+                reader.skip_value()
+            elif key == 'outputs' and outputs:
+                cell[key] = self._read_outputs(reader, mime_types)
+            elif key in CELL_FIELDS:
+                cell[key] = reader.value()
+            else:
+                reader.skip_value()
+        if cell_types is not None and cell.get('cell_type') not in cell_types:
+            return None
+        return cell
+
+    def cells(
+        self,
+        cell_types: Optional[Collection[str]] = None,
+        outputs: bool = False,
+        mime_types: Collection[str] = ('text/plain',)
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Ячейки ноутбука по одной.
+
+        Args:
+            cell_types: Типы ячеек (None - все); остальные ячейки пропускаются
+            outputs: Читать выводы ячеек
+            mime_types: Типы данных выводов, которые материализуются;
+                остальные возвращаются как LazyOutput
+
+        Yields:
+            Dict[str, Any]: Ячейка с полями cell_type, source, metadata и др.
+        """
+        with open(self.path, 'rb') as f:
+            reader = _Reader(f, self.chunk_size)
+            for key in reader.iter_object():
+                if key != 'cells':
+                    reader.skip_value()
+                    continue
+                for _ in reader.iter_array():
+                    cell = self._read_cell(reader, cell_types, outputs, mime_types)
+                    if cell is not None:
+                        yield cell
+                # Остаток файла (метаданные ноутбука) не нужен
+                return
+
+    def metadata(self) -> Dict[str, Any]:
+        """Метаданные ноутбука (ячейки пропускаются без декодирования)."""
+        with open(self.path, 'rb') as f:
+            reader = _Reader(f, self.chunk_size)
+            for key in reader.iter_object():
+                if key == 'metadata':
+                    return reader.value()
+                reader.skip_value()
+        return {}
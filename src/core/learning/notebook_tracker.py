@@ -0,0 +1,156 @@
+"""
+Модуль для отправки результатов разбора ноутбуков в MLflow.
+
+Разбор ноутбуков не имеет побочных эффектов; запись в MLflow вынесена
+в отдельный необязательный этап. Результаты накапливаются в буфере
+и периодически записываются пачкой в один запуск MLflow в отдельном
+потоке, не блокируя цикл событий.
+"""
+import asyncio
+import re
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from src.utils.logger import setup_logger
+from src.utils.mlflow_manager import MLflowManager
+
+logger = setup_logger(__name__)
+
+# Максимальное количество ноутбуков, ожидающих записи
+MAX_PENDING_NOTEBOOKS = 1000
+
+# Символы, недопустимые в именах метрик MLflow
+_METRIC_KEY_INVALID = re.compile(r'[^\w\-. /]')
+
+
+def metric_key(notebook: str, metric: str) -> str:
+    """Имя метрики ноутбука в общем запуске."""
+    return _METRIC_KEY_INVALID.sub('_', f"{notebook}/{metric}")
+
+
+class NotebookTracker:
+    """Пакетная запись метрик ноутбуков в MLflow."""
+
+    def __init__(
+        self,
+        mlflow_manager: Optional[MLflowManager] = None,
+        batch_size: int = 50,
+        flush_interval: float = 60.0
+    ):
+        """
+        Инициализация трекера.
+
+        Args:
+            mlflow_manager: Менеджер MLflow (по умолчанию создается
+                при первой записи)
+            batch_size: Количество ноутбуков, при котором запись начинается досрочно
+            flush_interval: Интервал записи буфера (секунды)
+        """
+        self.mlflow_manager = mlflow_manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def track(self, name: str, metrics: Dict[str, Any], stats: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Постановка метрик ноутбука в очередь на запись.
+
+        Повторная постановка того же ноутбука до записи заменяет значения.
+
+        Args:
+            name: Имя ноутбука
+            metrics: Метрики ноутбука
+            stats: Числовые характеристики ноутбука (количество ячеек и т.п.)
+        """
+        values = {
+            key: float(value)
+            for key, value in {**(stats or {}), **metrics}.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        }
+        self._pending.pop(name, None)
+        self._pending[name] = values
+        while len(self._pending) > MAX_PENDING_NOTEBOOKS:
+            dropped, _ = self._pending.popitem(last=False)
+            logger.warning(f"Буфер MLflow переполнен, метрики ноутбука {dropped} отброшены")
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    def track_result(self, name: str, result: Dict[str, Any]) -> None:
+        """
+        Постановка результата parse_notebook в очередь на запись.
+
+        Args:
+            name: Имя ноутбука
+            result: Результат разбора
+        """
+        if result:
+            self.track(name, result.get('metrics', {}), result.get('stats'))
+
+    def _log_batch(self, batch: Dict[str, Dict[str, float]]) -> None:
+        """Запись пачки ноутбуков в один запуск MLflow (выполняется в потоке)."""
+        if self.mlflow_manager is None:
+            self.mlflow_manager = MLflowManager()
+        manager = self.mlflow_manager
+        manager.start_run(run_name=f"notebooks_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        try:
+            metrics = {
+                metric_key(name, metric): value
+                for name, values in batch.items()
+                for metric, value in values.items()
+            }
+            if metrics:
+                manager.log_metrics(metrics)
+            manager.log_parameters({
+                'notebook_count': len(batch),
+                'notebooks': ', '.join(batch)[:500],
+            })
+        finally:
+            manager.end_run()
+
+    async def flush(self) -> int:
+        """
+        Запись накопленных ноутбуков одним запуском MLflow.
+
+        Returns:
+            int: Количество записанных ноутбуков
+        """
+        if not self._pending:
+            return 0
+        batch = dict(self._pending)
+        self._pending.clear()
+        self._wakeup.clear()
+        try:
+            await asyncio.to_thread(self._log_batch, batch)
+        except Exception as e:
+            logger.error(f"Ошибка при записи метрик ноутбуков в MLflow: {e}")
+            return 0
+        logger.info(f"Метрики ноутбуков записаны в MLflow: {len(batch)}")
+        return len(batch)
+
+    async def _flush_loop(self) -> None:
+        """Периодическая запись буфера."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    def start(self) -> None:
+        """Запуск фоновой записи."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Остановка фоновой записи с записью оставшихся данных."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
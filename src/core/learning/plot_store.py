@@ -0,0 +1,201 @@
+"""
+Модуль для хранения графиков из ноутбуков.
+
+Картинки из выводов ячеек декодируются один раз и сохраняются на диск
+под именем, равным SHA-256 содержимого, поэтому одинаковые графики
+из разных ноутбуков хранятся в одном экземпляре. Результаты разбора
+ноутбука содержат только ссылки (PlotRef). После первой отправки графика
+в Telegram запоминается его file_id, и повторно тот же график не загружается.
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from telegram.error import BadRequest
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Каталог хранилища по умолчанию
+DEFAULT_STORE_DIR = Path("data") / "cache" / "plots"
+
+# Типы картинок в выводах ноутбуков (base64) и расширения файлов
+IMAGE_TYPES = {
+    'image/png': '.png',
+    'image/jpeg': '.jpg',
+    'image/gif': '.gif',
+}
+
+
+@dataclass(frozen=True)
+class PlotRef:
+    """Ссылка на график в хранилище."""
+    digest: str
+    mime: str
+    path: Path
+    size: int
+
+    def read_bytes(self) -> bytes:
+        """Содержимое графика."""
+        return self.path.read_bytes()
+
+
+class PlotStore:
+    """Контентно-адресуемое хранилище графиков с кешем file_id Telegram."""
+
+    def __init__(self, root: Union[str, Path] = DEFAULT_STORE_DIR):
+        """
+        Инициализация хранилища.
+
+        Args:
+            root: Каталог хранилища
+        """
+        self.root = Path(root)
+        self.file_ids_path = self.root / "file_ids.json"
+        self._file_ids: Optional[Dict[str, str]] = None
+        self._lock = threading.Lock()
+
+    def _path(self, digest: str, mime: str) -> Path:
+        return self.root / digest[:2] / f"{digest}{IMAGE_TYPES.get(mime, '.bin')}"
+
+    def put(self, data: bytes, mime: str = 'image/png') -> PlotRef:
+        """
+        Сохранение графика (повторное сохранение того же содержимого - без записи).
+
+        Args:
+            data: Содержимое графика
+            mime: Тип содержимого
+
+        Returns:
+            PlotRef: Ссылка на график
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest, mime)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        return PlotRef(digest, mime, path, len(data))
+
+    def put_output(self, value: Any, mime: str = 'image/png') -> PlotRef:
+        """
+        Сохранение графика из вывода ячейки.
+
+        Args:
+            value: Значение base64 из ноутбука: строка, список строк
+                или ленивое значение (LazyOutput)
+            mime: Тип содержимого
+
+        Returns:
+            PlotRef: Ссылка на график
+        """
+        if hasattr(value, 'decode_base64'):
+            data = value.decode_base64()
+        else:
+            data = base64.b64decode(''.join(value) if isinstance(value, list) else value)
+        return self.put(data, mime)
+
+    def get(self, digest: str) -> Optional[PlotRef]:
+        """
+        Поиск графика по хешу.
+
+        Args:
+            digest: SHA-256 содержимого
+
+        Returns:
+            Optional[PlotRef]: Ссылка на график
+        """
+        for mime in IMAGE_TYPES:
+            path = self._path(digest, mime)
+            if path.exists():
+                return PlotRef(digest, mime, path, path.stat().st_size)
+        return None
+
+    def _load_file_ids(self) -> Dict[str, str]:
+        """Кеш file_id (под блокировкой)."""
+        if self._file_ids is None:
+            try:
+                with open(self.file_ids_path, encoding='utf-8') as f:
+                    self._file_ids = json.load(f)
+            except FileNotFoundError:
+                self._file_ids = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Кеш file_id графиков поврежден: {e}")
+                self._file_ids = {}
+        return self._file_ids
+
+    def get_file_id(self, digest: str) -> Optional[str]:
+        """
+        file_id ранее отправленного графика.
+
+        Args:
+            digest: SHA-256 содержимого
+
+        Returns:
+            Optional[str]: file_id в Telegram
+        """
+        with self._lock:
+            return self._load_file_ids().get(digest)
+
+    def set_file_id(self, digest: str, file_id: str) -> None:
+        """
+        Сохранение file_id отправленного графика.
+
+        Args:
+            digest: SHA-256 содержимого
+            file_id: file_id в Telegram
+        """
+        with self._lock:
+            file_ids = self._load_file_ids()
+            file_ids[digest] = file_id
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.file_ids_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(file_ids, f)
+            os.replace(tmp_path, self.file_ids_path)
+
+    async def send(self, bot: Any, chat_id: Union[int, str], plot: PlotRef, caption: Optional[str] = None) -> Any:
+        """
+        Отправка графика с повторным использованием file_id.
+
+        Args:
+            bot: Экземпляр бота
+            chat_id: ID чата
+            plot: Ссылка на график
+            caption: Подпись
+
+        Returns:
+            Any: Отправленное сообщение
+        """
+        file_id = self.get_file_id(plot.digest)
+        if file_id is not None:
+            try:
+                return await bot.send_photo(chat_id=chat_id, photo=file_id, caption=caption)
+            except BadRequest as e:
+                logger.warning(f"file_id графика {plot.digest[:12]} недействителен, загружаем заново: {e}")
+        with open(plot.path, 'rb') as f:
+            message = await bot.send_photo(chat_id=chat_id, photo=f, caption=caption)
+        if message is not None and getattr(message, 'photo', None):
+            # Самый крупный размер фотографии - последний
+            await asyncio.to_thread(self.set_file_id, plot.digest, message.photo[-1].file_id)
+        return message
+
+
+_store: Optional[PlotStore] = None
+
+
+def get_plot_store() -> PlotStore:
+    """Получение экземпляра хранилища графиков."""
+    global _store
+    if _store is None:
+        _store = PlotStore()
+    return _store
@@ -4,5 +4,7 @@
 
 from .post_manager import PostManager
 from .post_scheduler import PostScheduler
+from .post_queue import PostQueue
+from .evening_draft import EveningDraft
 
-__all__ = ['PostManager', 'PostScheduler'] 
\ No newline at end of file
+__all__ = ['PostManager', 'PostScheduler', 'PostQueue', 'EveningDraft'] 
\ No newline at end of file
@@ -0,0 +1,195 @@
+"""
+Модуль для заблаговременной подготовки вечернего поста.
+
+В течение дня фоновая задача отслеживает сегодняшние ноутбуки и заново
+разбирает и суммаризирует только изменившиеся (по времени изменения
+и размеру файла). Готовый черновик поста обновляется после каждого
+изменения, поэтому в момент публикации остается лишь проверить,
+не изменились ли файлы с последнего обновления, и отправить черновик.
+Тяжелая работа (разбор ноутбуков, суммаризация) выполняется в потоках,
+а не в цикле событий.
+"""
+import asyncio
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from src.core.learning.notebook_index import NotebookIndex
+from src.core.learning.notebook_tracker import NotebookTracker
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Текст поста, если за день нет ноутбуков
+NO_DATA_SUMMARY = "Нет данных за сегодня"
+
+
+@dataclass
+class _NotebookSummary:
+    """Закешированная сводка по ноутбуку."""
+    signature: Tuple[int, int]
+    name: str
+    summary: str
+
+
+class EveningDraft:
+    """Черновик вечернего поста, обновляемый по мере изменения ноутбуков."""
+
+    def __init__(
+        self,
+        notebook_parser: Any,
+        post_manager: Any,
+        notebooks_dir: Union[str, Path],
+        achievements: str = "",
+        summarize: Optional[Callable[[str], Optional[str]]] = None,
+        refresh_interval: float = 60.0,
+        notebook_index: Optional[NotebookIndex] = None,
+        tracker: Optional[NotebookTracker] = None
+    ):
+        """
+        Инициализация черновика.
+
+        Args:
+            notebook_parser: Парсер ноутбуков (read_summary)
+            post_manager: Менеджер постов (generate_evening_post)
+            notebooks_dir: Каталог с ноутбуками
+            achievements: Достижения за день
+            summarize: Синхронная функция суммаризации текста (например, BART);
+                выполняется в потоке. По умолчанию - сводка из markdown-ячеек
+            refresh_interval: Интервал проверки изменений ноутбуков (секунды)
+            notebook_index: Индекс ноутбуков (без него каталог обходится при каждой проверке)
+            tracker: Трекер MLflow для метрик изменившихся ноутбуков (read_metrics парсера)
+        """
+        self.notebook_parser = notebook_parser
+        self.post_manager = post_manager
+        self.notebooks_dir = Path(notebooks_dir)
+        self.achievements = achievements
+        self.summarize = summarize
+        self.refresh_interval = refresh_interval
+        self.notebook_index = notebook_index
+        self.tracker = tracker
+        self.draft: Optional[str] = None
+        self.draft_date: Optional[date] = None
+        self.updated_at: Optional[datetime] = None
+        self._summaries: Dict[Path, _NotebookSummary] = {}
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def _scan(self, today: date) -> Dict[Path, Tuple[int, int]]:
+        """Сегодняшние ноутбуки и их сигнатуры (mtime, размер)."""
+        if self.notebook_index is not None:
+            return self.notebook_index.for_day(today)
+        notebooks = {}
+        if not self.notebooks_dir.is_dir():
+            return notebooks
+        for path in self.notebooks_dir.glob('*.ipynb'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if datetime.fromtimestamp(stat.st_mtime).date() == today:
+                notebooks[path] = (stat.st_mtime_ns, stat.st_size)
+        return notebooks
+
+    def _summarize_notebook(self, path: Path) -> Optional[str]:
+        """Разбор и суммаризация одного ноутбука (выполняется в потоке)."""
+        summary = self.notebook_parser.read_summary(path)
+        if self.summarize and summary.strip():
+            summary = self.summarize(summary) or summary
+        return summary
+
+    async def refresh(self, today: Optional[date] = None) -> bool:
+        """
+        Обновление черновика с разбором только изменившихся ноутбуков.
+
+        Args:
+            today: Дата поста (по умолчанию - сегодня)
+
+        Returns:
+            bool: True, если черновик был перестроен
+        """
+        today = today or date.today()
+        async with self._lock:
+            notebooks = await asyncio.to_thread(self._scan, today)
+            changed = [
+                path for path, signature in notebooks.items()
+                if path not in self._summaries or self._summaries[path].signature != signature
+            ]
+            removed = [path for path in self._summaries if path not in notebooks]
+            for path in removed:
+                del self._summaries[path]
+
+            for path in changed:
+                try:
+                    summary = await asyncio.to_thread(self._summarize_notebook, path)
+                    if self.tracker is not None:
+                        metrics = await asyncio.to_thread(self.notebook_parser.read_metrics, path)
+                        self.tracker.track(path.stem, metrics)
+                except Exception as e:
+                    logger.error(f"Ошибка при подготовке сводки {path.name}: {e}")
+                    continue
+                if summary is not None:
+                    self._summaries[path] = _NotebookSummary(notebooks[path], path.stem, summary)
+
+            if not changed and not removed and self.draft is not None and self.draft_date == today:
+                return False
+
+            await self._render(today)
+            logger.info(
+                f"Черновик вечернего поста обновлен: ноутбуков {len(self._summaries)}, "
+                f"разобрано заново {len(changed)}"
+            )
+            return True
+
+    async def _render(self, today: date) -> None:
+        """Рендеринг черновика из закешированных сводок."""
+        notebooks: List[Dict[str, str]] = [
+            {'name': item.name, 'summary': item.summary}
+            for _, item in sorted(self._summaries.items(), key=lambda pair: pair[0].name)
+        ]
+        summary = "\n\n".join(f"📊 {n['name']}:\n{n['summary']}" for n in notebooks) or NO_DATA_SUMMARY
+        self.draft = await self.post_manager.generate_evening_post(
+            summary,
+            self.achievements,
+            notebooks=notebooks or None
+        )
+        self.draft_date = today
+        self.updated_at = datetime.now()
+
+    async def get_post(self) -> str:
+        """
+        Получение готового поста для публикации.
+
+        Перед отправкой проверяются только сигнатуры файлов: ноутбуки,
+        изменившиеся после последнего обновления, разбираются заново.
+
+        Returns:
+            str: Текст вечернего поста
+        """
+        await self.refresh()
+        return self.draft
+
+    async def _run(self) -> None:
+        """Фоновое обновление черновика."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Ошибка при обновлении черновика вечернего поста: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self) -> None:
+        """Запуск фонового обновления черновика."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановка фонового обновления."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -3,18 +3,28 @@
 """
 from datetime import datetime
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from src.config.templates import POST_TEMPLATES
 from src.utils.mlflow_manager import MLflowManager
+from src.utils.templates import TemplateEngine, get_template_engine
+from src.core.posts.post_queue import PostQueue
 
 logger = logging.getLogger(__name__)
 
 class PostManager:
     """Менеджер постов для бота."""
 
-    def __init__(self):
-        """Инициализация менеджера постов."""
+    def __init__(self, engine: Optional[TemplateEngine] = None, post_queue: Optional[PostQueue] = None):
+        """
+        Инициализация менеджера постов.
+
+        Args:
+            engine: Движок шаблонов (по умолчанию - общий экземпляр)
+            post_queue: Очередь отложенных постов
+        """
         self.mlflow_manager = MLflowManager()
+        self.engine = engine or get_template_engine()
+        self.post_queue = post_queue
 
     async def generate_morning_post(self, plan: str, goals: str) -> str:
         """
@@ -32,7 +42,8 @@ class PostManager:
             self.mlflow_manager.start_run(run_name="generate_morning_post")
 
             # Генерируем пост
-            post = POST_TEMPLATES['morning'].format(
+            post = self.engine.render(
+                POST_TEMPLATES['morning'],
                 plan=plan,
                 goals=goals
             )
@@ -52,13 +63,20 @@ class PostManager:
             self.mlflow_manager.end_run()
             return "Ошибка при генерации поста"
 
-    async def generate_evening_post(self, summary: str, achievements: str) -> str:
+    async def generate_evening_post(
+        self,
+        summary: str,
+        achievements: str,
+        notebooks: Optional[List[Dict[str, str]]] = None
+    ) -> str:
         """
         Генерация вечернего поста.
         
         Args:
             summary: Сводка за день
             achievements: Достижения за день
+            notebooks: Сводки по ноутбукам (name, summary); если переданы,
+                выводятся списком вместо summary
             
         Returns:
             str: Сгенерированный пост
@@ -68,9 +86,11 @@ class PostManager:
             self.mlflow_manager.start_run(run_name="generate_evening_post")
 
             # Генерируем пост
-            post = POST_TEMPLATES['evening'].format(
+            post = self.engine.render(
+                POST_TEMPLATES['evening'],
                 summary=summary,
-                achievements=achievements
+                achievements=achievements,
+                notebooks=notebooks
             )
 
             # Логируем метрики
@@ -88,34 +108,32 @@ class PostManager:
             self.mlflow_manager.end_run()
             return "Ошибка при генерации поста"
 
-    async def schedule_post(self, post: str, time: datetime) -> bool:
+    async def schedule_post(
+        self,
+        post: str,
+        time: datetime,
+        chat_id: Optional[str] = None,
+        parse_mode: Optional[str] = 'HTML'
+    ) -> bool:
         """
         Планирование поста на определенное время.
         
         Args:
             post: Текст поста
             time: Время публикации
+            chat_id: Чат для публикации (по умолчанию - канал очереди)
+            parse_mode: Режим разметки
             
         Returns:
             bool: Успешность планирования
         """
+        if self.post_queue is None:
+            logger.error("Очередь постов не настроена")
+            return False
         try:
-            # Начинаем новый запуск в MLflow
-            self.mlflow_manager.start_run(run_name="schedule_post")
-
-            # Здесь будет логика планирования поста
-            # Например, сохранение в базу данных или очередь
-
-            # Логируем метрики
-            self.mlflow_manager.log_metrics({
-                "post_scheduled": 1.0
-            })
-
-            # Завершаем запуск
-            self.mlflow_manager.end_run()
-
+            post_id = await self.post_queue.schedule(post, time, chat_id=chat_id, parse_mode=parse_mode)
+            logger.info(f"Пост {post_id} запланирован на {time}")
             return True
         except Exception as e:
             logger.error(f"Ошибка при планировании поста: {e}")
-            self.mlflow_manager.end_run()
             return False 
\ No newline at end of file
@@ -0,0 +1,367 @@
+"""
+Модуль для хранения и публикации отложенных постов.
+
+Посты хранятся в таблице scheduled_posts и переживают перезапуск бота.
+Планировщик не опрашивает базу: он спит до времени ближайшего поста
+(или до постановки нового поста в этом процессе). Публикуемый пост
+захватывается одним атомарным UPDATE ... RETURNING, поэтому несколько
+процессов бота могут обслуживать одну очередь без двойной публикации.
+Гарантия доставки - "хотя бы один раз": если процесс упал после отправки,
+но до отметки об успехе, пост будет повторен после истечения аренды.
+"""
+import asyncio
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.utils.database.db_manager import DatabaseManager
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Статусы постов в очереди
+STATUS_PENDING = "pending"
+STATUS_CLAIMED = "claimed"
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+STATUS_EXPIRED = "expired"
+
+# Формат времени в базе данных (UTC, совпадает с CURRENT_TIMESTAMP)
+DB_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def to_db_time(value: datetime) -> str:
+    """Преобразование времени в строку UTC для базы данных.
+
+    Время без часового пояса считается локальным.
+    """
+    return value.astimezone(timezone.utc).strftime(DB_TIME_FORMAT)
+
+
+def from_db_time(value: str) -> datetime:
+    """Преобразование строки UTC из базы данных во время."""
+    return datetime.strptime(value, DB_TIME_FORMAT).replace(tzinfo=timezone.utc)
+
+
+class PostQueue:
+    """Персистентная очередь отложенных постов."""
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        sender: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+        default_chat_id: Optional[str] = None,
+        worker_id: Optional[str] = None,
+        catchup_window: timedelta = timedelta(hours=1),
+        lease: timedelta = timedelta(minutes=10),
+        max_attempts: int = 3,
+        retry_delay: timedelta = timedelta(minutes=1),
+        max_sleep: float = 300.0
+    ):
+        """
+        Инициализация очереди.
+
+        Args:
+            db_manager: Менеджер базы данных
+            sender: Корутина публикации поста (получает строку scheduled_posts)
+            default_chat_id: Чат по умолчанию для schedule()
+            worker_id: Идентификатор процесса (по умолчанию host:pid)
+            catchup_window: Насколько поздно еще допустимо опубликовать пропущенный пост
+            lease: Время, после которого захваченный упавшим процессом пост возвращается в очередь
+            max_attempts: Максимальное количество попыток публикации
+            retry_delay: Задержка перед повторной попыткой (умножается на номер попытки)
+            max_sleep: Максимальное время сна, чтобы заметить посты других процессов (секунды)
+        """
+        self.db_manager = db_manager
+        self.sender = sender
+        self.default_chat_id = default_chat_id
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.catchup_window = catchup_window
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.max_sleep = max_sleep
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._initialized = False
+
+    async def initialize(self) -> None:
+        """Создание таблицы очереди."""
+        if self._initialized:
+            return
+        try:
+            async with self.db_manager.get_connection() as conn:
+                await conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS scheduled_posts (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        chat_id TEXT NOT NULL,
+                        post_type TEXT NOT NULL DEFAULT 'custom',
+                        text TEXT,
+                        parse_mode TEXT,
+                        due_at TIMESTAMP NOT NULL,
+                        status TEXT NOT NULL DEFAULT 'pending',
+                        dedup_key TEXT UNIQUE,
+                        attempts INTEGER NOT NULL DEFAULT 0,
+                        claimed_by TEXT,
+                        claimed_at TIMESTAMP,
+                        sent_at TIMESTAMP,
+                        error TEXT,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                    """
+                )
+                await conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_scheduled_posts_due ON scheduled_posts(status, due_at)"
+                )
+                await conn.commit()
+            self._initialized = True
+            logger.info("PostQueue успешно инициализирован")
+        except Exception as e:
+            logger.error(f"Ошибка при инициализации PostQueue: {e}")
+            raise
+
+    @staticmethod
+    def _now() -> datetime:
+        """Текущее время UTC."""
+        return datetime.now(timezone.utc)
+
+    async def schedule(
+        self,
+        text: Optional[str],
+        due_at: datetime,
+        chat_id: Optional[str] = None,
+        parse_mode: Optional[str] = None,
+        post_type: str = "custom",
+        dedup_key: Optional[str] = None
+    ) -> Optional[int]:
+        """
+        Постановка поста в очередь.
+
+        Args:
+            text: Текст поста (None - текст формируется при публикации по post_type)
+            due_at: Время публикации
+            chat_id: Чат для публикации (по умолчанию default_chat_id)
+            parse_mode: Режим разметки
+            post_type: Тип поста
+            dedup_key: Ключ уникальности (повторная постановка с тем же ключом игнорируется)
+
+        Returns:
+            Optional[int]: ID поста или None, если пост с таким ключом уже есть
+        """
+        chat_id = chat_id or self.default_chat_id
+        if not chat_id:
+            raise ValueError("Не указан чат для публикации поста")
+        async with self.db_manager.get_connection() as conn:
+            cursor = await conn.execute(
+                """
+                INSERT OR IGNORE INTO scheduled_posts (
+                    chat_id, post_type, text, parse_mode, due_at, dedup_key
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (str(chat_id), post_type, text, parse_mode, to_db_time(due_at), dedup_key)
+            )
+            await conn.commit()
+        if not cursor.rowcount:
+            return None
+        # Будим планировщик: новый пост может оказаться ближайшим
+        self._wakeup.set()
+        return cursor.lastrowid
+
+    async def cancel(self, post_id: int) -> bool:
+        """Отмена еще не опубликованного поста."""
+        async with self.db_manager.get_connection() as conn:
+            cursor = await conn.execute(
+                "DELETE FROM scheduled_posts WHERE id = ? AND status = ?",
+                (post_id, STATUS_PENDING)
+            )
+            await conn.commit()
+        return cursor.rowcount > 0
+
+    async def get_pending(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Получение ожидающих публикации постов в порядке времени."""
+        async with self.db_manager.get_connection() as conn:
+            async with conn.execute(
+                "SELECT * FROM scheduled_posts WHERE status = ? ORDER BY due_at, id LIMIT ?",
+                (STATUS_PENDING, limit)
+            ) as cursor:
+                return [dict(row) for row in await cursor.fetchall()]
+
+    async def catch_up(self) -> int:
+        """
+        Обработка постов, пропущенных за время простоя.
+
+        Посты, опоздавшие больше чем на catchup_window, помечаются как
+        просроченные; остальные будут опубликованы в ближайшем цикле.
+        Захваченные упавшими процессами посты возвращаются в очередь.
+
+        Returns:
+            int: Количество просроченных постов
+        """
+        now = self._now()
+        await self._release_stale_claims(now)
+        async with self.db_manager.get_connection() as conn:
+            cursor = await conn.execute(
+                """
+                UPDATE scheduled_posts SET status = ?, error = 'missed publishing window'
+                WHERE status = ? AND due_at < ?
+                """,
+                (STATUS_EXPIRED, STATUS_PENDING, to_db_time(now - self.catchup_window))
+            )
+            await conn.commit()
+            async with conn.execute(
+                "SELECT COUNT(*) AS late FROM scheduled_posts WHERE status = ? AND due_at <= ?",
+                (STATUS_PENDING, to_db_time(now))
+            ) as late_cursor:
+                late = (await late_cursor.fetchone())['late']
+        if cursor.rowcount:
+            logger.warning(f"Пропущено постов (окно публикации истекло): {cursor.rowcount}")
+        if late:
+            logger.info(f"Постов к публикации с опозданием: {late}")
+        return cursor.rowcount
+
+    async def _release_stale_claims(self, now: datetime) -> None:
+        """Возврат в очередь постов, аренда которых истекла."""
+        async with self.db_manager.get_connection() as conn:
+            await conn.execute(
+                """
+                UPDATE scheduled_posts
+                SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, claimed_by = NULL
+                WHERE status = ? AND claimed_at < ?
+                """,
+                (self.max_attempts, STATUS_FAILED, STATUS_PENDING,
+                 STATUS_CLAIMED, to_db_time(now - self.lease))
+            )
+            await conn.commit()
+
+    async def claim_due(self) -> Optional[Dict[str, Any]]:
+        """
+        Атомарный захват ближайшего поста, время публикации которого наступило.
+
+        Returns:
+            Optional[Dict[str, Any]]: Захваченный пост или None
+        """
+        now = to_db_time(self._now())
+        async with self.db_manager.get_connection() as conn:
+            async with conn.execute(
+                """
+                UPDATE scheduled_posts
+                SET status = ?, claimed_by = ?, claimed_at = ?, attempts = attempts + 1
+                WHERE id = (
+                    SELECT id FROM scheduled_posts
+                    WHERE status = ? AND due_at <= ?
+                    ORDER BY due_at, id
+                    LIMIT 1
+                ) AND status = ?
+                RETURNING *
+                """,
+                (STATUS_CLAIMED, self.worker_id, now, STATUS_PENDING, now, STATUS_PENDING)
+            ) as cursor:
+                rows = await cursor.fetchall()
+            await conn.commit()
+        return dict(rows[0]) if rows else None
+
+    async def mark_sent(self, post_id: int) -> None:
+        """Отметка об успешной публикации."""
+        async with self.db_manager.get_connection() as conn:
+            await conn.execute(
+                "UPDATE scheduled_posts SET status = ?, sent_at = ?, error = NULL WHERE id = ? AND claimed_by = ?",
+                (STATUS_SENT, to_db_time(self._now()), post_id, self.worker_id)
+            )
+            await conn.commit()
+
+    async def mark_failed(self, post: Dict[str, Any], error: str) -> None:
+        """Отметка о неудачной публикации с повтором, если попытки не исчерпаны."""
+        if post['attempts'] >= self.max_attempts:
+            status, due_at = STATUS_FAILED, post['due_at']
+        else:
+            status = STATUS_PENDING
+            due_at = to_db_time(self._now() + self.retry_delay * post['attempts'])
+        async with self.db_manager.get_connection() as conn:
+            await conn.execute(
+                """
+                UPDATE scheduled_posts SET status = ?, due_at = ?, error = ?, claimed_by = NULL
+                WHERE id = ? AND claimed_by = ?
+                """,
+                (status, due_at, error, post['id'], self.worker_id)
+            )
+            await conn.commit()
+
+    async def process_due(self) -> int:
+        """
+        Публикация всех постов, время которых наступило.
+
+        Returns:
+            int: Количество опубликованных постов
+        """
+        sent = 0
+        while (post := await self.claim_due()) is not None:
+            try:
+                await self.sender(post)
+            except Exception as e:
+                logger.error(f"Ошибка при публикации поста {post['id']}: {e}")
+                await self.mark_failed(post, str(e))
+                continue
+            await self.mark_sent(post['id'])
+            sent += 1
+            logger.info(f"Опубликован пост {post['id']} ({post['post_type']})")
+        return sent
+
+    async def seconds_until_next(self) -> float:
+        """Время до ближайшего события очереди (не больше max_sleep)."""
+        async with self.db_manager.get_connection() as conn:
+            async with conn.execute(
+                """
+                SELECT
+                    (SELECT MIN(due_at) FROM scheduled_posts WHERE status = ?) AS next_due,
+                    (SELECT MIN(claimed_at) FROM scheduled_posts WHERE status = ?) AS oldest_claim
+                """,
+                (STATUS_PENDING, STATUS_CLAIMED)
+            ) as cursor:
+                row = await cursor.fetchone()
+        events = []
+        if row['next_due'] is not None:
+            events.append(from_db_time(row['next_due']))
+        if row['oldest_claim'] is not None:
+            # Аренда захваченного поста может истечь раньше ближайшего поста
+            events.append(from_db_time(row['oldest_claim']) + self.lease)
+        if not events:
+            return self.max_sleep
+        delay = (min(events) - self._now()).total_seconds()
+        return min(max(delay, 0.0), self.max_sleep)
+
+    async def run(self) -> None:
+        """Цикл планировщика: публикация и сон до ближайшего поста."""
+        await self.initialize()
+        await self.catch_up()
+        while True:
+            self._wakeup.clear()
+            try:
+                await self._release_stale_claims(self._now())
+                await self.process_due()
+                delay = await self.seconds_until_next()
+            except Exception as e:
+                logger.error(f"Ошибка в цикле очереди постов: {e}")
+                delay = self.retry_delay.total_seconds()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        """Запуск планировщика в фоновой задаче."""
+        if self.sender is None:
+            raise ValueError("Не задана функция публикации постов")
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Остановка планировщика."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
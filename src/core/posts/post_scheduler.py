@@ -2,24 +2,35 @@
 Модуль для планирования постов.
 """
 import logging
-from datetime import datetime, time
-from telegram.ext import CallbackContext
+from datetime import date, datetime, timedelta
+from typing import Optional
 from src.config.config import get_config
+from src.core.posts.post_queue import PostQueue
 
 logger = logging.getLogger(__name__)
 
+# Ежедневные посты: тип поста -> параметр конфигурации со временем публикации
+DAILY_POSTS = {
+    'morning': 'MORNING_POST_TIME',
+    'evening': 'EVENING_POST_TIME',
+}
+
 class PostScheduler:
-    """Класс для планирования постов."""
+    """Класс для планирования ежедневных постов в персистентной очереди."""
 
-    def __init__(self, bot):
+    def __init__(self, post_queue: PostQueue, chat_id: Optional[str] = None, days_ahead: int = 2):
         """
         Инициализация планировщика постов.
-        
+
         Args:
-            bot: Экземпляр бота
+            post_queue: Очередь отложенных постов
+            chat_id: Канал для публикации (по умолчанию TELEGRAM_CHANNEL_ID)
+            days_ahead: На сколько дней вперед ставить ежедневные посты
         """
-        self.bot = bot
+        self.post_queue = post_queue
         self.config = get_config()
+        self.chat_id = chat_id or self.config.TELEGRAM_CHANNEL_ID
+        self.days_ahead = days_ahead
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -27,24 +38,48 @@ class PostScheduler:
         if self._initialized:
             return
         try:
-            # Планируем утренний пост
-            morning_time = datetime.strptime(self.config.MORNING_POST_TIME, "%H:%M").time()
-            self.bot.job_queue.run_daily(
-                self.bot.send_morning_post,
-                time=time(hour=morning_time.hour, minute=morning_time.minute),
-                name="morning_post"
-            )
-
-            # Планируем вечерний пост
-            evening_time = datetime.strptime(self.config.EVENING_POST_TIME, "%H:%M").time()
-            self.bot.job_queue.run_daily(
-                self.bot.send_evening_post,
-                time=time(hour=evening_time.hour, minute=evening_time.minute),
-                name="evening_post"
-            )
-
+            await self.post_queue.initialize()
+            await self.schedule_daily_posts()
             self._initialized = True
             logger.info("PostScheduler успешно инициализирован")
         except Exception as e:
             logger.error(f"Ошибка при инициализации PostScheduler: {e}")
-            raise 
\ No newline at end of file
+            raise
+
+    async def schedule_daily_posts(self, today: Optional[date] = None) -> int:
+        """
+        Постановка ежедневных постов на ближайшие дни.
+
+        Повторный вызов безопасен: посты одного типа на одну дату
+        не дублируются (в том числе между процессами). Текст поста
+        формируется в момент публикации.
+
+        Args:
+            today: Дата, с которой планировать (по умолчанию - сегодня)
+
+        Returns:
+            int: Количество новых постов в очереди
+        """
+        today = today or date.today()
+        earliest = datetime.now() - self.post_queue.catchup_window
+        scheduled = 0
+        for offset in range(self.days_ahead):
+            day = today + timedelta(days=offset)
+            for post_type, time_setting in DAILY_POSTS.items():
+                post_time = datetime.strptime(getattr(self.config, time_setting), "%H:%M").time()
+                due_at = datetime.combine(day, post_time)
+                if due_at < earliest:
+                    continue
+                post_id = await self.post_queue.schedule(
+                    None,
+                    due_at,
+                    chat_id=self.chat_id,
+                    parse_mode='HTML',
+                    post_type=post_type,
+                    dedup_key=f"{post_type}:{day.isoformat()}"
+                )
+                if post_id is not None:
+                    scheduled += 1
+        if scheduled:
+            logger.info(f"Запланировано ежедневных постов: {scheduled}")
+        return scheduled
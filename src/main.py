@@ -10,6 +10,7 @@ from src.core.learning.notebook_parser import NotebookParser
 from src.core.competition.competition_manager import CompetitionManager
 from src.bot.bot import main as run_bot
 from src.core.moderation.vote_manager import VoteManager
+from src.core.commands.command_metrics import CommandMetrics
 from src.utils.logger import setup_logger
 
 # Инициализация логгера
@@ -52,13 +53,17 @@ async def initialize_managers():
         competition_manager = CompetitionManager(db_manager)
         vote_manager = VoteManager(db_manager)
         
+        command_metrics = CommandMetrics(db_manager)
+        await command_metrics.initialize()
+        
         return {
             "config": config,
             "db_manager": db_manager,
             "learning_manager": learning_manager,
             "notebook_parser": notebook_parser,
             "competition_manager": competition_manager,
-            "vote_manager": vote_manager
+            "vote_manager": vote_manager,
+            "command_metrics": command_metrics
         }
         
     except Exception as e:
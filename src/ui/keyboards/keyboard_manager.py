@@ -78,6 +78,19 @@ class KeyboardManager:
         )
         return InlineKeyboardMarkup(keyboard)
 
+    @staticmethod
+    def get_pagination_keyboard(prefix: str, key: str, page: int, has_next: bool,
+                                total: Optional[int] = None) -> InlineKeyboardMarkup:
+        """Клавиатура для постраничного просмотра сообщения"""
+        buttons = []
+        if page > 0:
+            buttons.append(InlineKeyboardButton("◀️", callback_data=f"{prefix}:{key}:{page - 1}"))
+        counter = f"{page + 1}/{total}" if total else f"{page + 1}"
+        buttons.append(InlineKeyboardButton(counter, callback_data=f"{prefix}:{key}:noop"))
+        if has_next:
+            buttons.append(InlineKeyboardButton("▶️", callback_data=f"{prefix}:{key}:{page + 1}"))
+        return InlineKeyboardMarkup([buttons])
+
     @staticmethod
     def get_learning_menu() -> ReplyKeyboardMarkup:
         """Меню обучения"""
@@ -0,0 +1,171 @@
+"""
+Постраничный вывод длинных сообщений.
+"""
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from src.ui.keyboards.keyboard_manager import KeyboardManager
+from src.utils.message_splitter import TELEGRAM_MAX_LENGTH, split_message
+
+logger = logging.getLogger(__name__)
+
+# Префикс callback_data кнопок пагинации
+PAGE_CALLBACK_PREFIX = "page"
+
+
+class _PagedText:
+    """Текст, разбиваемый на страницы по мере запроса."""
+
+    def __init__(self, parts: Iterator[str], parse_mode: Optional[str] = None):
+        self.parts = parts
+        self.parse_mode = parse_mode
+        self.pages: List[str] = []
+        self.exhausted = False
+        self.accessed = time.monotonic()
+
+    def page(self, index: int) -> Optional[str]:
+        """Получение страницы с догенерацией недостающих."""
+        while len(self.pages) <= index + 1 and not self.exhausted:
+            try:
+                self.pages.append(next(self.parts))
+            except StopIteration:
+                self.exhausted = True
+        self.accessed = time.monotonic()
+        return self.pages[index] if 0 <= index < len(self.pages) else None
+
+    def has_next(self, index: int) -> bool:
+        """Есть ли страница после указанной."""
+        return index + 1 < len(self.pages)
+
+    @property
+    def total(self) -> Optional[int]:
+        """Общее количество страниц, если оно уже известно."""
+        return len(self.pages) if self.exhausted else None
+
+
+class MessagePager:
+    """Кеш постраничных сообщений с ленивым разбиением."""
+
+    def __init__(self, max_entries: int = 256, ttl: int = 3600,
+                 page_length: int = TELEGRAM_MAX_LENGTH):
+        """
+        Инициализация пагинатора.
+
+        Args:
+            max_entries: Максимальное количество сообщений в кеше
+            ttl: Время жизни сообщения в кеше (секунды)
+            page_length: Максимальная длина страницы
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.page_length = page_length
+        self._cache: "OrderedDict[str, _PagedText]" = OrderedDict()
+
+    def _evict(self) -> None:
+        """Удаление устаревших и лишних записей кеша."""
+        now = time.monotonic()
+        for key in [k for k, v in self._cache.items() if now - v.accessed > self.ttl]:
+            del self._cache[key]
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def create(self, text: Union[str, Iterable[str]], parse_mode: Optional[str] = None) -> str:
+        """
+        Регистрация текста для постраничного вывода.
+
+        Args:
+            text: Текст или итератор его фрагментов
+            parse_mode: Режим разметки ('HTML' - с балансировкой тегов)
+
+        Returns:
+            str: Ключ сообщения в кеше
+        """
+        key = uuid.uuid4().hex[:12]
+        parts = split_message(text, self.page_length, html=parse_mode == 'HTML')
+        self._cache[key] = _PagedText(parts, parse_mode)
+        self._evict()
+        return key
+
+    def get_page(self, key: str, index: int) -> Optional[Tuple[str, bool, Optional[int]]]:
+        """
+        Получение страницы сообщения.
+
+        Args:
+            key: Ключ сообщения
+            index: Номер страницы (с нуля)
+
+        Returns:
+            Optional[Tuple[str, bool, Optional[int]]]: Текст страницы, наличие
+            следующей страницы и общее количество страниц (если известно)
+        """
+        paged = self._cache.get(key)
+        if paged is None:
+            return None
+        self._cache.move_to_end(key)
+        page = paged.page(index)
+        if page is None:
+            return None
+        return page, paged.has_next(index), paged.total
+
+    def get_keyboard(self, key: str, index: int):
+        """Клавиатура навигации для страницы или None, если страница одна."""
+        result = self.get_page(key, index)
+        if result is None:
+            return None
+        _, has_next, total = result
+        if index == 0 and not has_next:
+            return None
+        return KeyboardManager.get_pagination_keyboard(
+            PAGE_CALLBACK_PREFIX, key, index, has_next, total
+        )
+
+    async def reply(self, message, text: Union[str, Iterable[str]],
+                    parse_mode: Optional[str] = None, reply_markup=None) -> None:
+        """
+        Ответ на сообщение с постраничным выводом длинного текста.
+
+        Args:
+            message: Сообщение Telegram, на которое отвечаем
+            text: Текст ответа
+            parse_mode: Режим разметки
+            reply_markup: Клавиатура для короткого (одностраничного) ответа
+        """
+        if isinstance(text, str) and len(text) <= self.page_length:
+            await message.reply_text(text=text, parse_mode=parse_mode, reply_markup=reply_markup)
+            return
+        key = self.create(text, parse_mode)
+        result = self.get_page(key, 0)
+        if result is None:
+            return
+        page, has_next, _ = result
+        await message.reply_text(
+            text=page,
+            parse_mode=parse_mode,
+            reply_markup=self.get_keyboard(key, 0) if has_next else reply_markup
+        )
+        if not has_next:
+            self._cache.pop(key, None)
+
+    async def handle_callback(self, update, context) -> None:
+        """Обработчик нажатий на кнопки пагинации."""
+        query = update.callback_query
+        try:
+            _, key, index = query.data.split(":")
+            index = int(index)
+        except ValueError:
+            await query.answer()
+            return
+
+        result = self.get_page(key, index)
+        if result is None:
+            await query.answer("Сообщение устарело")
+            return
+        await query.answer()
+        await query.edit_message_text(
+            text=result[0],
+            parse_mode=self._cache[key].parse_mode,
+            reply_markup=self.get_keyboard(key, index)
+        )
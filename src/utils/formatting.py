@@ -7,6 +7,9 @@ from datetime import datetime
 def truncate_message(text: str, max_length: int = 4096) -> str:
     """
     Обрезает сообщение до максимальной длины.
+
+    Для отправки длинных текстов без потери содержимого
+    используйте split_message из src.utils.message_splitter.
     
     Args:
         text (str): Исходный текст
@@ -1,53 +1,189 @@
 """
 Модуль для настройки логирования.
+
+Все логгеры приложения пишут в общую очередь через QueueHandler на корневом
+логгере, а вывод в консоль и в файл выполняет единственный поток
+QueueListener. Вызов логгера в корутине только кладет запись в очередь
+и не выполняет дискового ввода-вывода в цикле событий. Файл логов
+ротируется по размеру согласно разделу "logging" в data/settings.json
+(max_size, backup_count); при "json": true файл пишется в формате JSON Lines.
 """
+import atexit
+import json
 import logging
-import os
-from pathlib import Path
+import logging.handlers
+import queue
+import threading
 from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Файл настроек и значения по умолчанию для раздела logging
+SETTINGS_PATH = Path("data") / "settings.json"
+DEFAULT_SETTINGS: Dict[str, Any] = {
+    "level": "INFO",
+    "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    "file": "logs/bot.log",
+    "max_size": 10 * 1024 * 1024,
+    "backup_count": 5,
+    "json": False,
+}
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Стандартные атрибуты LogRecord, не попадающие в поле extra JSON-записи
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+_settings: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+class JsonFormatter(logging.Formatter):
+    """Форматтер структурированных логов в формате JSON Lines."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Форматирование записи в одну строку JSON."""
+        data = {
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exception"] = record.exc_text
+        extra = {k: v for k, v in vars(record).items() if k not in _RECORD_ATTRS}
+        if extra:
+            data["extra"] = extra
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler без форматирования в вызывающем потоке.
+
+    Стандартный prepare() форматирует запись целиком (включая трассировку
+    исключения) в потоке вызова. Здесь подставляются только аргументы
+    сообщения, а форматирование выполняет поток-писатель.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+def load_settings(path: Path = SETTINGS_PATH) -> Dict[str, Any]:
+    """
+    Загрузка настроек логирования.
+
+    Args:
+        path: Путь к файлу настроек
+
+    Returns:
+        Dict[str, Any]: Настройки раздела logging с подставленными значениями по умолчанию
+    """
+    settings = dict(DEFAULT_SETTINGS)
+    try:
+        with open(path, encoding="utf-8") as f:
+            settings.update(json.load(f).get("logging", {}))
+    except (OSError, ValueError):
+        pass
+    return settings
+
+
+def configure_logging(settings: Optional[Dict[str, Any]] = None) -> logging.handlers.QueueListener:
+    """
+    Настройка конвейера логирования (выполняется один раз).
+
+    Args:
+        settings: Настройки раздела logging (по умолчанию из data/settings.json)
+
+    Returns:
+        logging.handlers.QueueListener: Запущенный поток-писатель
+    """
+    global _listener, _queue_handler, _settings
+    with _lock:
+        if _listener is not None:
+            return _listener
+
+        _settings = settings or load_settings()
+        text_formatter = logging.Formatter(_settings["format"], datefmt=DATE_FORMAT)
+
+        # Хендлер для вывода в консоль
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(text_formatter)
+        handlers = [console_handler]
+
+        # Хендлер для вывода в файл с ротацией по размеру
+        log_file = Path(_settings["file"])
+        try:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file,
+                maxBytes=int(_settings["max_size"]),
+                backupCount=int(_settings["backup_count"]),
+                encoding='utf-8'
+            )
+            file_handler.setFormatter(JsonFormatter() if _settings.get("json") else text_formatter)
+            handlers.append(file_handler)
+        except OSError as e:
+            console_handler.handle(logging.makeLogRecord({
+                "msg": f"Файл логов недоступен: {e}", "levelno": logging.WARNING, "levelname": "WARNING"
+            }))
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_handler = _QueueHandler(log_queue)
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+
+        # Корневой логгер пропускает от сторонних библиотек только предупреждения,
+        # логгеры приложения получают свой уровень в setup_logger
+        root = logging.getLogger()
+        root.addHandler(_queue_handler)
+        if root.level == logging.NOTSET or root.level > logging.WARNING:
+            root.setLevel(logging.WARNING)
+        atexit.register(shutdown_logging)
+        return _listener
+
+
+def shutdown_logging() -> None:
+    """Остановка потока-писателя с записью оставшихся в очереди сообщений."""
+    global _listener, _queue_handler
+    with _lock:
+        if _listener is None:
+            return
+        logging.getLogger().removeHandler(_queue_handler)
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+        _queue_handler = None
+
 
 def setup_logger(name: str = None) -> logging.Logger:
     """
     Настройка логгера.
-    
+
     Args:
         name: Имя логгера
-        
+
     Returns:
         logging.Logger: Настроенный логгер
     """
+    configure_logging()
     logger = logging.getLogger(name)
-    
-    if not logger.handlers:
-        logger.setLevel(logging.INFO)
-        
-        # Форматтер для логов с текущим временем
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        # Хендлер для вывода в консоль
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-        
-        # Хендлер для вывода в файл
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        
-        file_handler = logging.FileHandler(
-            log_dir / "bot.log",
-            mode='a',  # Режим добавления
-            encoding='utf-8'
-        )
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        
-        # Добавляем тестовую запись
+
+    if logger.level == logging.NOTSET:
+        logger.setLevel(_settings.get("level", "INFO"))
         logger.info(f"Логгер {name} инициализирован")
-    
+
     return logger
 
 # Создаем глобальный логгер
-logger = setup_logger(__name__) 
\ No newline at end of file
+logger = setup_logger(__name__)
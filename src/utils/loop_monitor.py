@@ -0,0 +1,171 @@
+"""
+Модуль для отслеживания задержек цикла событий asyncio.
+
+Корутина-пульс засыпает на фиксированный интервал и измеряет, насколько
+позже она проснулась; разница - задержка цикла событий - пишется в метрику.
+Отдельный поток-сторож проверяет время последнего пульса и, если цикл
+не отвечает дольше порога, снимает стек потока цикла событий: в нем видна
+корутина, выполняющая блокирующий код. В режиме отладки asyncio дополнительно
+логирует обратные вызовы, выполнявшиеся дольше порога.
+"""
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Deque, List, Optional
+
+from src.utils.logger import setup_logger
+from src.utils.metrics import Metrics
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class LoopStall:
+    """Зафиксированная блокировка цикла событий."""
+    started_at: datetime
+    duration: float
+    task: Optional[str]
+    stack: List[str] = field(default_factory=list)
+
+
+class LoopMonitor:
+    """Сторож цикла событий: задержки, блокировки и их стеки вызовов."""
+
+    def __init__(self, interval: float = 0.1, threshold: float = 0.5,
+                 debug: bool = False, max_stalls: int = 50):
+        """
+        Инициализация сторожа.
+
+        Args:
+            interval: Интервал пульса (секунды)
+            threshold: Задержка, после которой цикл считается заблокированным (секунды)
+            debug: Включить режим отладки asyncio (slow_callback_duration = threshold)
+            max_stalls: Количество последних блокировок, хранимых в памяти
+        """
+        self.interval = interval
+        self.threshold = threshold
+        self.debug = debug
+        self.stalls: Deque[LoopStall] = deque(maxlen=max_stalls)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._last_beat = time.monotonic()
+
+    @property
+    def running(self) -> bool:
+        """Запущен ли сторож."""
+        return self._heartbeat_task is not None and not self._heartbeat_task.done()
+
+    def start(self) -> None:
+        """Запуск сторожа; вызывается из работающего цикла событий."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        if self.debug:
+            self._loop.set_debug(True)
+            self._loop.slow_callback_duration = self.threshold
+            # Предупреждения asyncio о медленных обратных вызовах
+            setup_logger("asyncio")
+        self._stopped.clear()
+        self._last_beat = time.monotonic()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._watchdog.start()
+        logger.info(f"Мониторинг цикла событий запущен (порог {self.threshold} с)")
+
+    async def stop(self) -> None:
+        """Остановка сторожа."""
+        self._stopped.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join, self.threshold)
+            self._watchdog = None
+
+    async def _heartbeat(self) -> None:
+        """Пульс: измерение задержки пробуждения."""
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._last_beat = now
+            Metrics.loop_lag.observe(max(0.0, now - start - self.interval))
+
+    def _watch(self) -> None:
+        """Поток-сторож: обнаружение блокировок цикла событий."""
+        check_interval = min(self.interval, self.threshold / 2)
+        stall_beat = None
+        while not self._stopped.wait(check_interval):
+            beat = self._last_beat
+            silence = time.monotonic() - beat - self.interval
+            if silence < self.threshold:
+                if stall_beat is not None:
+                    self._finish_stall()
+                stall_beat = None
+                continue
+            if stall_beat != beat:
+                # Новая блокировка: снимаем стек один раз, пока она длится
+                stall_beat = beat
+                self._capture_stall(silence)
+            else:
+                self.stalls[-1].duration = silence
+        if stall_beat is not None:
+            self._finish_stall()
+
+    def _capture_stall(self, silence: float) -> None:
+        """Снятие стека потока цикла событий."""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = traceback.format_stack(frame) if frame is not None else []
+        stall = LoopStall(
+            started_at=datetime.now(),
+            duration=silence,
+            task=self._current_task_name(),
+            stack=stack
+        )
+        self.stalls.append(stall)
+        Metrics.loop_stalls.inc()
+        logger.warning(
+            f"Цикл событий заблокирован более {self.threshold} с "
+            f"(задача: {stall.task or 'неизвестна'}):\n{''.join(stack)}"
+        )
+
+    def _finish_stall(self) -> None:
+        """Логирование итоговой длительности блокировки."""
+        stall = self.stalls[-1]
+        logger.warning(f"Цикл событий был заблокирован {stall.duration:.3f} с (задача: {stall.task or 'неизвестна'})")
+
+    def _current_task_name(self) -> Optional[str]:
+        """Имя задачи, выполняемой в цикле событий в данный момент."""
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            return None
+        if task is None:
+            return None
+        coro = task.get_coro()
+        return f"{task.get_name()} ({getattr(coro, '__qualname__', coro)})"
+
+
+# Глобальный экземпляр сторожа
+_monitor: Optional[LoopMonitor] = None
+
+
+def get_loop_monitor(**kwargs) -> LoopMonitor:
+    """Получение экземпляра сторожа цикла событий (Singleton)."""
+    global _monitor
+    if _monitor is None:
+        _monitor = LoopMonitor(**kwargs)
+    return _monitor
@@ -0,0 +1,175 @@
+"""
+Модуль для разбиения длинных сообщений на части по лимиту Telegram.
+
+Разбиение выполняется потоково за один проход: текст может подаваться
+строкой или итератором фрагментов произвольной длины, а в памяти держится
+только буфер размером порядка одной части. Границы частей выбираются
+по абзацам, затем по строкам, предложениям и словам. В режиме HTML теги,
+открытые в конце части, закрываются и заново открываются в начале следующей.
+"""
+import re
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Tuple, Union
+
+# Максимальная длина сообщения Telegram
+TELEGRAM_MAX_LENGTH = 4096
+
+# Разметка HTML, которую нельзя разрывать: теги и сущности
+_MARKUP_RE = re.compile(r'<[^<>]*>|&#?\w+;')
+_TAG_NAME_RE = re.compile(r'</?\s*([a-zA-Z][\w-]*)')
+
+# Границы разбиения в порядке предпочтения: абзац, строка, предложение, слово
+_BOUNDARIES = (
+    re.compile(r'\n\s*\n'),
+    re.compile(r'\n'),
+    re.compile(r'[.!?…]+[)"»\']*\s'),
+    re.compile(r'\s'),
+)
+
+# Доля лимита, которую должна занимать часть, чтобы граница считалась удачной
+MIN_FILL = 0.5
+
+# Запас окна за лимитом, чтобы разметка на границе окна распознавалась целиком
+_WINDOW_MARGIN = 512
+
+
+def _closing_tags(stack: List[Tuple[str, str]]) -> str:
+    """Закрывающие теги для открытых тегов в обратном порядке."""
+    return ''.join(f'</{name}>' for name, _ in reversed(stack))
+
+
+def _opening_tags(stack: List[Tuple[str, str]]) -> str:
+    """Исходные открывающие теги (с атрибутами) для открытых тегов."""
+    return ''.join(tag for _, tag in stack)
+
+
+def _apply_tag(stack: List[Tuple[str, str]], tag: str) -> None:
+    """Обновление стека открытых тегов по очередному тегу."""
+    match = _TAG_NAME_RE.match(tag)
+    if not match or tag.endswith('/>'):
+        return
+    name = match.group(1).lower()
+    if tag.startswith('</'):
+        for i in range(len(stack) - 1, -1, -1):
+            if stack[i][0] == name:
+                del stack[i:]
+                break
+    else:
+        stack.append((name, tag))
+
+
+def _find_cut(window: str, limit: int, html: bool) -> Tuple[int, List[Tuple[str, str]]]:
+    """Поиск позиции разреза окна текста.
+
+    Args:
+        window: Начало оставшегося текста (с переоткрытыми тегами)
+        limit: Максимальная длина части
+        html: Учитывать HTML-разметку
+
+    Returns:
+        Tuple[int, List]: Позиция разреза и стек тегов, открытых в этой позиции
+    """
+    # Разметка в окне и длина закрывающих тегов после каждого ее элемента
+    starts: List[int] = []
+    ends: List[int] = []
+    closing: List[int] = []
+    if html:
+        stack: List[Tuple[str, str]] = []
+        closing_length = 0
+        for match in _MARKUP_RE.finditer(window):
+            tag = match.group()
+            if tag[0] == '<':
+                depth = len(stack)
+                _apply_tag(stack, tag)
+                if len(stack) != depth:
+                    closing_length = sum(len(name) + 3 for name, _ in stack)
+            starts.append(match.start())
+            ends.append(match.end())
+            closing.append(closing_length)
+
+    def stack_at(position: int) -> List[Tuple[str, str]]:
+        stack: List[Tuple[str, str]] = []
+        for index in range(bisect_right(ends, position)):
+            if window[starts[index]] == '<':
+                _apply_tag(stack, window[starts[index]:ends[index]])
+        return stack
+
+    def allowed(position: int) -> bool:
+        if not starts:
+            return position <= limit
+        index = bisect_left(starts, position) - 1
+        if index >= 0 and ends[index] > position:
+            return False
+        index = bisect_right(ends, position)
+        return position + (closing[index - 1] if index else 0) <= limit
+
+    best = 0
+    for pattern in _BOUNDARIES:
+        # Ищем последнюю допустимую границу, начиная с конца окна
+        positions = [match.end() for match in pattern.finditer(window, 0, limit)]
+        candidate = next((p for p in reversed(positions) if allowed(p)), 0)
+        if candidate >= limit * MIN_FILL:
+            return candidate, stack_at(candidate)
+        best = max(best, candidate)
+
+    if best:
+        return best, stack_at(best)
+
+    # Удачной границы нет - режем по символам, не попадая внутрь разметки
+    position = limit
+    while position > 1 and not allowed(position):
+        position -= 1
+    return position, stack_at(position)
+
+
+def split_message(
+    text: Union[str, Iterable[str]],
+    max_length: int = TELEGRAM_MAX_LENGTH,
+    html: bool = False
+) -> Iterator[str]:
+    """
+    Потоковое разбиение текста на части не длиннее max_length.
+
+    Args:
+        text (Union[str, Iterable[str]]): Текст или итератор его фрагментов
+        max_length (int): Максимальная длина одной части
+        html (bool): Текст содержит HTML-разметку (parse_mode='HTML')
+
+    Yields:
+        str: Очередная часть сообщения
+    """
+    if max_length <= 0:
+        raise ValueError("max_length должен быть положительным")
+    chunks = [text] if isinstance(text, str) else text
+
+    buffer = ''
+    prefix = ''  # Теги, переоткрываемые в начале следующей части
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer = buffer + chunk if buffer else chunk
+        offset = 0
+        # Окно берется срезом, а не копированием хвоста буфера,
+        # поэтому длинный текст обрабатывается за линейное время
+        while len(prefix) + len(buffer) - offset > max_length:
+            window = prefix + buffer[offset:offset + max_length + _WINDOW_MARGIN]
+            cut, stack = _find_cut(window, max_length, html)
+            if cut <= len(prefix):
+                # Переоткрытые теги не помещаются в часть (возможно только
+                # при очень маленьком max_length) - отказываемся от них
+                prefix = ''
+                continue
+            part = window[:cut].rstrip()
+            if html and stack:
+                part += _closing_tags(stack)
+            if _MARKUP_RE.sub('', part).strip():
+                yield part
+            offset += cut - len(prefix)
+            while offset < len(buffer) and buffer[offset].isspace():
+                offset += 1
+            prefix = _opening_tags(stack) if html else ''
+        buffer = buffer[offset:]
+
+    rest = (prefix + buffer).strip()
+    if (_MARKUP_RE.sub('', rest) if html else rest).strip():
+        yield rest
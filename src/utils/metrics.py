@@ -23,11 +23,29 @@ class Metrics:
     message_counter = Counter('bot_messages_total', 'Total messages processed')
     command_counter = Counter('bot_commands_total', 'Total commands processed', ['command'])
     error_counter = Counter('bot_errors_total', 'Total errors', ['type'])
+    loop_stalls = Counter('event_loop_stalls_total', 'Event loop blocked longer than threshold')
     
     # Гистограммы
     message_latency = Histogram('message_processing_seconds', 'Message processing time')
     command_latency = Histogram('command_processing_seconds', 'Command processing time')
     db_latency = Histogram('database_operation_seconds', 'Database operation time')
+    handler_latency = Histogram(
+        'bot_handler_duration_seconds',
+        'Handler processing time',
+        ['handler', 'outcome'],
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+    )
+    handler_queue_wait = Histogram(
+        'bot_handler_queue_wait_seconds',
+        'Time between update creation and handler start',
+        ['handler'],
+        buckets=(0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+    )
+    loop_lag = Histogram(
+        'event_loop_lag_seconds',
+        'Event loop wake-up delay',
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+    )
     
     def __init__(self):
         """Инициализация метрик."""
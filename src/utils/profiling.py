@@ -0,0 +1,219 @@
+"""
+Модуль для выборочного профилирования обработчиков в продакшене.
+
+Профилировщик сэмплирует стек потока цикла событий с фиксированным интервалом,
+но учитывает только те сэмплы, в которые выполняется задача выбранного
+обработчика. Так корутины, чередующиеся в одном потоке, не смешиваются
+в профиле. Выбор обработчиков - доля всех вызовов (sample_rate) и/или все
+вызовы указанных команд. Результаты агрегируются в формате collapsed stacks
+(совместим с flamegraph.pl и speedscope) и периодически сбрасываются
+в новый файл в logs/profiles; старые файлы удаляются.
+"""
+import asyncio
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Каталог для файлов профилей
+DEFAULT_PROFILES_DIR = Path("logs") / "profiles"
+
+# Модули цикла событий, которые не несут информации и отбрасываются с корня стека
+_LOOP_MODULES = ("asyncio", "threading", "runpy", "__main__", "telegram.ext")
+
+
+class SamplingProfiler:
+    """Сэмплирующий профилировщик выбранных обработчиков."""
+
+    def __init__(self, output_dir: Path = DEFAULT_PROFILES_DIR, interval: float = 0.005,
+                 rotate_interval: float = 300.0, max_files: int = 48):
+        """
+        Инициализация профилировщика.
+
+        Args:
+            output_dir: Каталог для файлов профилей
+            interval: Интервал между сэмплами (секунды)
+            rotate_interval: Интервал сброса профиля в новый файл (секунды)
+            max_files: Максимальное количество хранимых файлов профилей
+        """
+        self.output_dir = Path(output_dir)
+        self.interval = interval
+        self.rotate_interval = rotate_interval
+        self.max_files = max_files
+        self.sample_rate = 0.0
+        self.commands: Set[str] = set()
+        self.samples_total = 0
+        self._stacks: Counter = Counter()
+        self._active: Dict[asyncio.Task, str] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._last_rotate = time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        """Включено ли профилирование."""
+        return self.sample_rate > 0 or bool(self.commands)
+
+    def configure(self, sample_rate: Optional[float] = None,
+                  commands: Optional[Iterable[str]] = None) -> None:
+        """
+        Изменение настроек профилирования во время работы.
+
+        Args:
+            sample_rate: Доля профилируемых вызовов (0 - выключено, 1 - все)
+            commands: Команды, все вызовы которых профилируются (например, "/stats")
+        """
+        if sample_rate is not None:
+            if not 0.0 <= sample_rate <= 1.0:
+                raise ValueError("sample_rate должен быть в диапазоне [0, 1]")
+            self.sample_rate = sample_rate
+        if commands is not None:
+            self.commands = {c if c.startswith("/") else f"/{c}" for c in commands}
+        logger.info(f"Профилирование: доля {self.sample_rate}, команды {sorted(self.commands)}")
+
+    def disable(self) -> Optional[Path]:
+        """
+        Выключение профилирования со сбросом накопленного профиля.
+
+        Returns:
+            Optional[Path]: Путь к последнему записанному файлу профиля
+        """
+        self.sample_rate = 0.0
+        self.commands = set()
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(self.interval * 10)
+            self._thread = None
+        return self.flush()
+
+    def should_sample(self, name: str) -> bool:
+        """Нужно ли профилировать данный вызов обработчика."""
+        return name in self.commands or (self.sample_rate > 0 and random.random() < self.sample_rate)
+
+    def begin(self, name: str) -> None:
+        """Начало профилирования текущей задачи как обработчика name."""
+        task = asyncio.current_task()
+        if task is None:
+            return
+        self._active[task] = name
+        if self._thread is None or not self._thread.is_alive():
+            self._loop = asyncio.get_running_loop()
+            self._loop_thread_id = threading.get_ident()
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+            self._thread.start()
+
+    def end(self) -> None:
+        """Окончание профилирования текущей задачи."""
+        task = asyncio.current_task()
+        if task is not None:
+            self._active.pop(task, None)
+
+    def _run(self) -> None:
+        """Поток сэмплирования."""
+        while not self._stopped.wait(self.interval):
+            if self._active:
+                self._sample()
+            if time.monotonic() - self._last_rotate >= self.rotate_interval:
+                self.flush()
+
+    def _sample(self) -> None:
+        """Снятие одного сэмпла стека потока цикла событий."""
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            return
+        name = self._active.get(task)
+        if name is None:
+            return
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        stack = ";".join([name] + _collapse(frame))
+        with self._lock:
+            self._stacks[stack] += 1
+            self.samples_total += 1
+
+    def flush(self) -> Optional[Path]:
+        """
+        Запись накопленного профиля в новый файл и ротация старых файлов.
+
+        Returns:
+            Optional[Path]: Путь к файлу или None, если сэмплов не было
+        """
+        with self._lock:
+            stacks, self._stacks = self._stacks, Counter()
+            self._last_rotate = time.monotonic()
+        if not stacks:
+            return None
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            path = self.output_dir / f"profile-{datetime.now():%Y%m%d-%H%M%S-%f}.collapsed"
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            self._remove_old_files()
+            logger.info(f"Профиль сохранен: {path} ({sum(stacks.values())} сэмплов)")
+            return path
+        except OSError as e:
+            logger.error(f"Ошибка при сохранении профиля: {e}")
+            return None
+
+    def _remove_old_files(self) -> None:
+        """Удаление файлов профилей сверх max_files."""
+        files = sorted(self.output_dir.glob("profile-*.collapsed"))
+        for path in files[:-self.max_files] if self.max_files > 0 else []:
+            path.unlink(missing_ok=True)
+
+    def status(self) -> Dict:
+        """Текущее состояние профилировщика."""
+        with self._lock:
+            pending = sum(self._stacks.values())
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "commands": sorted(self.commands),
+            "active": len(self._active),
+            "samples_total": self.samples_total,
+            "samples_pending": pending,
+            "output_dir": str(self.output_dir),
+        }
+
+
+def _collapse(frame) -> List[str]:
+    """Стек вызовов от корня к листу в виде имен функций."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", "?")
+        names.append((module, f"{module}:{code.co_qualname}"))
+        frame = frame.f_back
+    names.reverse()
+    # Отбрасываем кадры цикла событий до первого кадра приложения
+    start = 0
+    while start < len(names) - 1 and names[start][0].startswith(_LOOP_MODULES):
+        start += 1
+    return [name for _, name in names[start:]]
+
+
+# Глобальный экземпляр профилировщика
+_profiler: Optional[SamplingProfiler] = None
+
+
+def get_profiler() -> SamplingProfiler:
+    """Получение экземпляра профилировщика (Singleton)."""
+    global _profiler
+    if _profiler is None:
+        _profiler = SamplingProfiler()
+    return _profiler
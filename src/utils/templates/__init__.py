@@ -0,0 +1,7 @@
+"""
+Модуль для работы с шаблонами.
+"""
+
+from .template_engine import TemplateEngine, get_template_engine
+
+__all__ = ['TemplateEngine', 'get_template_engine']
@@ -0,0 +1,149 @@
+"""
+Модуль для работы с шаблонами сообщений и постов.
+
+Шаблоны хранятся в виде файлов Jinja2 и компилируются один раз при запуске.
+Скомпилированный байткод сохраняется на диск, поэтому повторный запуск бота
+не требует повторного разбора шаблонов. Для шаблонов с расширением ``.html``
+включено HTML-экранирование (посты отправляются с ``parse_mode='HTML'``).
+"""
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
+
+from src.utils.file_utils import ensure_dir
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Каталог с шаблонами по умолчанию
+DEFAULT_TEMPLATES_DIR = Path(__file__).parent / "files"
+# Каталог для байткода скомпилированных шаблонов
+DEFAULT_CACHE_DIR = Path("data") / "cache" / "templates"
+
+
+class TemplateEngine:
+    """Движок шаблонов с предварительной компиляцией и горячей перезагрузкой."""
+
+    def __init__(
+        self,
+        templates_dir: Optional[Union[str, Path]] = None,
+        cache_dir: Optional[Union[str, Path]] = DEFAULT_CACHE_DIR,
+        auto_reload: bool = True,
+        reload_interval: float = 2.0,
+    ):
+        """Инициализация движка шаблонов.
+
+        Args:
+            templates_dir: Каталог с шаблонами
+            cache_dir: Каталог для кеша байткода (None - без кеша на диске)
+            auto_reload: Проверять изменения файлов шаблонов при рендеринге
+            reload_interval: Минимальный интервал между проверками (секунды)
+        """
+        self.templates_dir = Path(templates_dir) if templates_dir else DEFAULT_TEMPLATES_DIR
+        self.auto_reload = auto_reload
+        self.reload_interval = reload_interval
+        self._last_check = 0.0
+        self._compiled: Dict[str, Template] = {}
+
+        bytecode_cache = None
+        if cache_dir is not None:
+            try:
+                bytecode_cache = FileSystemBytecodeCache(str(ensure_dir(cache_dir)))
+            except OSError as e:
+                logger.warning(f"Кеш байткода шаблонов недоступен: {e}")
+
+        # auto_reload окружения отключен: проверка изменений выполняется
+        # в reload_changed() не чаще reload_interval, а не на каждый рендер
+        self.env = Environment(
+            loader=FileSystemLoader(str(self.templates_dir)),
+            autoescape=select_autoescape(enabled_extensions=("html",), default_for_string=False),
+            bytecode_cache=bytecode_cache,
+            auto_reload=False,
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+        self.precompile()
+
+    def precompile(self) -> int:
+        """Компиляция всех шаблонов из каталога.
+
+        Returns:
+            int: Количество скомпилированных шаблонов
+        """
+        compiled = {}
+        for name in self.env.list_templates():
+            try:
+                compiled[name] = self.env.get_template(name)
+            except Exception as e:
+                logger.error(f"Ошибка при компиляции шаблона {name}: {e}")
+        self._compiled = compiled
+        self._last_check = time.monotonic()
+        logger.info(f"Скомпилировано шаблонов: {len(compiled)}")
+        return len(compiled)
+
+    def reload_changed(self) -> bool:
+        """Перекомпиляция шаблонов, измененных на диске.
+
+        Returns:
+            bool: True, если хотя бы один шаблон был перезагружен
+        """
+        self._last_check = time.monotonic()
+        names = set(self.env.list_templates())
+        changed = names != set(self._compiled) or any(
+            not template.is_up_to_date for template in self._compiled.values()
+        )
+        if changed:
+            # Кеш окружения хранит устаревшие шаблоны, так как auto_reload отключен
+            self.env.cache.clear()
+            self.precompile()
+            logger.info("Шаблоны перезагружены после изменения на диске")
+        return changed
+
+    def get_template(self, name: str) -> Template:
+        """Получение скомпилированного шаблона.
+
+        Args:
+            name: Имя шаблона относительно каталога шаблонов
+
+        Returns:
+            Template: Скомпилированный шаблон
+        """
+        if self.auto_reload and time.monotonic() - self._last_check >= self.reload_interval:
+            self.reload_changed()
+        template = self._compiled.get(name)
+        if template is None:
+            template = self.env.get_template(name)
+            self._compiled[name] = template
+        return template
+
+    def render(self, template_name: str, /, **context: Any) -> str:
+        """Рендеринг шаблона.
+
+        Args:
+            template_name: Имя шаблона
+            **context: Переменные для подстановки
+
+        Returns:
+            str: Результат рендеринга
+        """
+        return self.get_template(template_name).render(**context)
+
+
+# Глобальный экземпляр движка шаблонов
+_engine: Optional[TemplateEngine] = None
+
+
+def get_template_engine() -> TemplateEngine:
+    """Получение экземпляра движка шаблонов (Singleton)."""
+    global _engine
+    if _engine is None:
+        _engine = TemplateEngine()
+    return _engine
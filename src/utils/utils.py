@@ -12,6 +12,7 @@ from src.utils.formatting import (
     truncate_message, format_message, format_date, format_time,
     format_number, format_percentage, format_size
 )
+from src.utils.message_splitter import split_message
 from src.utils.file_utils import (
     ensure_dir, sanitize_filename, load_json, save_json,
     get_file_extension, get_file_info
@@ -88,6 +89,7 @@ __all__ = [
     'format_number',
     'format_percentage',
     'format_size',
+    'split_message',
     
     # Функции для работы с файлами
     'ensure_dir',
@@ -0,0 +1,78 @@
+"""
+Тесты для инкрементального разбора ноутбуков по ячейкам.
+"""
+from datetime import date, timedelta
+
+import nbformat
+from src.core.learning.cell_diff import CellCache
+from src.core.learning.metric_extractor import MetricExtractor
+
+class _CountingExtractor(MetricExtractor):
+    """Извлекатель, считающий разобранные ячейки."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def extract(self, cells):
+        cells = list(cells)
+        self.calls += len(cells)
+        return super().extract(cells)
+
+def _write(path, sources):
+    notebook = nbformat.v4.new_notebook()
+    notebook.cells = [
+        nbformat.v4.new_markdown_cell(source[3:]) if source.startswith("md:") else nbformat.v4.new_code_cell(source)
+        for source in sources
+    ]
+    nbformat.write(notebook, str(path))
+
+def test_only_changed_cells_reparsed(temp_dir):
+    """Тест повторного разбора только изменившихся ячеек."""
+    path = temp_dir / "nb.ipynb"
+    extractor = _CountingExtractor()
+    cache = CellCache(extractor, cache_dir=temp_dir / "cells")
+    _write(path, ["md:# Эксперимент", "accuracy = 0.9", "loss = 0.5", "print('x')"])
+
+    result = cache.parse(path)
+    assert extractor.calls == 3
+    assert result.metrics == {'accuracy': 0.9, 'loss': 0.5}
+    assert result.summary == "# Эксперимент"
+
+    _write(path, ["md:# Эксперимент", "accuracy = 0.9", "loss = 0.4", "print('x')", "f1 = 0.7"])
+    extractor.calls = 0
+    result = cache.parse(path)
+    assert extractor.calls == 2
+    assert result.metrics == {'accuracy': 0.9, 'loss': 0.4, 'f1': 0.7}
+    assert [c.source for c in result.delta.added] == ["loss = 0.4", "f1 = 0.7"]
+    assert [c.source for c in result.delta.removed] == ["loss = 0.5"]
+    assert result.delta.unchanged == 3
+    assert [(hit.name, hit.cell) for hit in result.hits] == [('accuracy', 1), ('loss', 2), ('f1', 4)]
+
+def test_cell_map_persisted(temp_dir):
+    """Тест восстановления карты ячеек после перезапуска."""
+    path = temp_dir / "nb.ipynb"
+    _write(path, ["accuracy = 0.9", "loss = 0.5"])
+    CellCache(MetricExtractor(), cache_dir=temp_dir / "cells").parse(path)
+
+    extractor = _CountingExtractor()
+    result = CellCache(extractor, cache_dir=temp_dir / "cells").parse(path)
+    assert extractor.calls == 0
+    assert result.metrics == {'accuracy': 0.9, 'loss': 0.5}
+    assert not result.delta.changed
+
+def test_changes_today(temp_dir):
+    """Тест изменений относительно первой версии за день."""
+    path = temp_dir / "nb.ipynb"
+    cache = CellCache(MetricExtractor(), cache_dir=None)
+    yesterday = date.today() - timedelta(days=1)
+    _write(path, ["a = 1", "b = 2"])
+    cache.parse(path, today=yesterday)
+
+    _write(path, ["a = 1", "b = 3"])
+    cache.parse(path)
+    _write(path, ["a = 1", "b = 3", "c = 4"])
+    result = cache.parse(path)
+    assert [c.source for c in result.delta.added] == ["c = 4"]
+    assert [c.source for c in result.today.added] == ["b = 3", "c = 4"]
+    assert [c.source for c in result.today.removed] == ["b = 2"]
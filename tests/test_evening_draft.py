@@ -0,0 +1,75 @@
+"""
+Тесты для заблаговременной подготовки вечернего поста.
+"""
+import os
+import time
+from pathlib import Path
+
+import nbformat
+import pytest
+from src.core.posts.evening_draft import EveningDraft, NO_DATA_SUMMARY
+
+class _Parser:
+    """Парсер, считающий количество разборов."""
+
+    def __init__(self):
+        self.parsed = []
+
+    def read_summary(self, path):
+        self.parsed.append(Path(path).name)
+        notebook = nbformat.read(path, as_version=4)
+        return '\n'.join(''.join(c.source) for c in notebook.cells if c.cell_type == 'markdown')
+
+class _PostManager:
+    """Менеджер постов, собирающий текст без шаблонов."""
+
+    async def generate_evening_post(self, summary, achievements, notebooks=None):
+        return f"{summary}|{achievements}"
+
+def _write_notebook(path: Path, text: str) -> None:
+    notebook = nbformat.v4.new_notebook()
+    notebook.cells.append(nbformat.v4.new_markdown_cell(text))
+    nbformat.write(notebook, str(path))
+
+def _touch_later(path: Path) -> None:
+    mtime = time.time() + 1
+    os.utime(path, (mtime, mtime))
+
+@pytest.mark.asyncio
+async def test_only_changed_notebooks_reparsed(temp_dir):
+    """Тест инкрементального обновления черновика."""
+    _write_notebook(temp_dir / "a.ipynb", "Первый ноутбук")
+    _write_notebook(temp_dir / "b.ipynb", "Второй ноутбук")
+    parser = _Parser()
+    draft = EveningDraft(parser, _PostManager(), temp_dir, achievements="итоги")
+
+    assert await draft.refresh()
+    assert sorted(parser.parsed) == ["a.ipynb", "b.ipynb"]
+    assert "Первый ноутбук" in draft.draft and "Второй ноутбук" in draft.draft
+
+    # Без изменений черновик не перестраивается
+    assert not await draft.refresh()
+
+    _write_notebook(temp_dir / "b.ipynb", "Второй ноутбук, обновленный")
+    _touch_later(temp_dir / "b.ipynb")
+    parser.parsed.clear()
+    post = await draft.get_post()
+    assert parser.parsed == ["b.ipynb"]
+    assert "обновленный" in post
+    assert post.endswith("|итоги")
+
+@pytest.mark.asyncio
+async def test_removed_notebook_dropped(temp_dir):
+    """Тест удаления ноутбука из черновика."""
+    _write_notebook(temp_dir / "a.ipynb", "Ноутбук")
+    draft = EveningDraft(_Parser(), _PostManager(), temp_dir)
+    await draft.refresh()
+    (temp_dir / "a.ipynb").unlink()
+    assert await draft.refresh()
+    assert draft.draft.startswith(NO_DATA_SUMMARY)
+
+@pytest.mark.asyncio
+async def test_missing_directory(temp_dir):
+    """Тест отсутствующего каталога с ноутбуками."""
+    draft = EveningDraft(_Parser(), _PostManager(), temp_dir / "missing")
+    assert (await draft.get_post()).startswith(NO_DATA_SUMMARY)
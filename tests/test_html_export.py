@@ -0,0 +1,85 @@
+"""
+Тесты для кеша HTML-экспорта ноутбуков.
+"""
+import base64
+
+import nbformat
+import pytest
+from src.core.learning.html_export import HtmlExportCache, IMAGES_EXTERNAL, IMAGES_STRIP
+
+PNG = b'\x89PNG\r\n\x1a\n' + bytes(range(256))
+PNG_B64 = base64.b64encode(PNG).decode()
+
+def _notebook(path, text="Первый вариант"):
+    notebook = nbformat.v4.new_notebook()
+    notebook.cells = [
+        nbformat.v4.new_markdown_cell(f"# {text}"),
+        nbformat.v4.new_code_cell("plot()", outputs=[
+            nbformat.v4.new_output('display_data', data={'image/png': PNG_B64, 'text/plain': '<Figure>'})
+        ]),
+    ]
+    nbformat.write(notebook, str(path))
+
+def test_export_is_cached(temp_dir):
+    """Тест кеширования и инвалидации по содержимому."""
+    path = temp_dir / "nb.ipynb"
+    _notebook(path)
+    cache = HtmlExportCache(temp_dir / "html")
+    html = cache.export(path)
+    assert "Первый вариант" in html
+    assert PNG_B64 in html
+    assert len(list((temp_dir / "html").glob("*.html"))) == 1
+
+    cached = next((temp_dir / "html").glob("*.html"))
+    cached.write_text("из кеша", encoding='utf-8')
+    assert cache.export(path) == "из кеша"
+
+    _notebook(path, "Второй вариант")
+    assert "Второй вариант" in cache.export(path)
+    assert len(list((temp_dir / "html").glob("*.html"))) == 2
+
+def test_image_modes(temp_dir):
+    """Тест удаления и выноса картинок."""
+    path = temp_dir / "nb.ipynb"
+    _notebook(path)
+    cache = HtmlExportCache(temp_dir / "html", plot_store_dir=temp_dir / "plots",
+                            image_base_url="https://example.org/plots")
+    stripped = cache.export(path, images=IMAGES_STRIP)
+    assert PNG_B64 not in stripped
+    assert "https://example.org/plots/" not in stripped
+
+    external = cache.export(path, images=IMAGES_EXTERNAL)
+    assert PNG_B64 not in external
+    assert "https://example.org/plots/" in external
+    assert [p.read_bytes() for p in (temp_dir / "plots").rglob("*.png")] == [PNG]
+    assert len(list((temp_dir / "html").glob("*.html"))) == 2
+
+def test_prune(temp_dir):
+    """Тест вытеснения старых файлов кеша."""
+    cache = HtmlExportCache(temp_dir / "html", max_entries=1)
+    for i in range(3):
+        _notebook(temp_dir / f"nb{i}.ipynb", f"Ноутбук {i}")
+        cache.export(temp_dir / f"nb{i}.ipynb")
+    assert len(list((temp_dir / "html").glob("*.html"))) == 1
+
+def test_unknown_image_mode(temp_dir):
+    """Тест неизвестного режима картинок."""
+    with pytest.raises(ValueError):
+        HtmlExportCache(temp_dir, images="base64")
+
+@pytest.mark.asyncio
+async def test_export_many_in_process_pool(temp_dir):
+    """Тест пакетного экспорта в пуле процессов."""
+    paths = []
+    for i in range(3):
+        paths.append(temp_dir / f"nb{i}.ipynb")
+        _notebook(paths[-1], f"Ноутбук {i}")
+    cache = HtmlExportCache(temp_dir / "html", max_workers=2)
+    try:
+        cache.export(paths[0])
+        results = await cache.export_many(paths + [temp_dir / "missing.ipynb"])
+    finally:
+        cache.shutdown()
+    assert sorted(results) == paths
+    for i, path in enumerate(paths):
+        assert f"Ноутбук {i}" in results[path].read_text(encoding='utf-8')
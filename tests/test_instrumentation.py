@@ -0,0 +1,95 @@
+"""
+Тесты для измерения времени работы обработчиков.
+"""
+import time
+from datetime import datetime, timezone, timedelta
+from types import SimpleNamespace
+
+import pytest
+from prometheus_client import REGISTRY
+from telegram.ext import Application, CommandHandler
+
+from src.bot.handlers.instrumentation import instrument_application, instrument_handler
+
+class _Recorder:
+    """Получатель результатов для тестов."""
+
+    def __init__(self):
+        self.records = []
+
+    def record(self, *args):
+        self.records.append(args)
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+def _update(user_id: int = 1, delay: float = 0.0) -> SimpleNamespace:
+    message = SimpleNamespace(
+        date=datetime.now(timezone.utc) - timedelta(seconds=delay),
+        edit_date=None
+    )
+    return SimpleNamespace(
+        effective_user=SimpleNamespace(id=user_id),
+        effective_message=message,
+        callback_query=None
+    )
+
+@pytest.mark.asyncio
+async def test_success_recorded():
+    """Тест записи длительности успешного обработчика."""
+    async def callback(update, context):
+        return "ok"
+
+    recorder = _Recorder()
+    handler = instrument_handler(CommandHandler("timing_ok", callback), recorder)
+    before = _sample("bot_handler_duration_seconds_count", handler="/timing_ok", outcome="success")
+    waits = _sample("bot_handler_queue_wait_seconds_count", handler="/timing_ok")
+
+    assert await handler.callback(_update(user_id=42, delay=3), None) == "ok"
+
+    assert _sample("bot_handler_duration_seconds_count", handler="/timing_ok", outcome="success") == before + 1
+    assert _sample("bot_handler_queue_wait_seconds_count", handler="/timing_ok") == waits + 1
+    assert _sample("bot_handler_queue_wait_seconds_sum", handler="/timing_ok") >= 2
+    command, user_id, duration, success, error = recorder.records[0]
+    assert (command, user_id, success, error) == ("/timing_ok", 42, True, None)
+    assert duration >= 0
+
+@pytest.mark.asyncio
+async def test_error_recorded():
+    """Тест записи результата обработчика с ошибкой."""
+    async def callback(update, context):
+        raise RuntimeError("boom")
+
+    recorder = _Recorder()
+    handler = instrument_handler(CommandHandler("timing_err", callback), recorder)
+    with pytest.raises(RuntimeError):
+        await handler.callback(_update(), None)
+
+    assert _sample("bot_handler_duration_seconds_count", handler="/timing_err", outcome="error") == 1
+    assert recorder.records[0][3:] == (False, "boom")
+
+def test_instrument_application_idempotent():
+    """Тест однократного оборачивания обработчиков."""
+    async def callback(update, context):
+        pass
+
+    application = Application.builder().token("123:TEST").build()
+    application.add_handler(CommandHandler("a", callback))
+    application.add_handler(CommandHandler("b", callback), group=1)
+
+    assert instrument_application(application) == 2
+    assert instrument_application(application) == 0
+
+@pytest.mark.asyncio
+async def test_overhead_is_small():
+    """Тест накладных расходов обертки."""
+    async def callback(update, context):
+        pass
+
+    handler = instrument_handler(CommandHandler("timing_fast", callback))
+    update = _update()
+    iterations = 2000
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await handler.callback(update, None)
+    assert (time.perf_counter() - start) / iterations < 0.001
@@ -1,9 +1,11 @@
 """
 Тесты для модуля логирования.
 """
+import json
 import pytest
 import logging
-from src.utils.logger import logger
+from logging.handlers import QueueHandler
+from src.utils.logger import logger, setup_logger, load_settings, JsonFormatter
 
 def test_logger_instance():
     """Тест проверки экземпляра логгера."""
@@ -27,4 +29,30 @@ def test_logger_warning_output(caplog):
     """Тест вывода WARNING сообщения."""
     with caplog.at_level(logging.WARNING):
         logger.warning("Test warning message")
-        assert "Test warning message" in caplog.text 
\ No newline at end of file
+        assert "Test warning message" in caplog.text 
+def test_single_queue_pipeline():
+    """Тест общего конвейера логирования без хендлеров на именованных логгерах."""
+    named = setup_logger("tests.pipeline")
+    assert not named.handlers
+    queue_handlers = [h for h in logging.getLogger().handlers if isinstance(h, QueueHandler)]
+    assert len(queue_handlers) == 1
+
+def test_rotation_settings(temp_dir):
+    """Тест настроек ротации из data/settings.json."""
+    settings_path = temp_dir / "settings.json"
+    settings_path.write_text(json.dumps({"logging": {"max_size": 1024, "backup_count": 2}}), encoding="utf-8")
+    settings = load_settings(settings_path)
+    assert settings["max_size"] == 1024
+    assert settings["backup_count"] == 2
+    assert settings["level"] == "INFO"
+
+def test_json_formatter():
+    """Тест структурированного вывода в JSON."""
+    record = logging.makeLogRecord({
+        "name": "test", "msg": "Команда %s", "args": ("/start",),
+        "levelname": "INFO", "levelno": logging.INFO, "user_id": 42
+    })
+    data = json.loads(JsonFormatter().format(record))
+    assert data["message"] == "Команда /start"
+    assert data["level"] == "INFO"
+    assert data["extra"] == {"user_id": 42}
@@ -0,0 +1,54 @@
+"""
+Тесты для мониторинга цикла событий.
+"""
+import asyncio
+import time
+
+import pytest
+from src.utils.loop_monitor import LoopMonitor
+
+def _blocking_parse() -> None:
+    """Блокирующая функция, которую должен обнаружить сторож."""
+    time.sleep(0.6)
+
+@pytest.mark.asyncio
+async def test_stall_detected_with_stack():
+    """Тест обнаружения блокировки и снятия стека."""
+    monitor = LoopMonitor(interval=0.05, threshold=0.2)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.1)
+        _blocking_parse()
+        await asyncio.sleep(0.2)
+    finally:
+        await monitor.stop()
+
+    assert len(monitor.stalls) == 1
+    stall = monitor.stalls[0]
+    assert stall.duration >= 0.2
+    assert any("_blocking_parse" in line for line in stall.stack)
+
+@pytest.mark.asyncio
+async def test_no_stall_on_idle_loop():
+    """Тест отсутствия ложных срабатываний."""
+    monitor = LoopMonitor(interval=0.05, threshold=0.3)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.4)
+    finally:
+        await monitor.stop()
+    assert not monitor.stalls
+    assert not monitor.running
+
+@pytest.mark.asyncio
+async def test_debug_mode():
+    """Тест включения режима отладки asyncio."""
+    monitor = LoopMonitor(threshold=0.25, debug=True)
+    monitor.start()
+    loop = asyncio.get_running_loop()
+    try:
+        assert loop.get_debug()
+        assert loop.slow_callback_duration == 0.25
+    finally:
+        await monitor.stop()
+        loop.set_debug(False)
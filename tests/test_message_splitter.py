@@ -0,0 +1,93 @@
+"""
+Тесты для разбиения длинных сообщений и постраничного вывода.
+"""
+import re
+
+import pytest
+from src.utils.message_splitter import split_message
+from src.ui.messages.message_pager import MessagePager
+
+def _visible(text: str) -> str:
+    """Текст без разметки и пробельных символов."""
+    return re.sub(r'\s+', '', re.sub(r'<[^<>]*>', '', text))
+
+def _assert_balanced(part: str) -> None:
+    """Проверка сбалансированности HTML-тегов в части."""
+    stack = []
+    for tag in re.findall(r'<[^<>]*>', part):
+        name = re.match(r'</?(\w+)', tag).group(1)
+        if tag.startswith('</'):
+            assert stack and stack[-1] == name
+            stack.pop()
+        else:
+            stack.append(name)
+    assert not stack
+
+def test_short_message_not_split():
+    """Тест короткого сообщения."""
+    assert list(split_message("Короткий текст")) == ["Короткий текст"]
+
+def test_split_on_paragraphs():
+    """Тест разбиения по границам абзацев."""
+    text = "Первый абзац.\n\nВторой абзац подлиннее. Еще предложение."
+    assert list(split_message(text, max_length=30)) == [
+        "Первый абзац.",
+        "Второй абзац подлиннее.",
+        "Еще предложение.",
+    ]
+
+def test_no_content_lost_on_large_text():
+    """Тест отсутствия потерь на большом тексте."""
+    text = "\n\n".join(f"📊 notebook_{i}:\n" + "Предложение с метрикой. " * 50 for i in range(100))
+    parts = list(split_message(text))
+    assert len(parts) > 1
+    assert all(len(part) <= 4096 for part in parts)
+    assert _visible("".join(parts)) == _visible(text)
+
+def test_streaming_input():
+    """Тест потокового входа из итератора фрагментов."""
+    chunks = (f"Строка номер {i}.\n" for i in range(5000))
+    parts = list(split_message(chunks, max_length=1000))
+    assert all(len(part) <= 1000 for part in parts)
+    assert _visible("".join(parts)) == _visible("".join(f"Строка номер {i}.\n" for i in range(5000)))
+
+def test_html_tags_balanced_across_parts():
+    """Тест балансировки HTML-тегов между частями."""
+    text = '<b>' + 'жирное слово ' * 100 + '</b> ' + '<i>курсив <a href="https://kaggle.com">ссылка</a></i> ' * 20
+    parts = list(split_message(text, max_length=200, html=True))
+    assert len(parts) > 1
+    for part in parts:
+        assert len(part) <= 200
+        _assert_balanced(part)
+    assert parts[1].startswith('<b>')
+    assert _visible("".join(parts)) == _visible(text)
+
+def test_html_entities_not_broken():
+    """Тест сохранения HTML-сущностей целиком."""
+    text = "a&amp;b " * 200
+    for part in split_message(text, max_length=50, html=True):
+        assert re.sub(r'&amp;', '', part).count('&') == 0
+
+def test_invalid_max_length():
+    """Тест некорректной максимальной длины."""
+    with pytest.raises(ValueError):
+        list(split_message("text", max_length=0))
+
+def test_pager_lazy_pages():
+    """Тест ленивой выдачи страниц пагинатором."""
+    pager = MessagePager(page_length=100)
+    key = pager.create("Предложение номер один. " * 100)
+    page, has_next, total = pager.get_page(key, 0)
+    assert len(page) <= 100
+    assert has_next
+    assert total is None
+    assert pager.get_page(key, 1000) is None
+    assert pager.get_page("unknown", 0) is None
+
+def test_pager_eviction():
+    """Тест вытеснения старых сообщений из кеша."""
+    pager = MessagePager(max_entries=2, page_length=100)
+    first = pager.create("a " * 200)
+    pager.create("b " * 200)
+    pager.create("c " * 200)
+    assert pager.get_page(first, 0) is None
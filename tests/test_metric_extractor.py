@@ -0,0 +1,69 @@
+"""
+Тесты для извлечения метрик из ноутбуков.
+"""
+import nbformat
+from src.core.learning.metric_extractor import (
+    MetricExtractor, SOURCE_AST, SOURCE_CODE, SOURCE_OUTPUT
+)
+
+def _cells():
+    return [
+        nbformat.v4.new_markdown_cell("accuracy = 0.5 в markdown не считается"),
+        nbformat.v4.new_code_cell("model.fit(X, y)\naccuracy = 0.95\nloss=0.1"),
+        nbformat.v4.new_code_cell(
+            "evaluate(model)",
+            outputs=[
+                nbformat.v4.new_output('stream', name='stdout', text="Epoch 3 - val_loss: 0.08 - ROC_AUC: 0.91\n"),
+                nbformat.v4.new_output('execute_result', data={'text/plain': "{'rmse': 1.5e-2}"}),
+            ]
+        ),
+    ]
+
+def test_sources_and_outputs():
+    """Тест поиска метрик в коде и выводах с указанием источника."""
+    hits = MetricExtractor().extract(_cells())
+    assert [(h.name, h.value, h.cell, h.source, h.line) for h in hits] == [
+        ('accuracy', 0.95, 1, SOURCE_CODE, 2),
+        ('loss', 0.1, 1, SOURCE_CODE, 3),
+        ('loss', 0.08, 2, SOURCE_OUTPUT, 1),
+        ('auc', 0.91, 2, SOURCE_OUTPUT, 1),
+        ('rmse', 0.015, 2, SOURCE_OUTPUT, 1),
+    ]
+    # Последнее значение побеждает
+    assert MetricExtractor().extract_dict(_cells()) == {
+        'accuracy': 0.95, 'loss': 0.08, 'auc': 0.91, 'rmse': 0.015
+    }
+
+def test_custom_registry():
+    """Тест настраиваемого реестра метрик."""
+    extractor = MetricExtractor({'map': ('map', 'mean_ap')})
+    cells = [nbformat.v4.new_code_cell("mean_ap = 0.7\naccuracy = 0.9")]
+    assert extractor.extract_dict(cells) == {'map': 0.7}
+    extractor.register('ndcg')
+    cells.append(nbformat.v4.new_code_cell("ndcg: 0.4"))
+    assert extractor.extract_dict(cells) == {'map': 0.7, 'ndcg': 0.4}
+    assert extractor.metrics == ['map', 'ndcg']
+
+def test_ast_pass():
+    """Тест разбора кода через AST."""
+    source = (
+        "# accuracy = 0.1 в комментарии\n"
+        "print('f1 = 0.2')\n"
+        "test_f1 = -0.5\n"
+        "mlflow.log_metric('logloss', 0.3)\n"
+        "accuracy = compute()\n"
+    )
+    extractor = MetricExtractor(use_ast=True)
+    hits = extractor.extract([nbformat.v4.new_code_cell(source)])
+    assert [(h.name, h.value, h.source, h.line) for h in hits] == [
+        ('f1', -0.5, SOURCE_AST, 3),
+        ('logloss', 0.3, SOURCE_AST, 4),
+    ]
+    # Синтаксис IPython разбирается регулярным выражением
+    hits = extractor.extract([nbformat.v4.new_code_cell("%time fit()\nauc = 0.8")])
+    assert [(h.name, h.source) for h in hits] == [('auc', SOURCE_CODE)]
+
+def test_no_partial_names():
+    """Тест отсутствия ложных совпадений внутри других имен."""
+    cells = [nbformat.v4.new_code_cell("model.acc = 0.1\nbalanced_accuracy_threshold = 3\nlossy = 1")]
+    assert MetricExtractor().extract(cells) == []
@@ -0,0 +1,122 @@
+"""
+Тесты для индекса ноутбуков.
+"""
+import os
+import time
+from datetime import date, datetime, timedelta
+
+from src.core.learning import notebook_index as notebook_index_module
+from src.core.learning.notebook_index import NotebookIndex
+
+def _write(path, content="{}", mtime=None):
+    path.write_text(content)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+def test_latest_and_today(temp_dir):
+    """Тест поиска последнего ноутбука и ноутбуков за сегодня."""
+    now = time.time()
+    yesterday = now - 86400
+    _write(temp_dir / "old.ipynb", mtime=yesterday)
+    _write(temp_dir / "a.ipynb", mtime=now - 10)
+    _write(temp_dir / "b.ipynb", mtime=now)
+    _write(temp_dir / "notes.txt", mtime=now + 10)
+
+    index = NotebookIndex(temp_dir, snapshot_path=None)
+    assert index.reconcile() == 3
+    assert index.latest() == temp_dir / "b.ipynb"
+    assert sorted(p.name for p in index.today()) == ["a.ipynb", "b.ipynb"]
+    yesterday_day = datetime.fromtimestamp(yesterday).date()
+    assert list(index.for_day(yesterday_day)) == [temp_dir / "old.ipynb"]
+    assert index.reconcile() == 0
+
+def test_update_and_remove(temp_dir):
+    """Тест обновления индекса по событиям файловой системы."""
+    now = time.time()
+    _write(temp_dir / "a.ipynb", mtime=now - 10)
+    _write(temp_dir / "b.ipynb", mtime=now)
+    index = NotebookIndex(temp_dir, snapshot_path=None)
+    index.reconcile()
+
+    _write(temp_dir / "a.ipynb", '{"cells": []}', mtime=now + 10)
+    index.update(temp_dir / "a.ipynb")
+    assert index.latest() == temp_dir / "a.ipynb"
+
+    (temp_dir / "a.ipynb").unlink()
+    index.remove(temp_dir / "a.ipynb")
+    assert index.latest() == temp_dir / "b.ipynb"
+
+    # Файлы вне каталога и не-ноутбуки игнорируются
+    index.update(temp_dir / "notes.txt")
+    assert len(index) == 1
+
+    (temp_dir / "b.ipynb").unlink()
+    index.update(temp_dir / "b.ipynb")
+    assert index.latest() is None
+    assert index.today() == []
+
+def test_snapshot_roundtrip(temp_dir):
+    """Тест сохранения и загрузки снимка индекса."""
+    notebooks = temp_dir / "notebooks"
+    notebooks.mkdir()
+    _write(notebooks / "a.ipynb")
+    snapshot = temp_dir / "cache" / "index.json"
+
+    index = NotebookIndex(notebooks, snapshot_path=snapshot)
+    index.reconcile()
+    index.save_snapshot()
+    assert snapshot.exists()
+
+    restored = NotebookIndex(notebooks, snapshot_path=snapshot)
+    assert restored.load_snapshot()
+    assert restored.latest() == notebooks / "a.ipynb"
+
+    # Снимок другого каталога не используется
+    other = NotebookIndex(temp_dir, snapshot_path=snapshot)
+    assert not other.load_snapshot()
+
+def test_reconcile_fixes_missed_events(temp_dir):
+    """Тест сверки индекса после изменений в обход отслеживания."""
+    snapshot = temp_dir / "index.json"
+    notebooks = temp_dir / "notebooks"
+    notebooks.mkdir()
+    _write(notebooks / "a.ipynb")
+    index = NotebookIndex(notebooks, snapshot_path=snapshot)
+    index.reconcile()
+    index.save_snapshot()
+
+    (notebooks / "a.ipynb").unlink()
+    _write(notebooks / "b.ipynb")
+    restored = NotebookIndex(notebooks, snapshot_path=snapshot)
+    restored.load_snapshot()
+    assert restored.latest() == notebooks / "a.ipynb"
+    assert restored.reconcile() == 2
+    assert restored.latest() == notebooks / "b.ipynb"
+
+def test_polling_without_watchdog(temp_dir, monkeypatch):
+    """Тест периодической сверки без watchdog."""
+    monkeypatch.setattr(notebook_index_module, "Observer", None)
+    index = NotebookIndex(temp_dir, snapshot_path=None, reconcile_interval=600, poll_interval=0.05)
+    assert not index.use_watchdog
+    assert index.reconcile_interval == 0.05
+
+    index.start()
+    try:
+        _write(temp_dir / "a.ipynb")
+        deadline = time.time() + 2
+        while index.latest() is None and time.time() < deadline:
+            time.sleep(0.02)
+        assert index.latest() == temp_dir / "a.ipynb"
+    finally:
+        index.stop()
+
+def test_for_day_returns_copy(temp_dir):
+    """Тест независимости результата от последующих изменений индекса."""
+    _write(temp_dir / "a.ipynb")
+    index = NotebookIndex(temp_dir, snapshot_path=None)
+    index.reconcile()
+    today = index.for_day(date.today())
+    _write(temp_dir / "b.ipynb")
+    index.update(temp_dir / "b.ipynb")
+    assert len(today) == 1
+    assert index.for_day(date.today() + timedelta(days=1)) == {}
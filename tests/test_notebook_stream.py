@@ -0,0 +1,92 @@
+"""
+Тесты для потокового чтения ноутбуков.
+"""
+import base64
+import json
+
+import nbformat
+import pytest
+from src.core.learning.notebook_stream import LazyOutput, NotebookStream, NotebookStreamError
+
+PNG = base64.b64encode(bytes(range(256)) * 64).decode()
+
+def _notebook(path):
+    notebook = nbformat.v4.new_notebook()
+    notebook.metadata['name'] = "Тестовый ноутбук"
+    notebook.cells = [
+        nbformat.v4.new_markdown_cell('# Заголовок\nТекст с "кавычками" и \\ слешем'),
+        nbformat.v4.new_code_cell(
+            "accuracy = 0.95\nprint('готово')",
+            outputs=[
+                nbformat.v4.new_output('stream', name='stdout', text='готово\n'),
+                nbformat.v4.new_output(
+                    'display_data',
+                    data={'image/png': PNG, 'text/plain': '<Figure>'}
+                ),
+            ]
+        ),
+        nbformat.v4.new_markdown_cell(['Список ', 'строк']),
+    ]
+    nbformat.write(notebook, str(path))
+    return notebook
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_cells_match_nbformat(temp_dir, chunk_size):
+    """Тест совпадения ячеек с nbformat при любом размере блока."""
+    path = temp_dir / "nb.ipynb"
+    _notebook(path)
+    with open(path, encoding='utf-8') as f:
+        expected = json.load(f)['cells']
+
+    cells = list(NotebookStream(path, chunk_size=chunk_size).cells())
+    assert [c['cell_type'] for c in cells] == ["markdown", "code", "markdown"]
+    for cell, raw in zip(cells, expected):
+        assert cell['source'] == raw['source']
+        assert cell['metadata'] == raw['metadata']
+        assert 'outputs' not in cell
+
+def test_cell_type_filter(temp_dir):
+    """Тест выборки ячеек одного типа."""
+    path = temp_dir / "nb.ipynb"
+    _notebook(path)
+    markdown = list(NotebookStream(path).cells(cell_types={'markdown'}))
+    assert len(markdown) == 2
+    assert ''.join(markdown[1]['source']) == "Список строк"
+    code = list(NotebookStream(path).cells(cell_types={'code'}))
+    assert [c['execution_count'] for c in code] == [None]
+
+def test_lazy_outputs(temp_dir):
+    """Тест ленивого доступа к тяжелым выводам."""
+    path = temp_dir / "nb.ipynb"
+    _notebook(path)
+    cell = next(NotebookStream(path, chunk_size=64).cells(cell_types={'code'}, outputs=True))
+    stream, display = cell['outputs']
+    assert ''.join(stream['text']) == "готово\n"
+    assert ''.join(display['data']['text/plain']) == '<Figure>'
+    image = display['data']['image/png']
+    assert isinstance(image, LazyOutput)
+    assert image.load() == PNG
+    assert image.decode_base64() == bytes(range(256)) * 64
+
+def test_metadata(temp_dir):
+    """Тест чтения метаданных ноутбука."""
+    path = temp_dir / "nb.ipynb"
+    _notebook(path)
+    assert NotebookStream(path, chunk_size=16).metadata()['name'] == "Тестовый ноутбук"
+
+def test_malformed_notebook(temp_dir):
+    """Тест обрезанного файла."""
+    path = temp_dir / "broken.ipynb"
+    path.write_text('{"cells": [{"cell_type": "markdown", "source": "текст')
+    with pytest.raises(NotebookStreamError):
+        list(NotebookStream(path).cells())
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5])
+def test_escapes_on_chunk_boundaries(temp_dir, chunk_size):
+    """Тест экранированных символов на границах блоков."""
+    path = temp_dir / "escapes.ipynb"
+    source = 'a\\\\"b\\\\\\\\\\"c\\\\'
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'cells': [{'cell_type': 'markdown', 'source': source, 'skip': [source, {'x': source}]}]}, f)
+    cells = list(NotebookStream(path, chunk_size=chunk_size).cells())
+    assert cells == [{'cell_type': 'markdown', 'source': source}]
@@ -0,0 +1,77 @@
+"""
+Тесты для пакетной записи метрик ноутбуков в MLflow.
+"""
+import nbformat
+import pytest
+from src.core.learning.notebook_parser import NotebookParser
+from src.core.learning.notebook_tracker import NotebookTracker, metric_key
+
+class _FakeMLflow:
+    """Менеджер MLflow, запоминающий вызовы."""
+
+    def __init__(self):
+        self.runs = []
+
+    def start_run(self, run_name=None):
+        self.runs.append({'name': run_name, 'metrics': {}, 'params': {}, 'ended': False})
+
+    def log_metrics(self, metrics):
+        self.runs[-1]['metrics'].update(metrics)
+
+    def log_parameters(self, params):
+        self.runs[-1]['params'].update(params)
+
+    def end_run(self):
+        self.runs[-1]['ended'] = True
+
+@pytest.mark.asyncio
+async def test_batch_logged_in_one_run():
+    """Тест записи нескольких ноутбуков одним запуском."""
+    mlflow = _FakeMLflow()
+    tracker = NotebookTracker(mlflow)
+    tracker.track("day1", {'accuracy': 0.9, 'note': 'text'})
+    tracker.track("day2", {'loss': 0.5}, {'cell_count': 3})
+    tracker.track("day1", {'accuracy': 0.95})
+
+    assert await tracker.flush() == 2
+    assert await tracker.flush() == 0
+    assert len(mlflow.runs) == 1
+    run = mlflow.runs[0]
+    assert run['ended']
+    assert run['metrics'] == {
+        'day2/cell_count': 3.0,
+        'day2/loss': 0.5,
+        'day1/accuracy': 0.95,
+    }
+    assert run['params']['notebook_count'] == 2
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending():
+    """Тест записи оставшихся метрик при остановке."""
+    mlflow = _FakeMLflow()
+    tracker = NotebookTracker(mlflow, flush_interval=3600)
+    tracker.start()
+    tracker.track("day1", {'f1': 0.7})
+    await tracker.stop()
+    assert mlflow.runs[0]['metrics'] == {'day1/f1': 0.7}
+
+def test_metric_key():
+    """Тест очистки имени метрики."""
+    assert metric_key("day 1 (копия)", "val_loss") == "day 1 _копия_/val_loss"
+
+def test_parse_notebook_has_no_side_effects(temp_dir):
+    """Тест разбора ноутбука без обращения к MLflow."""
+    notebook = nbformat.v4.new_notebook()
+    notebook.cells = [
+        nbformat.v4.new_markdown_cell("# Эксперимент"),
+        nbformat.v4.new_code_cell("accuracy = 0.9"),
+    ]
+    path = temp_dir / "nb.ipynb"
+    nbformat.write(notebook, str(path))
+
+    parser = NotebookParser(str(temp_dir))
+    assert not hasattr(parser, 'mlflow_manager')
+    result = parser.parse_notebook(str(path))
+    assert result['metrics'] == {'accuracy': 0.9}
+    assert result['stats'] == {'cell_count': 2, 'code_cell_count': 1, 'markdown_cell_count': 1}
+    assert parser.parse_notebook(nbformat.reads(path.read_text(encoding='utf-8'), as_version=4))['metrics'] == result['metrics']
@@ -0,0 +1,64 @@
+"""
+Тесты для хранилища графиков.
+"""
+import base64
+from types import SimpleNamespace
+
+import nbformat
+import pytest
+from src.core.learning.notebook_stream import NotebookStream
+from src.core.learning.plot_store import PlotStore
+
+PNG = b'\x89PNG\r\n\x1a\n' + bytes(range(256)) * 4
+
+class _Bot:
+    """Бот, запоминающий отправленные фотографии."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_photo(self, chat_id, photo, caption=None):
+        uploaded = not isinstance(photo, str)
+        self.sent.append(photo.read() if uploaded else photo)
+        return SimpleNamespace(photo=[SimpleNamespace(file_id="small"), SimpleNamespace(file_id="large")])
+
+def test_put_deduplicates(temp_dir):
+    """Тест дедупликации одинаковых графиков."""
+    store = PlotStore(temp_dir / "plots")
+    encoded = base64.b64encode(PNG).decode()
+    first = store.put_output(encoded)
+    lines = store.put_output([encoded[:76] + "\n", encoded[76:]])
+    second = store.put(PNG[:100])
+    assert first == lines == store.put(PNG)
+    assert first.digest != second.digest
+    assert first.path.read_bytes() == PNG
+    assert first.path.suffix == ".png"
+    assert len(list((temp_dir / "plots").rglob("*.png"))) == 2
+    assert store.get(first.digest) == first
+    assert store.get("0" * 64) is None
+
+def test_put_lazy_output(temp_dir):
+    """Тест сохранения графика из потокового чтения ноутбука."""
+    notebook = nbformat.v4.new_notebook()
+    notebook.cells.append(nbformat.v4.new_code_cell("plot()", outputs=[
+        nbformat.v4.new_output('display_data', data={'image/png': base64.b64encode(PNG).decode()})
+    ]))
+    path = temp_dir / "nb.ipynb"
+    nbformat.write(notebook, str(path))
+
+    cell = next(NotebookStream(path).cells(outputs=True, mime_types=()))
+    plot = PlotStore(temp_dir / "plots").put_output(cell['outputs'][0]['data']['image/png'])
+    assert plot.read_bytes() == PNG
+
+@pytest.mark.asyncio
+async def test_send_reuses_file_id(temp_dir):
+    """Тест повторной отправки графика по file_id."""
+    store = PlotStore(temp_dir / "plots")
+    plot = store.put(PNG)
+    bot = _Bot()
+    await store.send(bot, 1, plot)
+    await store.send(bot, 1, plot)
+    assert bot.sent == [PNG, "large"]
+
+    # file_id переживает перезапуск
+    assert PlotStore(temp_dir / "plots").get_file_id(plot.digest) == "large"
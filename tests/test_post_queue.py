@@ -0,0 +1,116 @@
+"""
+Тесты для персистентной очереди постов.
+"""
+import asyncio
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from src.core.posts.post_queue import PostQueue, STATUS_EXPIRED, STATUS_PENDING
+from src.utils.database.db_manager import DatabaseManager
+
+@pytest_asyncio.fixture
+async def db_path():
+    """Фикстура пути к временной базе данных."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
+        path = tmp.name
+    yield path
+    os.unlink(path)
+
+async def _queue(db_path: str, sender=None, **kwargs) -> PostQueue:
+    queue = PostQueue(DatabaseManager(db_path), sender=sender, default_chat_id="@channel", **kwargs)
+    await queue.initialize()
+    return queue
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+@pytest.mark.asyncio
+async def test_schedule_and_dedup(db_path):
+    """Тест постановки поста и ключа уникальности."""
+    queue = await _queue(db_path)
+    due = _now() + timedelta(hours=1)
+    assert await queue.schedule("Пост", due, dedup_key="morning:2024-01-01") is not None
+    assert await queue.schedule("Пост", due, dedup_key="morning:2024-01-01") is None
+    pending = await queue.get_pending()
+    assert len(pending) == 1
+    assert pending[0]['chat_id'] == "@channel"
+    assert await queue.claim_due() is None
+    await queue.db_manager.close()
+
+@pytest.mark.asyncio
+async def test_claim_is_exclusive_between_processes(db_path):
+    """Тест атомарного захвата постов несколькими процессами."""
+    queues = [await _queue(db_path, worker_id=f"worker-{i}") for i in range(3)]
+    for i in range(10):
+        await queues[0].schedule(f"Пост {i}", _now() - timedelta(seconds=i))
+
+    async def drain(queue):
+        claimed = []
+        while (post := await queue.claim_due()) is not None:
+            claimed.append(post['id'])
+            await asyncio.sleep(0)
+        return claimed
+
+    results = await asyncio.gather(*(drain(queue) for queue in queues))
+    claimed = [post_id for result in results for post_id in result]
+    assert sorted(claimed) == sorted(set(claimed))
+    assert len(claimed) == 10
+    for queue in queues:
+        await queue.db_manager.close()
+
+@pytest.mark.asyncio
+async def test_catch_up_expires_old_posts(db_path):
+    """Тест обработки пропущенных постов при запуске."""
+    queue = await _queue(db_path, catchup_window=timedelta(hours=1))
+    old_id = await queue.schedule("Вчерашний пост", _now() - timedelta(days=1))
+    late_id = await queue.schedule("Опоздавший пост", _now() - timedelta(minutes=10))
+
+    assert await queue.catch_up() == 1
+    async with queue.db_manager.get_connection() as conn:
+        async with conn.execute("SELECT id, status FROM scheduled_posts") as cursor:
+            statuses = {row['id']: row['status'] for row in await cursor.fetchall()}
+    assert statuses == {old_id: STATUS_EXPIRED, late_id: STATUS_PENDING}
+    await queue.db_manager.close()
+
+@pytest.mark.asyncio
+async def test_run_sends_due_and_sleeps_until_next(db_path):
+    """Тест цикла публикации без опроса базы."""
+    sent = []
+
+    async def sender(post):
+        sent.append(post['text'])
+
+    queue = await _queue(db_path, sender=sender, max_sleep=7200)
+    await queue.schedule("Сейчас", _now())
+    await queue.schedule("Через час", _now() + timedelta(hours=1))
+    queue.start()
+    await asyncio.sleep(0.2)
+    assert sent == ["Сейчас"]
+    assert 3500 < await queue.seconds_until_next() <= 3600
+
+    # Новый пост будит планировщик, не дожидаясь окончания сна
+    await queue.schedule("Срочно", _now())
+    await asyncio.sleep(0.2)
+    await queue.stop()
+    assert sent == ["Сейчас", "Срочно"]
+    await queue.db_manager.close()
+
+@pytest.mark.asyncio
+async def test_failed_post_is_retried(db_path):
+    """Тест повторной попытки публикации после ошибки."""
+    async def sender(post):
+        raise RuntimeError("Telegram недоступен")
+
+    queue = await _queue(db_path, sender=sender, max_attempts=2, retry_delay=timedelta(0))
+    post_id = await queue.schedule("Пост", _now())
+    await queue.process_due()
+    async with queue.db_manager.get_connection() as conn:
+        async with conn.execute("SELECT status, attempts, error FROM scheduled_posts WHERE id = ?", (post_id,)) as cursor:
+            row = await cursor.fetchone()
+    assert row['status'] == "failed"
+    assert row['attempts'] == 2
+    assert "недоступен" in row['error']
+    await queue.db_manager.close()
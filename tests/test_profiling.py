@@ -0,0 +1,88 @@
+"""
+Тесты для выборочного профилирования обработчиков.
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from telegram.ext import CommandHandler
+
+from src.bot.handlers.admin_handlers import AdminHandlers
+from src.bot.handlers.instrumentation import instrument_handler
+from src.utils.profiling import SamplingProfiler
+
+def _busy_handler_work() -> None:
+    """CPU-нагрузка, которая должна попасть в профиль."""
+    end = time.perf_counter() + 0.15
+    while time.perf_counter() < end:
+        pass
+
+async def _other_task_work() -> None:
+    """Работа другой задачи, которая не должна попасть в профиль."""
+    for _ in range(5):
+        end = time.perf_counter() + 0.02
+        while time.perf_counter() < end:
+            pass
+        await asyncio.sleep(0)
+
+@pytest.mark.asyncio
+async def test_named_command_profiled(temp_dir, monkeypatch):
+    """Тест профилирования всех вызовов указанной команды."""
+    profiler = SamplingProfiler(output_dir=temp_dir, interval=0.002)
+    monkeypatch.setattr("src.bot.handlers.instrumentation.get_profiler", lambda: profiler)
+    profiler.configure(commands=["heavy"])
+
+    async def callback(update, context):
+        await asyncio.sleep(0)
+        _busy_handler_work()
+
+    handler = instrument_handler(CommandHandler("heavy", callback))
+    other = asyncio.create_task(_other_task_work())
+    await handler.callback(SimpleNamespace(), None)
+    await other
+
+    path = profiler.disable()
+    assert path is not None and path.parent == temp_dir
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert stack.startswith("/heavy;")
+        assert "_other_task_work" not in stack
+        assert int(count) > 0
+    assert any("_busy_handler_work" in line for line in lines)
+
+def test_sample_rate():
+    """Тест выбора доли вызовов."""
+    profiler = SamplingProfiler()
+    assert not profiler.enabled
+    assert not profiler.should_sample("/stats")
+    profiler.configure(sample_rate=1.0)
+    assert profiler.enabled and profiler.should_sample("/stats")
+    with pytest.raises(ValueError):
+        profiler.configure(sample_rate=2.0)
+
+def test_rotation(temp_dir):
+    """Тест удаления старых файлов профилей."""
+    profiler = SamplingProfiler(output_dir=temp_dir, max_files=2)
+    for i in range(4):
+        profiler._stacks[f"/x;f{i}"] += 1
+        profiler.flush()
+    assert len(list(temp_dir.glob("profile-*.collapsed"))) == 2
+
+@pytest.mark.asyncio
+async def test_profile_command_admin_only():
+    """Тест ограничения команды /profile администраторами."""
+    profiler = SamplingProfiler()
+    handlers = AdminHandlers(admin_ids=[1], profiler=profiler)
+    context = SimpleNamespace(args=["on", "0.5"])
+
+    update = SimpleNamespace(effective_user=SimpleNamespace(id=2), message=SimpleNamespace(reply_text=AsyncMock()))
+    await handlers.profile(update, context)
+    assert profiler.sample_rate == 0.0
+
+    update.effective_user.id = 1
+    await handlers.profile(update, context)
+    assert profiler.sample_rate == 0.5
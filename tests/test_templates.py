@@ -0,0 +1,65 @@
+"""
+Тесты для движка шаблонов.
+"""
+import os
+import time
+from pathlib import Path
+
+import pytest
+from src.utils.templates import TemplateEngine
+
+@pytest.fixture
+def engine() -> TemplateEngine:
+    """Фикстура движка со штатными шаблонами."""
+    return TemplateEngine(cache_dir=None)
+
+def test_precompile_all_templates(engine: TemplateEngine):
+    """Тест предварительной компиляции шаблонов."""
+    assert engine.precompile() >= 8
+
+def test_vote_list_loop(engine: TemplateEngine):
+    """Тест списка тем для голосования."""
+    topics = [
+        {'title': 'Первая', 'votes': 5},
+        {'title': 'Вторая', 'votes': 2, 'user_vote': 'up'}
+    ]
+    message = engine.render('messages/vote.txt', topics=topics)
+    assert message == (
+        "Темы для голосования:\n"
+        "Первая\nГолосов: 5\nВаш голос: Нет\n\n"
+        "Вторая\nГолосов: 2\nВаш голос: up"
+    )
+
+def test_vote_list_empty(engine: TemplateEngine):
+    """Тест пустого списка тем."""
+    assert engine.render('messages/vote.txt', topics=[]) == "Нет доступных тем для голосования."
+
+def test_html_escaping_in_posts(engine: TemplateEngine):
+    """Тест HTML-экранирования в постах."""
+    post = engine.render('posts/evening.html', summary="a < b & c", achievements="<b>")
+    assert "a &lt; b &amp; c" in post
+    assert "&lt;b&gt;" in post
+
+def test_no_escaping_in_text_messages(engine: TemplateEngine):
+    """Тест отсутствия экранирования в текстовых сообщениях."""
+    message = engine.render('messages/welcome.txt', username="<Tom & Jerry>")
+    assert "<Tom & Jerry>" in message
+
+def test_hot_reload(temp_dir: Path):
+    """Тест горячей перезагрузки измененного шаблона."""
+    template_path = temp_dir / "hello.txt"
+    template_path.write_text("Привет, {{ name }}!", encoding="utf-8")
+    engine = TemplateEngine(templates_dir=temp_dir, cache_dir=None, reload_interval=0)
+    assert engine.render("hello.txt", name="мир") == "Привет, мир!"
+
+    template_path.write_text("Пока, {{ name }}!", encoding="utf-8")
+    # Сдвигаем mtime, чтобы изменение было заметно при грубом разрешении ФС
+    mtime = time.time() + 5
+    os.utime(template_path, (mtime, mtime))
+    assert engine.render("hello.txt", name="мир") == "Пока, мир!"
+
+def test_bytecode_cache(temp_dir: Path):
+    """Тест сохранения байткода скомпилированных шаблонов."""
+    cache_dir = temp_dir / "cache"
+    TemplateEngine(cache_dir=cache_dir)
+    assert any(cache_dir.iterdir())